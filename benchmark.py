@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Rock Paper Scissors Arena - Headless Rendering Benchmark
+
+Drives every scene through scripted player states on the SDL dummy video
+driver, renders a fixed number of frames per scenario and reports frame
+time percentiles and draw-call counts as JSON.
+
+Usage:
+    python benchmark.py [--frames N] [--dirty] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from config.settings import COUNTDOWN_DURATION, ANIMATION_DURATION, SEAT_COUNT
+from core.enums import Choice, SceneType
+from diagnostics.profiler import summarize
+from game import Game
+
+# Choice mixes exercised in the game and resolution scenes
+CHOICE_MIXES = ['same', 'two_choices', 'majority', 'three_way_tie', 'no_choice']
+
+# pygame.draw primitives counted as draw calls
+DRAW_PRIMITIVES = ['rect', 'polygon', 'circle', 'ellipse', 'arc', 'line', 'lines', 'aaline', 'aalines']
+
+
+class CountingSurface(pygame.Surface):
+    """Screen stand-in that counts blits made to it."""
+    
+    def __init__(self, size):
+        super().__init__(size)
+        self.blit_count = 0
+    
+    def blit(self, *args, **kwargs):
+        self.blit_count += 1
+        return super().blit(*args, **kwargs)
+    
+    def blits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        self.blit_count += len(blit_sequence)
+        return super().blits(blit_sequence, *args, **kwargs)
+
+
+class DrawCallCounter:
+    """Counts pygame.draw primitive calls while installed."""
+    
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+    
+    def install(self):
+        for name in DRAW_PRIMITIVES:
+            original = getattr(pygame.draw, name)
+            self._originals[name] = original
+            setattr(pygame.draw, name, self._wrap(original))
+    
+    def uninstall(self):
+        for name, original in self._originals.items():
+            setattr(pygame.draw, name, original)
+        self._originals = {}
+    
+    def _wrap(self, func):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return func(*args, **kwargs)
+        return counted
+
+
+def choice_mix(mix: str, n: int) -> Optional[List[Choice]]:
+    """Build the choices for n players for a named mix, or None if impossible."""
+    if mix == 'same':
+        return [Choice.ROCK] * n
+    if mix == 'two_choices':
+        half = n // 2
+        return [Choice.ROCK] * (n - half) + [Choice.SCISSORS] * half
+    if mix == 'majority':
+        if n < 4:
+            return None
+        return [Choice.ROCK] * (n - 2) + [Choice.PAPER, Choice.SCISSORS]
+    if mix == 'three_way_tie':
+        # Two or more choices share the top count with all three present
+        top = (n - 1) // 2
+        rest = n - 2 * top
+        if top < 1 or rest < 1 or rest > top:
+            return None
+        return [Choice.ROCK] * top + [Choice.PAPER] * top + [Choice.SCISSORS] * rest
+    if mix == 'no_choice':
+        return [Choice.NONE] + [Choice.ROCK] * (n - 1)
+    raise ValueError(f"Unknown choice mix: {mix}")
+
+
+class Benchmark:
+    """Runs scripted scenarios against a headless Game."""
+    
+    def __init__(self, frames: int, dirty: bool, seats: int = SEAT_COUNT):
+        self.frames = frames
+        self.game = Game(seat_count=seats, asset_pack=False)
+        self.game.set_dirty_rendering(dirty)
+        self.dirty = dirty
+        self.surface = CountingSurface(self.game.screen.get_size())
+        # Scenes are built lazily; build them all so every one draws to the counter
+        while self.game.scenes.build_next():
+            pass
+        for scene in self.game.scenes.values():
+            scene.screen = self.surface
+        self.draw_counter = DrawCallCounter()
+    
+    def setup_players(self, n: int, choices: Optional[List[Choice]] = None):
+        """Reset to the menu, join the first n players and apply their choices."""
+        self.game.change_scene(SceneType.MENU)
+        for player in list(self.game.players)[:n]:
+            player.joined = True
+        if choices is None:
+            return
+        for player in self.game.players:
+            player.alive = player.joined
+        self.game.change_scene(SceneType.GAME)
+        for player, choice in zip(list(self.game.players)[:n], choices):
+            player.choice = choice
+    
+    def measure(self, prepare_frame) -> Dict[str, dict]:
+        """Render the benchmark's frame count, calling prepare_frame(i) before each."""
+        game = self.game
+        frame_ms = []
+        blits = []
+        primitives = []
+        updated = []
+        screen_area = self.surface.get_width() * self.surface.get_height()
+        
+        self.draw_counter.install()
+        try:
+            for i in range(self.frames):
+                prepare_frame(i)
+                self.surface.blit_count = 0
+                self.draw_counter.count = 0
+                scene = game.current_scene
+                
+                start = time.perf_counter()
+                game.sim_clock.accumulate(game.sim_clock.dt)
+                game.sim_clock.step()
+                scene.update(game.players, game.sim_clock.dt)
+                if self.dirty and scene.supports_retained:
+                    rects = scene.draw_retained(game.players)
+                    for rect in rects:
+                        game.screen.blit(self.surface, rect, rect)
+                    pygame.display.update(rects)
+                    updated.append(sum(r.width * r.height for r in rects) / screen_area)
+                else:
+                    scene.draw(game.players)
+                    game.screen.blit(self.surface, (0, 0))
+                    pygame.display.flip()
+                    updated.append(1.0)
+                frame_ms.append((time.perf_counter() - start) * 1000)
+                
+                blits.append(self.surface.blit_count)
+                primitives.append(self.draw_counter.count)
+        finally:
+            self.draw_counter.uninstall()
+        
+        return {
+            'frame_ms': summarize(frame_ms),
+            'blits': summarize(blits),
+            'primitives': summarize(primitives),
+            'updated_fraction': summarize(updated),
+        }
+    
+    def run_menu(self, n: int) -> dict:
+        self.setup_players(n)
+        return self.measure(lambda i: None)
+    
+    def run_game(self, n: int, mix: str, remaining: float) -> dict:
+        choices = choice_mix(mix, n)
+        self.setup_players(n, choices)
+        scene = self.game.current_scene
+        
+        def prepare(i):
+            # Pin the countdown so the chosen urgency phase is measured
+            scene.speedup_triggered = False
+            scene.countdown_start = scene.clock.now - (COUNTDOWN_DURATION - remaining)
+        return self.measure(prepare)
+    
+    def run_resolution(self, n: int, mix: str) -> dict:
+        self.setup_players(n, choice_mix(mix, n))
+        self.game.change_scene(SceneType.RESOLUTION)
+        scene = self.game.current_scene
+        
+        def prepare(i):
+            # Sweep the whole battle animation across the measured frames
+            progress = i / max(1, self.frames - 1)
+            scene.animation_start = scene.clock.now - progress * ANIMATION_DURATION
+        return self.measure(prepare)
+    
+    def run_victory(self, n: int) -> dict:
+        self.setup_players(n, [Choice.ROCK] + [Choice.SCISSORS] * (n - 1))
+        self.game.change_scene(SceneType.RESOLUTION)
+        self.game.change_scene(SceneType.VICTORY)
+        return self.measure(lambda i: None)
+    
+    def run_all(self, player_counts: List[int]) -> List[dict]:
+        """Run every scenario and return the results."""
+        results = []
+        
+        def record(scene: str, n: int, result: dict, **extra):
+            results.append({'scene': scene, 'players': n, **extra, **result})
+        
+        for n in player_counts:
+            record('menu', n, self.run_menu(n))
+            for mix in CHOICE_MIXES:
+                if choice_mix(mix, n) is None:
+                    continue
+                for phase, remaining in (('calm', 8.5), ('urgent', 1.5)):
+                    record('game', n, self.run_game(n, mix, remaining), mix=mix, phase=phase)
+                record('resolution', n, self.run_resolution(n, mix), mix=mix)
+            record('victory', n, self.run_victory(n))
+        return results
+
+
+def main():
+    """Run the benchmark and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Headless per-scene rendering benchmark")
+    parser.add_argument('--frames', type=int, default=120, help="frames rendered per scenario")
+    parser.add_argument('--players', type=int, nargs='+', default=list(range(2, 9)),
+                        help="joined player counts to run (2 up to --seats)")
+    parser.add_argument('--seats', type=int, default=SEAT_COUNT, help="player seats around the table")
+    parser.add_argument('--dirty', action='store_true',
+                        help="use retained-mode dirty-rect rendering where supported")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    
+    benchmark = Benchmark(args.frames, args.dirty, args.seats)
+    report = {
+        'config': {
+            'frames': args.frames,
+            'dirty_rendering': args.dirty,
+            'seats': args.seats,
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+            'pygame': pygame.version.ver,
+        },
+        'scenarios': benchmark.run_all(args.players),
+    }
+    pygame.quit()
+    
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,16 @@
 Configuration module for Rock Paper Scissors Arena.
 """
 
+from config.lazy import lazy_exports
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
-from config.colors import COLORS, PLAYER_COLORS
-from config.controls import PLAYER_CONFIGS, PLAYER_POSITIONS
+from config.colors import COLORS, PLAYER_COLORS, generate_player_colors
+from config.controls import PLAYER_POSITIONS, generate_seat_layout
 
 __all__ = [
     'SCREEN_WIDTH', 'SCREEN_HEIGHT',
-    'COLORS', 'PLAYER_COLORS',
-    'PLAYER_CONFIGS', 'PLAYER_POSITIONS',
+    'COLORS', 'PLAYER_COLORS', 'generate_player_colors',
+    'PLAYER_CONFIGS', 'PLAYER_POSITIONS', 'generate_seat_layout',
 ]
 
+# PLAYER_CONFIGS needs pygame, so it is looked up on first use
+__getattr__ = lazy_exports(globals(), {'PLAYER_CONFIGS': 'config.controls'})
@@ -2,6 +2,9 @@
 Color definitions for Rock Paper Scissors Arena.
 """
 
+import colorsys
+from typing import List, Tuple
+
 # Vibrant arcade palette
 COLORS = {
     'bg_dark': (15, 15, 25),
@@ -33,3 +36,14 @@ PLAYER_COLORS = [
     (255, 105, 180),  # Pink
 ]
 
+
+def generate_player_colors(count: int) -> List[Tuple[int, int, int]]:
+    """Get count player colors: the 8 base colors, then evenly spread extra hues."""
+    colors = list(PLAYER_COLORS[:count])
+    hue = 0.05
+    while len(colors) < count:
+        # Golden-ratio hue steps keep neighbouring extra seats distinguishable
+        hue = (hue + 0.618034) % 1.0
+        r, g, b = colorsys.hsv_to_rgb(hue, 0.6, 1.0)
+        colors.append((int(r * 255), int(g * 255), int(b * 255)))
+    return colors
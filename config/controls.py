@@ -2,21 +2,53 @@
 Player control configurations and table positions.
 """
 
-import pygame
+import math
+from typing import List, Optional, Tuple
 
-# Player key configurations
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Player key configurations, as pygame key constant names. They are turned
+# into key codes on first use (PLAYER_CONFIGS), so importing the table
+# layout doesn't load pygame.
 # Format: (join_key, rock_key, paper_key, scissors_key)
-PLAYER_CONFIGS = [
-    (pygame.K_1, pygame.K_q, pygame.K_w, pygame.K_e),      # Player 1
-    (pygame.K_2, pygame.K_r, pygame.K_t, pygame.K_y),      # Player 2
-    (pygame.K_3, pygame.K_u, pygame.K_i, pygame.K_o),      # Player 3
-    (pygame.K_4, pygame.K_p, pygame.K_LEFTBRACKET, pygame.K_RIGHTBRACKET),  # Player 4
-    (pygame.K_5, pygame.K_z, pygame.K_x, pygame.K_c),      # Player 5
-    (pygame.K_6, pygame.K_v, pygame.K_b, pygame.K_n),      # Player 6
-    (pygame.K_7, pygame.K_m, pygame.K_COMMA, pygame.K_PERIOD),  # Player 7
-    (pygame.K_8, pygame.K_SEMICOLON, pygame.K_QUOTE, pygame.K_RETURN),  # Player 8
+PLAYER_KEY_NAMES = [
+    ('K_1', 'K_q', 'K_w', 'K_e'),      # Player 1
+    ('K_2', 'K_r', 'K_t', 'K_y'),      # Player 2
+    ('K_3', 'K_u', 'K_i', 'K_o'),      # Player 3
+    ('K_4', 'K_p', 'K_LEFTBRACKET', 'K_RIGHTBRACKET'),  # Player 4
+    ('K_5', 'K_z', 'K_x', 'K_c'),      # Player 5
+    ('K_6', 'K_v', 'K_b', 'K_n'),      # Player 6
+    ('K_7', 'K_m', 'K_COMMA', 'K_PERIOD'),  # Player 7
+    ('K_8', 'K_SEMICOLON', 'K_QUOTE', 'K_RETURN'),  # Player 8
 ]
 
+_player_configs: Optional[List[Tuple[int, int, int, int]]] = None
+
+
+def get_player_configs() -> List[Tuple[int, int, int, int]]:
+    """Get the key codes for PLAYER_KEY_NAMES."""
+    global _player_configs
+    if _player_configs is None:
+        import pygame
+        _player_configs = [tuple(getattr(pygame, name) for name in keys) for keys in PLAYER_KEY_NAMES]
+    return _player_configs
+
+
+def __getattr__(name):
+    if name == 'PLAYER_CONFIGS':
+        return get_player_configs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# USB arcade encoder layout: each encoder (joystick device) serves several
+# seats, with one button per choice (rock, paper, scissors) for each seat
+ENCODER_SEATS = 4
+ENCODER_BUTTONS = 3
+
+# Joystick hat directions -> choice index (0 rock, 1 paper, 2 scissors);
+# hat N of encoder D belongs to the encoder's Nth seat
+HAT_DIRECTIONS = {(-1, 0): 0, (0, 1): 1, (1, 0): 2}
+
 # Positions around the screen (x, y, angle) - anti-clockwise from bottom center
 # Screen is laying flat on table, players stand around it
 PLAYER_POSITIONS = [
@@ -30,3 +62,72 @@ PLAYER_POSITIONS = [
     (180, 750, 315),    # P8: Bottom left corner - facing diagonally
 ]
 
+
+# Seat layout generation for tables with other seat counts
+SLOT_SIZE = (200, 160)  # unscaled player slot size in pixels
+SEAT_MARGIN = 80        # distance from the screen edge to a full-size seat's center
+
+
+def get_seat_scale(count: int) -> float:
+    """Get the slot scale that keeps count seats from overlapping around the perimeter."""
+    perimeter = 2 * (SCREEN_WIDTH + SCREEN_HEIGHT - 4 * SEAT_MARGIN)
+    return min(1.0, 0.9 * perimeter / (count * SLOT_SIZE[0]))
+
+
+def generate_seat_layout(count: int) -> List[Tuple[int, int, float]]:
+    """
+    Get (x, y, angle) seat positions for count players.
+    8 seats use the hand-tuned PLAYER_POSITIONS; other counts are spaced evenly
+    around the screen perimeter, anti-clockwise from bottom center, each facing
+    the nearest edge.
+    """
+    if count == len(PLAYER_POSITIONS):
+        return list(PLAYER_POSITIONS)
+    
+    margin = SEAT_MARGIN * get_seat_scale(count)
+    left, top = margin, margin
+    right, bottom = SCREEN_WIDTH - margin, SCREEN_HEIGHT - margin
+    width, height = right - left, bottom - top
+    
+    # Perimeter edges walked anti-clockwise as seen by players: (start, end, angle)
+    edges = [
+        ((SCREEN_WIDTH / 2, bottom), (right, bottom), 0),
+        ((right, bottom), (right, top), 90),
+        ((right, top), (left, top), 180),
+        ((left, top), (left, bottom), 270),
+        ((left, bottom), (SCREEN_WIDTH / 2, bottom), 0),
+    ]
+    perimeter = 2 * (width + height)
+    
+    seats = []
+    for i in range(count):
+        distance = perimeter * i / count
+        for (x0, y0), (x1, y1), angle in edges:
+            length = math.hypot(x1 - x0, y1 - y0)
+            if distance <= length:
+                t = distance / length if length else 0.0
+                seats.append((round(x0 + (x1 - x0) * t), round(y0 + (y1 - y0) * t), angle))
+                break
+            distance -= length
+    return seats
+
+
+def get_seat_controls(count: int) -> List[Tuple[Optional[int], ...]]:
+    """
+    Get (join, rock, paper, scissors) keys for count seats.
+    Seats beyond the keyboard layout get no keys (None).
+    """
+    configs = get_player_configs()
+    return [configs[i] if i < len(configs) else (None, None, None, None)
+            for i in range(count)]
+
+
+def get_joystick_bindings(seat: int) -> List[Tuple[tuple, int]]:
+    """
+    Get the joystick inputs for a seat as (input code, choice index) pairs.
+    Input codes are ('button', device, button) or ('hat', device, hat, (x, y)).
+    """
+    device, slot = divmod(seat, ENCODER_SEATS)
+    bindings = [(('button', device, slot * ENCODER_BUTTONS + i), i) for i in range(ENCODER_BUTTONS)]
+    bindings += [(('hat', device, slot, direction), i) for direction, i in HAT_DIRECTIONS.items()]
+    return bindings
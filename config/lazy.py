@@ -0,0 +1,30 @@
+"""
+Lazy package exports for Rock Paper Scissors Arena.
+
+Packages on the startup path export names that are costly to import
+(every scene module, pygame for PLAYER_CONFIGS, numpy before main.py
+--startup-profile starts timing) through lazy_exports, so importing one
+submodule doesn't pull in all the others.
+"""
+
+import importlib
+from typing import Callable, Dict
+
+
+def lazy_exports(package_globals: dict, exports: Dict[str, str]) -> Callable:
+    """
+    Get a module __getattr__ that imports each exported name's submodule on
+    first use and caches the name in the package.
+    
+    Args:
+        package_globals: The package's globals()
+        exports: Public name -> submodule it lives in
+    """
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package_globals['__name__']!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        package_globals[name] = value
+        return value
+    return __getattr__
@@ -2,12 +2,63 @@
 Game settings and screen configuration.
 """
 
-# Screen setup
+# Screen setup (logical resolution every scene is laid out and rendered at)
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 900
 
+# Display (the logical frame is scaled once to the window, letterboxed)
+DISPLAY_SIZE = None    # physical window size, e.g. (3840, 2160); None = logical size
+FULLSCREEN = False     # use the desktop resolution (F11 toggles)
+SMOOTH_SCALING = True  # bilinear final scale; False uses faster nearest-neighbour
+
+# Table
+SEAT_COUNT = 8  # player seats around the table (8 uses the hand-tuned layout)
+
+# Rules (core.variants)
+RULE_VARIANT = 'classic'  # 'classic' rock paper scissors or 'rpsls' (adds lizard and Spock)
+
+# Remote players (network.server)
+REMOTE_HOST = '0.0.0.0'    # interface the remote-player server listens on
+REMOTE_PORT = 8765         # TCP port for remote players (0 = pick a free one)
+REMOTE_QUEUE_SIZE = 256    # actions waiting for the game loop, across all connections
+REMOTE_MAX_PENDING = 4     # unapplied actions per connection before it stops being read
+REMOTE_MAX_LINE = 1024     # longest protocol message in bytes
+
+# Rendering
+DIRTY_RECT_RENDERING = False  # repaint only changed sprites in scenes that support it
+
 # Timing
+SIMULATION_HZ = 60       # fixed simulation steps per second
+TARGET_FPS = 60          # render rate cap (30, 60, 144...); 0 = uncapped
+MAX_FRAME_TIME = 0.25    # longest frame fed to the simulation, in seconds
 COUNTDOWN_DURATION = 10  # seconds for choosing
 SPEEDUP_THRESHOLD = 3    # seconds to skip to when all players ready
 ANIMATION_DURATION = 2.5 # seconds for resolution animation
 
+# Rendering caches
+ICON_CACHE_BUDGET = 8 * 1024 * 1024  # bytes of pre-rasterized icons kept in the atlas
+ICON_SIZE_BUCKET = 2                 # icon sizes are snapped to multiples of this (px)
+ICON_SUPERSAMPLE = 3                 # icons are drawn at this multiple then smoothscaled down
+TEXT_CACHE_SIZE = 256                # rendered text surfaces kept by graphics.fonts
+PARTICLE_CAPACITY = 4096             # max live particles per particle system
+PARTICLE_ALPHA_BUCKETS = 16          # particle fade is quantized to this many sprite alphas
+ASSET_PACK_ENABLED = True            # reuse pre-rendered background and sprites across launches
+ASSET_PACK_PATH = None               # pack file; None = ~/.cache/rps_arena/assets.pack
+
+# Frame capture (recording.frame_recorder)
+CAPTURE_RING_SIZE = 8   # preallocated frame buffers; frames are dropped when all are in use
+CAPTURE_ZLIB_LEVEL = 1  # compression level for the zlib capture format (fast)
+CAPTURE_FORMATS = ('raw', 'zlib', 'png')
+FRAME_SHM_NAME = 'rps_arena_frames'  # shared memory block frames are published to
+
+# Match history (recording.match_history)
+HISTORY_PATH = None            # SQLite database games are recorded to; None = off
+HISTORY_BATCH_SIZE = 256       # rows per transaction when the writer is busy
+HISTORY_FLUSH_INTERVAL = 2.0   # seconds a queued row waits at most before it is committed
+
+# Profiling
+PROFILER_ENABLED = False         # time every frame phase from startup (F3 toggles the overlay)
+PROFILER_EXPORT_PATH = None      # .json snapshot or .csv time series of the aggregates
+PROFILER_EXPORT_INTERVAL = 30.0  # seconds between exports
+PROFILER_WINDOW = 600            # frames kept for rolling percentiles and the graph
+LATENCY_TRACKING = False         # measure key press to display latency per seat and scene
@@ -3,9 +3,14 @@ Core game logic module for Rock Paper Scissors Arena.
 """
 
 from core.enums import Choice, SceneType
-from core.player import Player, create_players
+from core.player import Player, PlayerRegistry, create_players
+from core.input_dispatch import INPUT_EVENTS, REMOTE_INPUT, InputIndex, input_index
 from core.rules import (
+    RoundResult,
+    judge_round,
+    apply_round,
     resolve_round,
+    resolve_rounds_batch,
     get_round_choices,
     get_choosers,
     get_non_choosers,
@@ -13,12 +18,15 @@ from core.rules import (
     get_alive_count,
     get_winner,
 )
+from core.variants import RuleVariant, VARIANTS, get_variant, set_variant
 
 __all__ = [
     'Choice', 'SceneType',
-    'Player', 'create_players',
-    'resolve_round', 'get_round_choices',
+    'Player', 'PlayerRegistry', 'create_players',
+    'INPUT_EVENTS', 'REMOTE_INPUT', 'InputIndex', 'input_index',
+    'RoundResult', 'judge_round', 'apply_round',
+    'resolve_round', 'resolve_rounds_batch', 'get_round_choices',
     'get_choosers', 'get_non_choosers',
     'get_joined_count', 'get_alive_count', 'get_winner',
+    'RuleVariant', 'VARIANTS', 'get_variant', 'set_variant',
 ]
-
@@ -0,0 +1,116 @@
+"""
+Simulation and frame clocks for Rock Paper Scissors Arena.
+
+Game.run asks its frame clock how much time each frame took and feeds that
+into the simulation clock, which releases it as fixed-size simulation steps.
+Scenes read simulation time from the clock instead of the wall clock, so
+gameplay timing and particle physics do not depend on the render rate, and
+swapping the frame clock fast-forwards the whole game.
+"""
+
+import time
+from typing import Union
+
+import pygame
+
+from config.settings import SIMULATION_HZ, MAX_FRAME_TIME, TARGET_FPS
+
+
+class SimulationClock:
+    """Fixed-timestep simulation time driven by an accumulator."""
+    
+    def __init__(self, hz: int = SIMULATION_HZ, max_frame_time: float = MAX_FRAME_TIME):
+        self.dt = 1.0 / hz
+        self.max_frame_time = max_frame_time
+        self.now = 0.0          # Simulation time in seconds (advanced in whole steps)
+        self.steps = 0          # Total simulation steps taken
+        self._accumulator = 0.0
+    
+    def accumulate(self, frame_time: float):
+        """
+        Add real time that has passed since the last frame.
+        Long frames are clamped so a stall doesn't trigger a burst of catch-up steps.
+        """
+        self._accumulator += min(max(0.0, frame_time), self.max_frame_time)
+    
+    def step(self) -> bool:
+        """
+        Consume one fixed step from the accumulator if enough time has built up.
+        Returns True if simulation time advanced and the caller should update once.
+        """
+        # Tolerate float error so feeding exactly dt always yields one step
+        if self._accumulator < self.dt - 1e-9:
+            return False
+        self._accumulator = max(0.0, self._accumulator - self.dt)
+        self.now += self.dt
+        self.steps += 1
+        return True
+    
+    @property
+    def alpha(self) -> float:
+        """How far (0.0 - 1.0) real time is between the last step and the next."""
+        return self._accumulator / self.dt
+    
+    @property
+    def render_time(self) -> float:
+        """Simulation time interpolated to the moment being rendered."""
+        return self.now + self._accumulator
+
+
+class RealClock:
+    """Frame clock that reports measured wall time, capped at a target FPS."""
+    
+    def __init__(self, fps: int = TARGET_FPS):
+        self.fps = fps
+        self._clock = pygame.time.Clock()
+    
+    def tick(self) -> float:
+        """Wait for the frame cap, then return real seconds since the last tick."""
+        return self._clock.tick(self.fps) / 1000
+
+
+class FixedStepClock:
+    """
+    Frame clock that always reports exactly one simulation step per frame,
+    paced to real time. Gameplay is frame-for-frame reproducible while still
+    watchable.
+    """
+    
+    def __init__(self, hz: int = SIMULATION_HZ):
+        self.frame_time = 1.0 / hz
+        self._next = time.perf_counter()
+    
+    def tick(self) -> float:
+        """Sleep until the next frame is due, then return the fixed frame time."""
+        self._next += self.frame_time
+        delay = self._next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Fell behind: don't try to catch up with a burst of frames
+            self._next = time.perf_counter()
+        return self.frame_time
+
+
+class FastClock:
+    """
+    Frame clock that reports a fixed frame time without ever waiting, so the
+    game runs as fast as update and draw allow (headless runs, soak tests).
+    """
+    
+    def __init__(self, hz: int = SIMULATION_HZ):
+        self.frame_time = 1.0 / hz
+    
+    def tick(self) -> float:
+        """Return the fixed frame time immediately."""
+        return self.frame_time
+
+
+FrameClock = Union[RealClock, FixedStepClock, FastClock]
+
+# Frame clocks selectable by name (e.g. from the command line)
+FRAME_CLOCKS = {
+    'real': RealClock,
+    'fixed': FixedStepClock,
+    'fast': FastClock,
+}
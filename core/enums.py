@@ -11,6 +11,8 @@ class Choice(Enum):
     ROCK = 1
     PAPER = 2
     SCISSORS = 3
+    LIZARD = 4    # Only in variants that include them (see core.variants)
+    SPOCK = 5
 
 
 class SceneType(Enum):
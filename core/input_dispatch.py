@@ -0,0 +1,110 @@
+"""
+Indexed input dispatch for Rock Paper Scissors Arena.
+
+Keyboard keys, arcade-encoder buttons, joystick hats and remote presses
+(from network.server) are all turned into
+hashable input codes and looked up in one dict that maps straight to the
+(player, choice) they are bound to. The index is rebuilt only when the
+player list or its bindings change, so dispatch cost does not grow with the
+number of seats or devices.
+"""
+
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+import pygame
+
+from core.enums import Choice
+from core.player import Player
+from core.variants import get_variant
+
+# A button press from a remote player: event.seat (player id), event.choice
+REMOTE_INPUT = pygame.event.custom_type()
+
+# Events that can carry a player action
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, REMOTE_INPUT)
+
+
+class InputIndex:
+    """Maps input codes to (player, choice)."""
+    
+    def __init__(self):
+        self._index: Dict[tuple, Tuple[Player, Choice]] = {}
+        self._players: Optional[Sequence[Player]] = None
+        self._version = -1
+        self._variant = None
+        self._devices: Dict[int, int] = {}  # joystick instance id -> device index
+        self._joysticks = {}
+    
+    def add_device(self, device_index: int, instance_id: Optional[int] = None):
+        """
+        Register a joystick (from JOYDEVICEADDED) so its events resolve to its
+        device index, which is what the bindings refer to.
+        """
+        if instance_id is None:
+            joystick = pygame.joystick.Joystick(device_index)
+            instance_id = joystick.get_instance_id()
+            self._joysticks[instance_id] = joystick  # Keep it open
+        self._devices[instance_id] = device_index
+    
+    def remove_device(self, instance_id: int):
+        """Forget a joystick (from JOYDEVICEREMOVED)."""
+        self._devices.pop(instance_id, None)
+        self._joysticks.pop(instance_id, None)
+    
+    def input_code(self, event: pygame.event.Event) -> Optional[tuple]:
+        """Get the input code for an event, or None if it can't be a player action."""
+        if event.type == pygame.KEYDOWN:
+            return ('key', event.key)
+        if event.type == pygame.JOYBUTTONDOWN:
+            return ('button', self._devices.get(event.instance_id, event.instance_id), event.button)
+        if event.type == pygame.JOYHATMOTION:
+            return ('hat', self._devices.get(event.instance_id, event.instance_id),
+                    event.hat, tuple(event.value))
+        if event.type == REMOTE_INPUT:
+            return ('remote', event.seat, event.choice.value)
+        return None
+    
+    def rebuild(self, players: Sequence[Player]):
+        """Index every player's keyboard, joystick and remote bindings."""
+        index = {}
+        for player in players:
+            for key, choice in ((player.rock_key, Choice.ROCK), (player.paper_key, Choice.PAPER),
+                                (player.scissors_key, Choice.SCISSORS)):
+                if key is not None:
+                    index[('key', key)] = (player, choice)
+            for code, choice in player.joy_bindings:
+                index[code] = (player, choice)
+            # Every seat can also be played remotely, with any choice of the variant
+            for choice in get_variant().choices:
+                index[('remote', player.id, choice.value)] = (player, choice)
+        self._index = index
+        self._players = players
+        self._version = self._bindings_version(players)
+        self._variant = get_variant()
+    
+    def _bindings_version(self, players: Sequence[Player]) -> Hashable:
+        state = getattr(players, 'state', None)
+        if state is not None:
+            return state.bindings_version
+        # A plain sequence of players (cached by identity in lookup_code): any
+        # rebind, or a player added or removed, changes this
+        return Player.rebinds, len(players)
+    
+    def lookup(self, event: pygame.event.Event,
+               players: Sequence[Player]) -> Optional[Tuple[Player, Choice]]:
+        """Get the (player, choice) an event is bound to, rebuilding the index if stale."""
+        return self.lookup_code(self.input_code(event), players)
+    
+    def lookup_code(self, code: Optional[tuple],
+                    players: Sequence[Player]) -> Optional[Tuple[Player, Choice]]:
+        """Get the (player, choice) an input code is bound to, rebuilding the index if stale."""
+        if (players is not self._players or self._bindings_version(players) != self._version
+                or get_variant() is not self._variant):
+            self.rebuild(players)
+        if code is None:
+            return None
+        return self._index.get(code)
+
+
+# Shared index used by the scenes
+input_index = InputIndex()
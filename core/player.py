@@ -1,29 +1,118 @@
 """
 Player class for Rock Paper Scissors Arena.
+
+Hot per-round state (joined, alive, choice) lives in compact NumPy arrays
+owned by a PlayerRegistry, one slot per seat. Player objects are lightweight
+views onto one seat, so scenes keep reading player.alive and player.choice
+while core.rules scans the packed arrays directly.
 """
 
-from dataclasses import dataclass
-from typing import List, Tuple
+import warnings
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
 
 from core.enums import Choice
-from config.colors import PLAYER_COLORS
-from config.controls import PLAYER_CONFIGS, PLAYER_POSITIONS
+from config.colors import generate_player_colors
+from config.controls import (
+    generate_seat_layout, get_seat_controls, get_seat_scale, get_joystick_bindings,
+)
+from config.settings import SEAT_COUNT
+
+# Choices in the order used by the controls config (0 rock, 1 paper, 2 scissors)
+PLAYABLE = (Choice.ROCK, Choice.PAPER, Choice.SCISSORS)
+
+
+class SeatState:
+    """Packed joined/alive/choice arrays for a number of seats."""
+    
+    def __init__(self, count: int):
+        self.joined = np.zeros(count, dtype=np.bool_)
+        self.alive = np.ones(count, dtype=np.bool_)
+        self.choice = np.zeros(count, dtype=np.uint8)  # Choice values
+        self.bindings_version = 0  # Bumped whenever a seat's inputs are rebound
 
 
-@dataclass
 class Player:
-    """Represents a player in the game."""
-    id: int
-    color: Tuple[int, int, int]
-    join_key: int
-    rock_key: int
-    paper_key: int
-    scissors_key: int
-    position: Tuple[int, int] = (0, 0)
-    angle: float = 0.0
-    joined: bool = False
-    alive: bool = True
-    choice: Choice = Choice.NONE
+    """Represents a player in the game (a view onto one seat of a SeatState)."""
+    
+    __slots__ = ('id', 'color', 'join_key', 'rock_key', 'paper_key', 'scissors_key',
+                 'joy_bindings', 'position', 'angle', 'scale', '_state', '_index')
+    
+    rebinds = 0  # Bumped whenever any player's inputs are rebound, in any registry
+    
+    def __init__(self, id: int, color: Tuple[int, int, int], join_key: Optional[int],
+                 rock_key: Optional[int], paper_key: Optional[int], scissors_key: Optional[int],
+                 position: Tuple[int, int] = (0, 0), angle: float = 0.0, scale: float = 1.0,
+                 joined: bool = False, alive: bool = True, choice: Choice = Choice.NONE,
+                 state: Optional[SeatState] = None, index: int = 0,
+                 joy_bindings: Sequence[Tuple[tuple, Choice]] = ()):
+        self.id = id
+        self.color = color
+        self.join_key = join_key
+        self.rock_key = rock_key
+        self.paper_key = paper_key
+        self.scissors_key = scissors_key
+        self.joy_bindings = tuple(joy_bindings)  # (joystick input code, choice) pairs
+        self.position = position
+        self.angle = angle
+        self.scale = scale
+        # A standalone player gets a private one-seat store
+        self._state = state if state is not None else SeatState(1)
+        self._index = index
+        if state is None:
+            self.joined = joined
+            self.alive = alive
+            self.choice = choice
+    
+    def __repr__(self) -> str:
+        return (f"Player(id={self.id}, joined={self.joined}, alive={self.alive}, "
+                f"choice={self.choice})")
+    
+    @property
+    def joined(self) -> bool:
+        return bool(self._state.joined[self._index])
+    
+    @joined.setter
+    def joined(self, value: bool):
+        self._state.joined[self._index] = value
+    
+    @property
+    def alive(self) -> bool:
+        return bool(self._state.alive[self._index])
+    
+    @alive.setter
+    def alive(self, value: bool):
+        self._state.alive[self._index] = value
+    
+    @property
+    def choice(self) -> Choice:
+        return Choice(int(self._state.choice[self._index]))
+    
+    @choice.setter
+    def choice(self, value: Choice):
+        self._state.choice[self._index] = value.value
+    
+    @property
+    def bindings_version(self) -> int:
+        """Bumped whenever this player's inputs (or another seat's in the same registry) are rebound."""
+        return self._state.bindings_version
+    
+    def bind_keys(self, rock_key: Optional[int], paper_key: Optional[int],
+                  scissors_key: Optional[int], join_key: Optional[int] = None):
+        """Rebind this player's keys (input indexes pick the change up on their next lookup)."""
+        self.rock_key = rock_key
+        self.paper_key = paper_key
+        self.scissors_key = scissors_key
+        self.join_key = join_key
+        self._state.bindings_version += 1
+        Player.rebinds += 1
+    
+    def bind_joystick(self, bindings: Sequence[Tuple[tuple, Choice]]):
+        """Replace this player's joystick bindings."""
+        self.joy_bindings = tuple(bindings)
+        self._state.bindings_version += 1
+        Player.rebinds += 1
     
     def reset_choice(self):
         """Reset player's choice for a new round."""
@@ -44,44 +133,82 @@ class Player:
         if self.choice == Choice.NONE:
             self.choice = choice
     
+    def handle_action(self, choice: Choice) -> bool:
+        """
+        Apply a choice from any input device.
+        Returns True if it was accepted (joined, alive and not locked in yet).
+        """
+        if not self.joined or not self.alive or self.choice != Choice.NONE:
+            return False
+        self.choice = choice
+        return True
+    
     def handle_input(self, key: int) -> bool:
         """
         Handle a key press for this player.
         Returns True if the key was handled.
-        """
-        if not self.joined or not self.alive:
-            return False
-        
-        if self.choice != Choice.NONE:
-            return False
-        
-        if key == self.rock_key:
-            self.choice = Choice.ROCK
-            return True
-        elif key == self.paper_key:
-            self.choice = Choice.PAPER
-            return True
-        elif key == self.scissors_key:
-            self.choice = Choice.SCISSORS
-            return True
         
-        return False
+        Deprecated: scenes dispatch every input device through
+        core.input_dispatch.input_index; this looks the key up the same way.
+        """
+        warnings.warn("Player.handle_input is deprecated; dispatch input through "
+                      "core.input_dispatch.input_index", DeprecationWarning, stacklevel=2)
+        from core.input_dispatch import InputIndex
+        bound = InputIndex().lookup_code(('key', key), [self])
+        return bound is not None and self.handle_action(bound[1])
+
 
+class PlayerRegistry(Sequence):
+    """
+    All seats at the table.
+    Behaves like a read-only list of Player views; the packed state arrays are
+    exposed as .state for vectorized rule checks.
+    """
+    
+    def __init__(self, count: int = SEAT_COUNT):
+        self.state = SeatState(count)
+        scale = get_seat_scale(count)
+        colors = generate_player_colors(count)
+        controls = get_seat_controls(count)
+        seats = generate_seat_layout(count)
+        self._players = [
+            Player(
+                id=i + 1,
+                color=colors[i],
+                join_key=controls[i][0],
+                rock_key=controls[i][1],
+                paper_key=controls[i][2],
+                scissors_key=controls[i][3],
+                position=(seats[i][0], seats[i][1]),
+                angle=seats[i][2],
+                scale=scale,
+                state=self.state,
+                index=i,
+                joy_bindings=[(code, PLAYABLE[c]) for code, c in get_joystick_bindings(i)],
+            )
+            for i in range(count)
+        ]
+    
+    def __len__(self) -> int:
+        return len(self._players)
+    
+    def __getitem__(self, index):
+        return self._players[index]
+    
+    def __iter__(self) -> Iterator[Player]:
+        return iter(self._players)
+    
+    def reset_choices(self):
+        """Reset every seat's choice for a new round."""
+        self.state.choice[:] = Choice.NONE.value
+    
+    def reset_for_new_game(self):
+        """Reset every seat for a new game."""
+        self.state.joined[:] = False
+        self.state.alive[:] = True
+        self.state.choice[:] = Choice.NONE.value
 
-def create_players() -> List[Player]:
-    """Create all 8 players with their configurations."""
-    players = []
-    for i, (config, pos) in enumerate(zip(PLAYER_CONFIGS, PLAYER_POSITIONS)):
-        player = Player(
-            id=i + 1,
-            color=PLAYER_COLORS[i],
-            join_key=config[0],
-            rock_key=config[1],
-            paper_key=config[2],
-            scissors_key=config[3],
-            position=(pos[0], pos[1]),
-            angle=pos[2]
-        )
-        players.append(player)
-    return players
 
+def create_players(count: int = SEAT_COUNT) -> PlayerRegistry:
+    """Create the player registry for count seats (8 by default)."""
+    return PlayerRegistry(count)
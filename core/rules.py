@@ -2,118 +2,177 @@
 Game rules and resolution logic for Rock Paper Scissors Arena.
 """
 
-from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Mapping, Sequence, Tuple, Optional
+
+import numpy as np
 
 from core.enums import Choice
-from core.player import Player
+from core.player import Player, PlayerRegistry
+from core.variants import RuleVariant, get_variant
+
+
+def get_seat_arrays(players: Sequence[Player]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get (joined, alive, choice) arrays for the players.
+    A PlayerRegistry hands out its packed arrays directly; any other sequence
+    of players is packed on the fly.
+    """
+    if isinstance(players, PlayerRegistry):
+        state = players.state
+        return state.joined, state.alive, state.choice
+    joined = np.fromiter((p.joined for p in players), dtype=np.bool_, count=len(players))
+    alive = np.fromiter((p.alive for p in players), dtype=np.bool_, count=len(players))
+    choice = np.fromiter((p.choice.value for p in players), dtype=np.uint8, count=len(players))
+    return joined, alive, choice
+
 
+def _select(players: Sequence[Player], mask: np.ndarray) -> List[Player]:
+    """Get the players whose seats are set in mask."""
+    return [players[i] for i in np.flatnonzero(mask).tolist()]
 
-def get_choice_counts(players: List[Player]) -> dict:
+
+def get_choice_counts(players: Sequence[Player]) -> dict:
     """Count how many players chose each option."""
-    counts = {Choice.ROCK: 0, Choice.PAPER: 0, Choice.SCISSORS: 0}
-    for p in players:
-        if p.joined and p.alive and p.choice != Choice.NONE:
-            counts[p.choice] += 1
-    return counts
+    joined, alive, choice = get_seat_arrays(players)
+    tally = np.bincount(choice[joined & alive], minlength=len(Choice))
+    return {c: int(tally[c.value]) for c in get_variant().choices}
 
 
-def get_what_beats(choice: Choice) -> Choice:
-    """Get what the given choice beats."""
-    if choice == Choice.ROCK:
-        return Choice.SCISSORS
-    elif choice == Choice.SCISSORS:
-        return Choice.PAPER
-    elif choice == Choice.PAPER:
-        return Choice.ROCK
-    return None
+def get_what_beats(choice: Choice) -> Optional[Choice]:
+    """Get what the given choice beats (the first, in variants where it beats several)."""
+    beaten = get_variant().beats.get(choice)
+    return beaten[0] if beaten else None
 
 
-def resolve_round(players: List[Player]) -> List[Player]:
+@dataclass(frozen=True)
+class RoundResult:
     """
-    Resolve a round of rock paper scissors.
-    Returns list of players who are eliminated this round.
+    Everything about one round, worked out in one pass over the living seats.
+    Player groups are tuples in seat order.
     
     Rules:
     - Players who didn't choose are eliminated first (if anyone else chose)
-    - If all players chose the same: no elimination
-    - If all three choices are present:
-      - If there's a majority, that majority defeats what it beats
-      - If no majority (all equal), it's a draw
-    - If only two choices present: standard RPS rules apply, losers eliminated
+    - Otherwise the variant's outcome table decides (see core.variants); in
+      classic rock paper scissors:
+      - If all players chose the same: no elimination
+      - If all three choices are present:
+        - If there's a majority, that majority defeats what it beats
+        - If no majority (all equal), it's a draw
+      - If only two choices present: standard RPS rules apply, losers eliminated
     """
-    all_alive = [p for p in players if p.joined and p.alive]
-    players_who_chose = [p for p in all_alive if p.choice != Choice.NONE]
-    players_who_didnt = [p for p in all_alive if p.choice == Choice.NONE]
-    
-    # First: eliminate anyone who didn't choose (if at least one person did choose)
-    if players_who_didnt and players_who_chose:
-        eliminated = []
-        for player in players_who_didnt:
-            player.eliminate()
-            eliminated.append(player)
-        return eliminated  # Only eliminate non-choosers this round
-    
-    # If no one chose or only one person chose, no elimination
-    if len(players_who_chose) < 2:
-        return []
-    
-    # Count choices
-    counts = get_choice_counts(players)
-    present_choices = [c for c in counts if counts[c] > 0]
-    
-    # All same = draw
-    if len(present_choices) == 1:
-        return []
-    
-    losing_choice = None
-    
-    if len(present_choices) == 3:
-        # All three choices present - check for majority
-        max_count = max(counts.values())
-        majority_choices = [c for c in counts if counts[c] == max_count]
-        
-        if len(majority_choices) == 1:
-            # There's a clear majority - they defeat what they beat
-            majority = majority_choices[0]
-            losing_choice = get_what_beats(majority)
-        else:
-            # No clear majority (tie between 2+ choices) = draw
-            return []
+    variant: RuleVariant
+    counts: Mapping[Choice, int]       # Choices among the living seats
+    winning_choices: Tuple[Choice, ...]
+    losing_choices: Tuple[Choice, ...]
+    is_majority: bool                  # Every present choice was beaten, the majority won
+    is_no_choice: bool                 # Some seats didn't choose and are eliminated
+    contenders: Tuple[Player, ...]     # Every living seat in the round
+    winners: Tuple[Player, ...]        # Winning choice (every chooser in a no-choice round)
+    losers: Tuple[Player, ...]         # Losing choice
+    neutrals: Tuple[Player, ...]       # Other choosers (the third choice, or everyone in a draw)
+    non_choosers: Tuple[Player, ...]
+    eliminated: Tuple[Player, ...]
+    
+    @property
+    def is_draw(self) -> bool:
+        return not self.eliminated
+    
+    @property
+    def winning_choice(self) -> Optional[Choice]:
+        return self.winning_choices[0] if self.winning_choices else None
+    
+    @property
+    def losing_choice(self) -> Optional[Choice]:
+        return self.losing_choices[0] if self.losing_choices else None
+    
+    @property
+    def battle_pairs(self) -> List[Tuple[Player, Player]]:
+        """(attacker, defeated) pairs: every winner attacks every eliminated player."""
+        return [(winner, loser) for winner in self.winners for loser in self.eliminated]
+
+
+def judge_round(players: Sequence[Player], variant: Optional[RuleVariant] = None) -> RoundResult:
+    """Work out a round's outcome without eliminating anyone (see apply_round)."""
+    variant = variant or get_variant()
+    joined, alive, choice = get_seat_arrays(players)
+    seats = np.flatnonzero(joined & alive).tolist()
+    seat_choices = choice[seats]
+    tally = np.bincount(seat_choices, minlength=len(Choice))
+    counts = {c: int(tally[c.value]) for c in variant.choices}
+    chose = int(np.count_nonzero(seat_choices))
+    
+    is_no_choice = 0 < chose < len(seats)
+    if is_no_choice:
+        winning, losing, is_majority = (), (), False
     else:
-        # Two choices - standard RPS rules
-        c1, c2 = present_choices[0], present_choices[1]
-        
-        # Determine losing choice
-        # Rock beats Scissors, Scissors beats Paper, Paper beats Rock
-        if (c1 == Choice.ROCK and c2 == Choice.SCISSORS) or (c1 == Choice.SCISSORS and c2 == Choice.ROCK):
-            losing_choice = Choice.SCISSORS
-        elif (c1 == Choice.SCISSORS and c2 == Choice.PAPER) or (c1 == Choice.PAPER and c2 == Choice.SCISSORS):
-            losing_choice = Choice.PAPER
-        elif (c1 == Choice.PAPER and c2 == Choice.ROCK) or (c1 == Choice.ROCK and c2 == Choice.PAPER):
-            losing_choice = Choice.ROCK
-    
-    # Eliminate players with losing choice
-    eliminated = []
-    if losing_choice:
-        for player in players_who_chose:
-            if player.choice == losing_choice:
-                player.eliminate()
-                eliminated.append(player)
-    
-    return eliminated
-
-
-def get_non_choosers(players: List[Player]) -> List[Player]:
+        winning, losing, is_majority = variant.outcome(list(counts.values()))
+    winning_values = {c.value for c in winning}
+    losing_values = {c.value for c in losing}
+    
+    contenders = []
+    winners = []
+    losers = []
+    neutrals = []
+    non_choosers = []
+    for seat, value in zip(seats, seat_choices.tolist()):
+        player = players[seat]
+        contenders.append(player)
+        if value == Choice.NONE.value:
+            non_choosers.append(player)
+        elif is_no_choice or value in winning_values:
+            winners.append(player)
+        elif value in losing_values:
+            losers.append(player)
+        else:
+            neutrals.append(player)
+    
+    return RoundResult(
+        variant=variant,
+        counts=MappingProxyType(counts),
+        winning_choices=winning,
+        losing_choices=losing,
+        is_majority=is_majority,
+        is_no_choice=is_no_choice,
+        contenders=tuple(contenders),
+        winners=tuple(winners),
+        losers=tuple(losers),
+        neutrals=tuple(neutrals),
+        non_choosers=tuple(non_choosers),
+        eliminated=tuple(non_choosers if is_no_choice else losers),
+    )
+
+
+def apply_round(result: RoundResult):
+    """Eliminate the players a judged round knocked out."""
+    for player in result.eliminated:
+        player.eliminate()
+
+
+def resolve_round(players: Sequence[Player]) -> List[Player]:
+    """
+    Resolve a round of rock paper scissors (see RoundResult for the rules).
+    Returns list of players who are eliminated this round.
+    """
+    result = judge_round(players)
+    apply_round(result)
+    return list(result.eliminated)
+
+
+def get_non_choosers(players: Sequence[Player]) -> List[Player]:
     """Get list of alive players who didn't make a choice."""
-    return [p for p in players if p.joined and p.alive and p.choice == Choice.NONE]
+    joined, alive, choice = get_seat_arrays(players)
+    return _select(players, joined & alive & (choice == Choice.NONE.value))
 
 
-def get_choosers(players: List[Player]) -> List[Player]:
+def get_choosers(players: Sequence[Player]) -> List[Player]:
     """Get list of alive players who made a choice."""
-    return [p for p in players if p.joined and p.alive and p.choice != Choice.NONE]
+    joined, alive, choice = get_seat_arrays(players)
+    return _select(players, joined & alive & (choice != Choice.NONE.value))
 
 
-def get_round_choices(players: List[Player]) -> Tuple[Optional[Choice], Optional[Choice], bool, bool]:
+def get_round_choices(players: Sequence[Player]) -> Tuple[Optional[Choice], Optional[Choice], bool, bool]:
     """
     Get the winning and losing choices from the round.
     Returns (winning_choice, losing_choice, is_majority_rule, is_no_choice) 
@@ -122,69 +181,70 @@ def get_round_choices(players: List[Player]) -> Tuple[Optional[Choice], Optional
     is_majority_rule is True when all three choices were present but majority won.
     is_no_choice is True when some players didn't choose (they get eliminated).
     """
-    # Check for non-choosers first
-    non_choosers = get_non_choosers(players)
-    choosers = get_choosers(players)
-    
-    if non_choosers and choosers:
-        # Some players didn't choose - they get eliminated
-        # Return special case: no winning/losing choice, but is_no_choice=True
-        return (None, None, False, True)
-    
-    # Count choices for active players (before elimination)
-    counts = {Choice.ROCK: 0, Choice.PAPER: 0, Choice.SCISSORS: 0}
-    for p in players:
-        if p.joined and p.choice != Choice.NONE:
-            counts[p.choice] += 1
-    
-    present_choices = [c for c in counts if counts[c] > 0]
-    
-    # All same = draw
-    if len(present_choices) <= 1:
-        return (None, None, False, False)
-    
-    if len(present_choices) == 3:
-        # All three choices present - check for majority
-        max_count = max(counts.values())
-        majority_choices = [c for c in counts if counts[c] == max_count]
-        
-        if len(majority_choices) == 1:
-            # There's a clear majority - they defeat what they beat
-            majority = majority_choices[0]
-            losing = get_what_beats(majority)
-            return (majority, losing, True, False)  # True = majority rule
-        else:
-            # No clear majority = draw
-            return (None, None, False, False)
-    
-    # Two choices - standard RPS rules
-    c1, c2 = present_choices[0], present_choices[1]
-    
-    # Determine winning and losing choice
-    if (c1 == Choice.ROCK and c2 == Choice.SCISSORS) or (c1 == Choice.SCISSORS and c2 == Choice.ROCK):
-        return (Choice.ROCK, Choice.SCISSORS, False, False)
-    elif (c1 == Choice.SCISSORS and c2 == Choice.PAPER) or (c1 == Choice.PAPER and c2 == Choice.SCISSORS):
-        return (Choice.SCISSORS, Choice.PAPER, False, False)
-    elif (c1 == Choice.PAPER and c2 == Choice.ROCK) or (c1 == Choice.ROCK and c2 == Choice.PAPER):
-        return (Choice.PAPER, Choice.ROCK, False, False)
-    
-    return (None, None, False, False)
+    result = judge_round(players)
+    return (result.winning_choice, result.losing_choice, result.is_majority, result.is_no_choice)
 
 
-def get_joined_count(players: List[Player]) -> int:
+def get_joined_count(players: Sequence[Player]) -> int:
     """Get the number of players who have joined."""
-    return sum(1 for p in players if p.joined)
+    joined, _, _ = get_seat_arrays(players)
+    return int(np.count_nonzero(joined))
 
 
-def get_alive_count(players: List[Player]) -> int:
+def get_alive_count(players: Sequence[Player]) -> int:
     """Get the number of players still alive."""
-    return sum(1 for p in players if p.joined and p.alive)
+    joined, alive, _ = get_seat_arrays(players)
+    return int(np.count_nonzero(joined & alive))
 
 
-def get_winner(players: List[Player]) -> Optional[Player]:
+def get_winner(players: Sequence[Player]) -> Optional[Player]:
     """Get the winning player (if only one alive)."""
-    for player in players:
-        if player.joined and player.alive:
-            return player
-    return None
+    joined, alive, _ = get_seat_arrays(players)
+    seats = np.flatnonzero(joined & alive)
+    return players[int(seats[0])] if seats.size else None
+
 
+def resolve_rounds_batch(choices: np.ndarray, alive: np.ndarray,
+                         variant: Optional[RuleVariant] = None
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve many rounds at once, without touching Player objects.
+    
+    Args:
+        choices: (games x seats) Choice values (0 = no choice)
+        alive: (games x seats) bool, seats that are joined and still alive
+        variant: Rule variant (default: the active one)
+    
+    Returns:
+        (eliminated, winning, losing, is_majority, is_no_choice) matching
+        judge_round: eliminated is a (games x seats) bool mask, winning/losing
+        are the first winning/losing Choice values (0 for draws and no-choice
+        rounds).
+    """
+    choices = np.asarray(choices, dtype=np.uint8)
+    alive = np.asarray(alive, dtype=np.bool_)
+    
+    has_choice = choices != Choice.NONE.value
+    chose = alive & has_choice
+    didnt = alive & ~has_choice
+    is_no_choice = chose.any(axis=1) & didnt.any(axis=1)
+    
+    variant = variant or get_variant()
+    slots = variant.value_slots[choices]
+    counts = np.stack([np.count_nonzero(chose & (slots == i), axis=1)
+                       for i in range(len(variant.choices))], axis=1)
+    keys = variant.table_keys(counts)
+    lose_masks = variant.lose_masks[keys]
+    is_majority = variant.majority[keys]
+    
+    # Seats whose choice is in the losing mask (non-playable choices never lose)
+    loses = (lose_masks[:, None] >> np.maximum(slots, 0).astype(np.uint32)) & 1
+    eliminated = np.where(is_no_choice[:, None], didnt, chose & (slots >= 0) & (loses == 1))
+    
+    winning = variant.first_winner[keys]
+    losing = variant.first_loser[keys]
+    winning[is_no_choice] = 0
+    losing[is_no_choice] = 0
+    is_majority &= ~is_no_choice
+    
+    return eliminated, winning, losing, is_majority, is_no_choice
@@ -0,0 +1,238 @@
+"""
+Headless tournament simulation for Rock Paper Scissors Arena.
+
+Plays complete games through core.rules with scripted choice strategies,
+spread over a process pool, and aggregates round counts, draw rates,
+survival curves and table throughput per seat count.
+"""
+
+import math
+import random
+from collections import Counter
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import COUNTDOWN_DURATION, SPEEDUP_THRESHOLD, ANIMATION_DURATION
+from core.enums import Choice
+from core.player import Player, PlayerRegistry, create_players
+from core.rules import resolve_round, get_alive_count
+from core.variants import get_variant, set_variant
+
+
+def playable() -> Tuple[Choice, ...]:
+    """Get the active variant's playable choices."""
+    return get_variant().choices
+
+
+def beaten_by(choice: Choice) -> Tuple[Choice, ...]:
+    """Get the choices that beat a choice in the active variant."""
+    variant = get_variant()
+    return tuple(c for c in variant.choices if choice in variant.beats[c])
+
+
+# Games are abandoned after this many rounds (e.g. when nobody ever chooses)
+MAX_ROUNDS = 200
+
+# Strategy signature: (rng, player, last_round) -> Choice, where last_round maps
+# player id -> choice for everyone alive in the previous round (empty at first)
+Strategy = Callable[[random.Random, Player, Dict[int, Choice]], Choice]
+
+
+def strategy_uniform(rng: random.Random, player: Player, last_round: Dict[int, Choice]) -> Choice:
+    """Pick uniformly at random."""
+    return rng.choice(playable())
+
+
+def strategy_rock_heavy(rng: random.Random, player: Player, last_round: Dict[int, Choice]) -> Choice:
+    """Favor rock, like many first-time players (half the picks; the rest share the other half)."""
+    choices = playable()
+    rest = 0.5 / (len(choices) - 1)
+    return rng.choices(choices, weights=[0.5 if c == Choice.ROCK else rest for c in choices])[0]
+
+
+def strategy_sticky(rng: random.Random, player: Player, last_round: Dict[int, Choice]) -> Choice:
+    """Usually repeat the previous choice."""
+    last = last_round.get(player.id, Choice.NONE)
+    if last != Choice.NONE and rng.random() < 0.6:
+        return last
+    return rng.choice(playable())
+
+
+def strategy_counter(rng: random.Random, player: Player, last_round: Dict[int, Choice]) -> Choice:
+    """Usually play whatever beats the previous round's most common choice."""
+    counts = Counter(c for c in last_round.values() if c != Choice.NONE)
+    if counts and rng.random() < 0.7:
+        beaters = beaten_by(counts.most_common(1)[0][0])
+        return beaters[0] if len(beaters) == 1 else rng.choice(beaters)
+    return rng.choice(playable())
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    'uniform': strategy_uniform,
+    'rock_heavy': strategy_rock_heavy,
+    'sticky': strategy_sticky,
+    'counter': strategy_counter,
+}
+
+
+def get_choose_time(reactions: List[float], countdown: float) -> float:
+    """
+    Get how long the choosing phase lasts, following GameScene's countdown:
+    once everyone has chosen with more than SPEEDUP_THRESHOLD seconds left,
+    the countdown skips to SPEEDUP_THRESHOLD.
+    """
+    last = max(reactions, default=countdown)
+    if countdown - last > SPEEDUP_THRESHOLD:
+        return last + SPEEDUP_THRESHOLD
+    return countdown
+
+
+def play_game(players: PlayerRegistry, rng: random.Random, strategy: Strategy,
+              reaction: float, countdown: float, continue_delay: float) -> Tuple[int, int, float, bool]:
+    """
+    Play one game with every seat joined.
+    Seats choose after a log-normal reaction time with the given median;
+    anyone slower than the countdown misses the round.
+    
+    Returns:
+        (rounds, draw_rounds, seconds, finished)
+    """
+    players.reset_for_new_game()
+    for player in players:
+        player.joined = True
+    
+    rounds = 0
+    draws = 0
+    seconds = 0.0
+    last_round: Dict[int, Choice] = {}
+    while get_alive_count(players) > 1 and rounds < MAX_ROUNDS:
+        players.reset_choices()
+        reactions = []
+        current: Dict[int, Choice] = {}
+        for player in players:
+            if not player.alive:
+                continue
+            reaction_time = rng.lognormvariate(math.log(reaction), 0.5)
+            reactions.append(reaction_time)
+            if reaction_time < countdown:
+                player.choice = strategy(rng, player, last_round)
+            current[player.id] = player.choice
+        
+        if not resolve_round(players):
+            draws += 1
+        rounds += 1
+        seconds += get_choose_time(reactions, countdown) + ANIMATION_DURATION + continue_delay
+        last_round = current
+    
+    return rounds, draws, seconds, get_alive_count(players) == 1
+
+
+def new_aggregate() -> dict:
+    """Get an empty aggregate for one seat count."""
+    return {'games': 0, 'finished': 0, 'rounds': 0, 'draw_rounds': 0,
+            'seconds': 0.0, 'round_histogram': Counter()}
+
+
+def merge_aggregate(total: dict, part: dict):
+    """Add a partial aggregate into a running total."""
+    for key in ('games', 'finished', 'rounds', 'draw_rounds', 'seconds'):
+        total[key] += part[key]
+    total['round_histogram'].update(part['round_histogram'])
+
+
+def simulate_chunk(task: tuple) -> Tuple[int, dict]:
+    """
+    Worker entry point: play a chunk of games for one seat count.
+    The chunk's RNG is seeded from (seed, seats, chunk index) so every run of
+    the same tasks reproduces, regardless of which worker picks them up.
+    The task names the rule variant, since pool processes don't share the
+    parent's active one.
+    """
+    seats, chunk, games, seed, strategy_name, variant, reaction, countdown, continue_delay = task
+    set_variant(variant)
+    rng = random.Random(f"{seed}:{seats}:{chunk}")
+    strategy = STRATEGIES[strategy_name]
+    players = create_players(seats)
+    
+    aggregate = new_aggregate()
+    for _ in range(games):
+        rounds, draws, seconds, finished = play_game(players, rng, strategy, reaction,
+                                                     countdown, continue_delay)
+        aggregate['games'] += 1
+        aggregate['finished'] += finished
+        aggregate['rounds'] += rounds
+        aggregate['draw_rounds'] += draws
+        aggregate['seconds'] += seconds
+        aggregate['round_histogram'][rounds] += 1
+    return seats, aggregate
+
+
+def summarize_aggregate(aggregate: dict, game_overhead: float) -> dict:
+    """
+    Turn an aggregate into the reported tables.
+    survival[k] is the probability a game is still running after k rounds.
+    """
+    games = aggregate['games']
+    rounds = aggregate['rounds']
+    histogram = aggregate['round_histogram']
+    longest = max(histogram) if histogram else 0
+    
+    survival = []
+    remaining = games
+    for k in range(longest + 1):
+        remaining -= histogram.get(k, 0)
+        survival.append(remaining / games if games else 0.0)
+    
+    game_seconds = (aggregate['seconds'] / games if games else 0.0) + game_overhead
+    return {
+        'games': games,
+        'unfinished': games - aggregate['finished'],
+        'expected_rounds': rounds / games if games else 0.0,
+        'draw_probability': aggregate['draw_rounds'] / rounds if rounds else 0.0,
+        'mean_game_seconds': game_seconds,
+        'games_per_hour': 3600 / game_seconds if game_seconds else 0.0,
+        'survival': survival,
+    }
+
+
+def run_tournament(seat_counts: Iterable[int], games: int, seed: int = 0,
+                   strategy: str = 'uniform', variant: Optional[str] = None, reaction: float = 1.5,
+                   countdown: float = COUNTDOWN_DURATION, continue_delay: float = 2.0,
+                   game_overhead: float = 20.0, workers: Optional[int] = None,
+                   chunk_size: int = 1000) -> Dict[int, dict]:
+    """
+    Simulate games for each seat count across a process pool.
+    Chunk results are merged as they stream in (in task order, so totals are
+    reproducible) and summarized per seat count.
+    
+    Args:
+        seat_counts: Table sizes to simulate
+        games: Games per seat count
+        seed: Base seed for every chunk's RNG
+        strategy: Name of a strategy in STRATEGIES
+        variant: Name of a rule variant in VARIANTS (None = the active variant)
+        reaction: Median seconds a player takes to choose
+        countdown: Round countdown in seconds (COUNTDOWN_DURATION by default)
+        continue_delay: Seconds between the battle animation and the next round
+        game_overhead: Seconds per game spent joining and on the victory screen
+        workers: Worker processes (None = one per CPU)
+        chunk_size: Games per worker task
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if variant is None:
+        variant = get_variant().name
+    
+    tasks = []
+    for seats in seat_counts:
+        for chunk, start in enumerate(range(0, games, chunk_size)):
+            tasks.append((seats, chunk, min(chunk_size, games - start), seed, strategy,
+                          variant, reaction, countdown, continue_delay))
+    
+    totals: Dict[int, dict] = {}
+    with Pool(workers) as pool:
+        for seats, part in pool.imap(simulate_chunk, tasks):
+            merge_aggregate(totals.setdefault(seats, new_aggregate()), part)
+    
+    return {seats: summarize_aggregate(aggregate, game_overhead)
+            for seats, aggregate in sorted(totals.items())}
@@ -0,0 +1,197 @@
+"""
+Rule variants for Rock Paper Scissors Arena.
+
+A variant is declared as a beat matrix: which choices each playable choice
+beats. From that it precomputes an outcome table, so judging a round is one
+lookup whatever the variant.
+
+Outcomes only depend on which choices are present and which choice, if any,
+has the unique largest (weighted) count, so the table is indexed by that
+pair instead of the full count vector (which would grow with the seat count):
+
+- Present choices that no other present choice beats win, and eliminate
+  every present choice they beat
+- If every present choice is beaten (a cycle, like all three of rock, paper
+  and scissors), a unique majority wins and eliminates what it beats
+- Otherwise, or if only one choice is present, the round is a draw
+
+Game activates one variant (RULE_VARIANT, or main.py --variant); the rules,
+input index and resolution scene read it with get_variant().
+"""
+
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.enums import Choice
+
+
+class RuleVariant:
+    """A set of playable choices, what each one beats and how they are shown."""
+    
+    def __init__(self, name: str, beats: Mapping[Choice, Sequence[Choice]],
+                 labels: Mapping[Choice, str], verbs: Mapping[Tuple[Choice, Choice], str],
+                 weights: Optional[Mapping[Choice, float]] = None, default_verb: str = "SLÅR"):
+        """
+        Args:
+            name: Variant name (e.g. for --variant)
+            beats: Each playable choice -> the choices it beats, in play order
+            labels: Each choice's name on screen
+            verbs: (winner, loser) -> verb on screen, e.g. "KROSSAR"
+            weights: Majority weight per choice (default 1.0 each)
+            default_verb: Verb for pairs missing from verbs
+        """
+        self.name = name
+        self.choices: Tuple[Choice, ...] = tuple(beats)
+        self.beats: Dict[Choice, Tuple[Choice, ...]] = {c: tuple(beaten) for c, beaten in beats.items()}
+        self.labels = dict(labels)
+        self.verbs = dict(verbs)
+        self.default_verb = default_verb
+        for choice, beaten in self.beats.items():
+            for other in beaten:
+                if other not in self.beats:
+                    raise ValueError(f"{name}: {choice.name} beats {other.name}, which is not playable")
+                if choice in self.beats[other]:
+                    raise ValueError(f"{name}: {choice.name} and {other.name} beat each other")
+        
+        n = len(self.choices)
+        self.slots = {c: i for i, c in enumerate(self.choices)}  # Choice -> count vector position
+        # Choice value -> count vector position (-1 if not playable)
+        self.value_slots = np.full(len(Choice), -1, dtype=np.int16)
+        for c, i in self.slots.items():
+            self.value_slots[c.value] = i
+        self.weights = np.array([(weights or {}).get(c, 1.0) for c in self.choices], dtype=np.float64)
+        # Bitmask of the choices each choice beats
+        self._beats_mask = [sum(1 << self.slots[b] for b in self.beats[c]) for c in self.choices]
+        self._build_table(n)
+    
+    def __repr__(self) -> str:
+        return f"RuleVariant({self.name!r}, {[c.name for c in self.choices]})"
+    
+    # Outcome table
+    
+    def _build_table(self, n: int):
+        """Fill win/lose masks, majority flags and first win/lose values for every (present mask, top choice) key."""
+        size = (1 << n) * (n + 1)
+        self.win_masks = np.zeros(size, dtype=np.uint32)
+        self.lose_masks = np.zeros(size, dtype=np.uint32)
+        self.majority = np.zeros(size, dtype=np.bool_)
+        # Choice value of the first winning/losing choice (0 for draws)
+        self.first_winner = np.zeros(size, dtype=np.uint8)
+        self.first_loser = np.zeros(size, dtype=np.uint8)
+        for present in range(1 << n):
+            if bin(present).count('1') < 2:
+                continue  # Nobody or one choice: always a draw
+            beaten = 0
+            for i in range(n):
+                if present >> i & 1:
+                    beaten |= self._beats_mask[i] & present
+            unbeaten = present & ~beaten
+            for top in range(-1, n):
+                key = present * (n + 1) + top + 1
+                if unbeaten:
+                    winners = unbeaten
+                    is_majority = False
+                elif top >= 0 and present >> top & 1:
+                    winners = 1 << top
+                    is_majority = True
+                else:
+                    continue
+                losers = 0
+                for i in range(n):
+                    if winners >> i & 1:
+                        losers |= self._beats_mask[i] & present
+                if losers:
+                    self.win_masks[key] = winners
+                    self.lose_masks[key] = losers
+                    self.majority[key] = is_majority
+                    self.first_winner[key] = self.mask_choices(winners)[0].value
+                    self.first_loser[key] = self.mask_choices(losers)[0].value
+    
+    def table_keys(self, counts: np.ndarray) -> np.ndarray:
+        """Get outcome table keys for (... x choices) count vectors."""
+        counts = np.asarray(counts)
+        n = len(self.choices)
+        present = ((counts > 0) << np.arange(n)).sum(axis=-1)
+        weighted = counts * self.weights
+        best = weighted.max(axis=-1, keepdims=True)
+        unique = ((weighted == best).sum(axis=-1) == 1) & (best[..., 0] > 0)
+        top = np.where(unique, weighted.argmax(axis=-1), -1)
+        return present * (n + 1) + top + 1
+    
+    def outcome(self, counts: Sequence[int]) -> Tuple[Tuple[Choice, ...], Tuple[Choice, ...], bool]:
+        """Get (winning choices, losing choices, is_majority) for one count vector; no losers is a draw."""
+        key = int(self.table_keys(np.asarray(counts)))
+        return (self.mask_choices(int(self.win_masks[key])), self.mask_choices(int(self.lose_masks[key])),
+                bool(self.majority[key]))
+    
+    def mask_choices(self, mask: int) -> Tuple[Choice, ...]:
+        """Get the choices set in a bitmask, in play order."""
+        return tuple(c for i, c in enumerate(self.choices) if mask >> i & 1)
+    
+    # Display
+    
+    def label(self, choice: Choice) -> str:
+        return self.labels.get(choice, "")
+    
+    def verb(self, winner: Choice, loser: Choice) -> str:
+        return self.verbs.get((winner, loser), self.default_verb)
+
+
+CLASSIC = RuleVariant(
+    'classic',
+    beats={
+        Choice.ROCK: (Choice.SCISSORS,),
+        Choice.PAPER: (Choice.ROCK,),
+        Choice.SCISSORS: (Choice.PAPER,),
+    },
+    labels={Choice.ROCK: "STEN", Choice.PAPER: "PÅSE", Choice.SCISSORS: "SAX"},
+    verbs={
+        (Choice.ROCK, Choice.SCISSORS): "KROSSAR",
+        (Choice.PAPER, Choice.ROCK): "TÄCKER",
+        (Choice.SCISSORS, Choice.PAPER): "KLIPPER",
+    },
+)
+
+# Rock paper scissors lizard Spock
+RPSLS = RuleVariant(
+    'rpsls',
+    beats={
+        Choice.ROCK: (Choice.SCISSORS, Choice.LIZARD),
+        Choice.PAPER: (Choice.ROCK, Choice.SPOCK),
+        Choice.SCISSORS: (Choice.PAPER, Choice.LIZARD),
+        Choice.LIZARD: (Choice.SPOCK, Choice.PAPER),
+        Choice.SPOCK: (Choice.SCISSORS, Choice.ROCK),
+    },
+    labels={Choice.ROCK: "STEN", Choice.PAPER: "PÅSE", Choice.SCISSORS: "SAX",
+            Choice.LIZARD: "ÖDLA", Choice.SPOCK: "SPOCK"},
+    verbs={
+        (Choice.ROCK, Choice.SCISSORS): "KROSSAR",
+        (Choice.ROCK, Choice.LIZARD): "KROSSAR",
+        (Choice.PAPER, Choice.ROCK): "TÄCKER",
+        (Choice.PAPER, Choice.SPOCK): "MOTBEVISAR",
+        (Choice.SCISSORS, Choice.PAPER): "KLIPPER",
+        (Choice.SCISSORS, Choice.LIZARD): "HALSHUGGER",
+        (Choice.LIZARD, Choice.SPOCK): "FÖRGIFTAR",
+        (Choice.LIZARD, Choice.PAPER): "ÄTER",
+        (Choice.SPOCK, Choice.SCISSORS): "KROSSAR",
+        (Choice.SPOCK, Choice.ROCK): "FÖRÅNGAR",
+    },
+)
+
+# Variants selectable by name (e.g. from the command line)
+VARIANTS: Dict[str, RuleVariant] = {variant.name: variant for variant in (CLASSIC, RPSLS)}
+
+_active = CLASSIC
+
+
+def get_variant() -> RuleVariant:
+    """Get the variant the game is played with."""
+    return _active
+
+
+def set_variant(variant) -> RuleVariant:
+    """Activate a variant (a RuleVariant or a name in VARIANTS)."""
+    global _active
+    _active = VARIANTS[variant] if isinstance(variant, str) else variant
+    return _active
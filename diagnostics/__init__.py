@@ -0,0 +1,20 @@
+"""
+Diagnostics module for Rock Paper Scissors Arena.
+"""
+
+from config.lazy import lazy_exports
+
+# Public name -> submodule it lives in
+_EXPORTS = {
+    'FrameProfiler': 'diagnostics.profiler',
+    'PHASES': 'diagnostics.profiler',
+    'LatencyTracker': 'diagnostics.latency',
+    'COMPONENTS': 'diagnostics.latency',
+    'StartupProfiler': 'diagnostics.startup',
+}
+
+__all__ = ['FrameProfiler', 'PHASES', 'LatencyTracker', 'COMPONENTS', 'StartupProfiler']
+
+# Imported on first use, so main.py can load the startup profiler before
+# anything it measures (numpy, via diagnostics.latency)
+__getattr__ = lazy_exports(globals(), _EXPORTS)
@@ -0,0 +1,126 @@
+"""
+Input-to-display latency tracking for Rock Paper Scissors Arena.
+
+Each key press or joystick input is stamped when Game.handle_events dequeues
+it. If handling it changes a seat's state (joining or locking in a choice),
+the change is kept pending until the next present, which is the first frame
+that can show it. Headless runs never present, so they drop pending changes
+after each update instead.
+Latencies are split into the loop phases they were spent in:
+
+    queue    time since the previous poll (the key waited at most this long;
+             includes the frame cap wait in clock.tick)
+    events   dequeue until the end of event handling
+    update   simulation steps
+    draw     rendering the frame
+    present  flip / display update
+"""
+
+import json
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import PROFILER_WINDOW
+from diagnostics.profiler import PhaseStats
+
+# Latency components in loop order
+COMPONENTS = ['queue', 'events', 'update', 'draw', 'present']
+
+
+class LatencyTracker:
+    """Measures the time from a key press being dequeued to the frame showing its effect."""
+    
+    def __init__(self, enabled: bool = False, export_path: Optional[str] = None,
+                 window: int = PROFILER_WINDOW):
+        self.enabled = enabled
+        self.export_path = export_path
+        self.window = window
+        # (scene, seat) -> total latency stats, plus summed components
+        self.stats: Dict[Tuple[str, int], PhaseStats] = {}
+        self.components: Dict[Tuple[str, int], Dict[str, float]] = {}
+        self._pending: List[Tuple[str, int, float, float]] = []  # scene, seat, dequeued, queue
+        self._poll_time = 0.0
+        self._queue_time = 0.0
+        self._events_done = 0.0
+        self._update_done = 0.0
+        self._draw_done = 0.0
+    
+    def begin_poll(self):
+        """Call right after the event queue was read."""
+        now = time.perf_counter()
+        self._queue_time = now - self._poll_time if self._poll_time else 0.0
+        self._poll_time = now
+    
+    def snapshot(self, players: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+        """Capture the input-driven seat state before an event is handled."""
+        state = getattr(players, 'state', None)
+        if state is not None:
+            return state.joined.copy(), state.choice.copy()
+        return (np.array([p.joined for p in players], dtype=np.bool_),
+                np.array([p.choice.value for p in players], dtype=np.uint8))
+    
+    def key_handled(self, players: Sequence, before: Tuple[np.ndarray, np.ndarray], scene: str):
+        """Compare seat state with the snapshot and start tracking any seat that changed."""
+        joined, choice = self.snapshot(players)
+        changed = np.flatnonzero((joined != before[0]) | (choice != before[1]))
+        for index in changed.tolist():
+            self._pending.append((scene, players[index].id, self._poll_time, self._queue_time))
+    
+    def events_done(self):
+        self._events_done = time.perf_counter()
+    
+    def update_done(self):
+        self._update_done = time.perf_counter()
+    
+    def draw_done(self):
+        self._draw_done = time.perf_counter()
+    
+    def discard_pending(self):
+        """Drop pending changes; call when no frame will be presented to show them."""
+        self._pending.clear()
+    
+    def presented(self):
+        """Call after the frame reached the display; resolves every pending change."""
+        if not self._pending:
+            return
+        now = time.perf_counter()
+        for scene, seat, dequeued, queue in self._pending:
+            key = (scene, seat)
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = PhaseStats(self.window)
+                self.components[key] = dict.fromkeys(COMPONENTS, 0.0)
+            # The queue wait is only bounded by the poll interval, so count half of it
+            parts = {
+                'queue': queue / 2,
+                'events': self._events_done - dequeued,
+                'update': self._update_done - self._events_done,
+                'draw': self._draw_done - self._update_done,
+                'present': now - self._draw_done,
+            }
+            stats.add((now - dequeued + parts['queue']) * 1000)
+            totals = self.components[key]
+            for name, seconds in parts.items():
+                totals[name] += max(0.0, seconds) * 1000
+        self._pending.clear()
+    
+    def summary(self) -> dict:
+        """Get latency distributions and mean component breakdowns per scene and seat."""
+        report: Dict[str, dict] = {}
+        for (scene, seat), stats in sorted(self.stats.items()):
+            agg = stats.summary()
+            agg['components'] = {name: total / stats.count
+                                 for name, total in self.components[(scene, seat)].items()}
+            report.setdefault(scene, {})[str(seat)] = agg
+        return report
+    
+    def export(self, path: Optional[str] = None):
+        """Write the summary as JSON."""
+        path = path or self.export_path
+        if not path or not self.stats:
+            return
+        with open(path, 'w') as f:
+            json.dump({'timestamp': time.time(), 'components': COMPONENTS,
+                       'scenes': self.summary()}, f, indent=2)
@@ -0,0 +1,50 @@
+"""
+On-screen profiler overlay for Rock Paper Scissors Arena.
+"""
+
+import pygame
+
+from config.colors import COLORS
+from diagnostics.profiler import FrameProfiler, PHASES
+from graphics.fonts import font_tiny
+
+# Overlay layout
+OVERLAY_POS = (10, 10)
+OVERLAY_SIZE = (260, 150)
+GRAPH_HEIGHT = 60
+GRAPH_MAX_MS = 50.0
+
+
+def draw_profiler_overlay(surface: pygame.Surface, profiler: FrameProfiler) -> pygame.Rect:
+    """Draw FPS, a frame-time graph and per-phase timings. Returns the overlay rect."""
+    x, y = OVERLAY_POS
+    width, height = OVERLAY_SIZE
+    
+    panel = pygame.Surface((width, height), pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 180))
+    
+    # Frame-time graph, newest on the right, with a 60 fps reference line
+    graph_top = height - GRAPH_HEIGHT - 6
+    frame_times = list(profiler.frame_times)[-(width - 12):]
+    for i, ms in enumerate(frame_times):
+        bar = min(GRAPH_HEIGHT, int(ms / GRAPH_MAX_MS * GRAPH_HEIGHT))
+        color = COLORS['green'] if ms <= 16.7 else COLORS['orange'] if ms <= 33.3 else COLORS['red']
+        px = 6 + (width - 12 - len(frame_times)) + i
+        pygame.draw.line(panel, color, (px, graph_top + GRAPH_HEIGHT),
+                         (px, graph_top + GRAPH_HEIGHT - bar))
+    ref_y = graph_top + GRAPH_HEIGHT - int(16.7 / GRAPH_MAX_MS * GRAPH_HEIGHT)
+    pygame.draw.line(panel, COLORS['silver'], (6, ref_y), (width - 6, ref_y))
+    
+    surface.blit(panel, (x, y))
+    
+    # Text lines change every frame, so render them directly instead of
+    # churning the shared text cache
+    font = font_tiny()
+    header = font.render(f"{profiler.get_fps():5.1f} FPS  {profiler.last_scene}", True, COLORS['white'])
+    surface.blit(header, (x + 8, y + 6))
+    for i, phase in enumerate(PHASES):
+        ms = profiler.last_phases.get(phase, 0.0)
+        row = font.render(f"{phase} {ms:5.2f}", True, COLORS['silver'])
+        surface.blit(row, (x + 8 + (i % 2) * 125, y + 30 + (i // 2) * 20))
+    
+    return pygame.Rect(x, y, width, height)
@@ -0,0 +1,167 @@
+"""
+Per-phase frame profiler for Rock Paper Scissors Arena.
+
+Game.run only calls into the profiler when it is enabled, so leaving it
+compiled in costs a single attribute check per frame.
+"""
+
+import bisect
+import csv
+import json
+import math
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from config.settings import PROFILER_WINDOW, PROFILER_EXPORT_INTERVAL
+
+# Frame phases timed by Game.run, in loop order ('idle' builds scenes while
+# the menu waits, see Game.build_idle_scene)
+PHASES = ['events', 'update', 'draw', 'flip', 'idle', 'tick']
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+HISTOGRAM_BOUNDS_MS = [0.25, 0.5, 1, 2, 4, 8, 16.7, 33.3, 66.7, 100]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Get p50/p95/p99/max/mean of a list of values."""
+    ordered = sorted(values)
+    return {
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1] if ordered else 0.0,
+        'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+    }
+
+
+class PhaseStats:
+    """Rolling window and cumulative histogram for one phase of one scene."""
+    
+    def __init__(self, window: int):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.histogram: List[int] = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def add(self, ms: float):
+        self.samples.append(ms)
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+    
+    def summary(self) -> dict:
+        """Get aggregates: cumulative count/mean/max, windowed percentiles and the histogram."""
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'mean': self.total_ms / self.count if self.count else 0.0,
+            'p50': percentile(ordered, 50),
+            'p95': percentile(ordered, 95),
+            'p99': percentile(ordered, 99),
+            'max': self.max_ms,
+            'histogram': list(self.histogram),
+        }
+
+
+class FrameProfiler:
+    """Times each frame phase per scene and periodically exports aggregates."""
+    
+    def __init__(self, enabled: bool = False, export_path: Optional[str] = None,
+                 export_interval: float = PROFILER_EXPORT_INTERVAL,
+                 window: int = PROFILER_WINDOW):
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self.window = window
+        self.stats: Dict[str, Dict[str, PhaseStats]] = {}
+        self.frame_times: Deque[float] = deque(maxlen=window)  # Total ms per frame
+        self.last_phases: Dict[str, float] = {}
+        self.last_scene = ''
+        self._last_export = time.perf_counter()
+    
+    def toggle_overlay(self):
+        """Show or hide the overlay; showing it also starts profiling."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+    
+    def record_frame(self, scene: str, phases: Dict[str, float]):
+        """Record one frame's phase durations (in ms) for a scene."""
+        scene_stats = self.stats.get(scene)
+        if scene_stats is None:
+            scene_stats = {phase: PhaseStats(self.window) for phase in PHASES}
+            scene_stats['frame'] = PhaseStats(self.window)
+            self.stats[scene] = scene_stats
+        
+        total = 0.0
+        for phase, ms in phases.items():
+            scene_stats[phase].add(ms)
+            total += ms
+        scene_stats['frame'].add(total)
+        self.frame_times.append(total)
+        self.last_phases = phases
+        self.last_scene = scene
+        
+        if self.export_path and time.perf_counter() - self._last_export >= self.export_interval:
+            self.export()
+    
+    def get_fps(self) -> float:
+        """Average FPS over the last second's worth of frames."""
+        recent = list(self.frame_times)[-60:]
+        total = sum(recent)
+        return 1000 * len(recent) / total if total else 0.0
+    
+    def summary(self) -> dict:
+        """Get aggregates for every scene and phase."""
+        return {
+            scene: {phase: stats.summary() for phase, stats in scene_stats.items()}
+            for scene, scene_stats in self.stats.items()
+        }
+    
+    def export(self, path: Optional[str] = None):
+        """
+        Write the aggregates to a file.
+        JSON files are overwritten with a full snapshot; CSV files get one row
+        per scene and phase appended, so they build up a time series.
+        """
+        path = path or self.export_path
+        self._last_export = time.perf_counter()
+        if not path:
+            return
+        
+        timestamp = time.time()
+        summary = self.summary()
+        if path.endswith('.csv'):
+            new_file = not os.path.exists(path)
+            with open(path, 'a', newline='') as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(['timestamp', 'scene', 'phase', 'count',
+                                     'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+                for scene, phases in summary.items():
+                    for phase, agg in phases.items():
+                        writer.writerow([f"{timestamp:.3f}", scene, phase, agg['count'],
+                                         f"{agg['mean']:.4f}", f"{agg['p50']:.4f}",
+                                         f"{agg['p95']:.4f}", f"{agg['p99']:.4f}",
+                                         f"{agg['max']:.4f}"])
+        else:
+            with open(path, 'w') as f:
+                json.dump({
+                    'timestamp': timestamp,
+                    'histogram_bounds_ms': HISTOGRAM_BOUNDS_MS,
+                    'scenes': summary,
+                }, f, indent=2)
@@ -0,0 +1,132 @@
+"""
+Startup profiling for Rock Paper Scissors Arena.
+
+Measures boot-to-playable time: how long every module import takes (like
+python -X importtime, but collected in-process) and how long each startup
+phase of Game takes until the first frame is presented. Enabled with
+main.py --startup-profile, which prints the report once the menu is up.
+"""
+
+import importlib.abc
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class _TimedLoader:
+    """Wraps a module loader to time creating and executing the module."""
+    
+    def __init__(self, loader, profiler: 'StartupProfiler', name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+        self._create_seconds = 0.0
+    
+    def __getattr__(self, name):
+        # Everything else (get_data, is_package...) goes to the real loader
+        return getattr(self._loader, name)
+    
+    def create_module(self, spec):
+        start = time.perf_counter()
+        module = self._loader.create_module(spec)
+        self._create_seconds = time.perf_counter() - start
+        return module
+    
+    def exec_module(self, module):
+        profiler = self._profiler
+        profiler._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            inclusive = time.perf_counter() - start + self._create_seconds
+            children = profiler._children.pop()
+            if profiler._children:
+                profiler._children[-1] += inclusive
+            profiler.imports.append((self._name, inclusive * 1000, (inclusive - children) * 1000))
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path hook that finds modules with the other finders and times their loaders."""
+    
+    def __init__(self, profiler: 'StartupProfiler'):
+        self._profiler = profiler
+    
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self._profiler, name)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import times and startup phase times up to the first frame."""
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.imports: List[Tuple[str, float, float]] = []  # module, inclusive ms, self ms
+        self.phases: List[Tuple[str, float]] = []          # phase, ms since the previous mark
+        self.first_frame_ms: Optional[float] = None
+        self._children: List[float] = []
+        self._last_mark = self.start
+        self._timer: Optional[_ImportTimer] = None
+    
+    def install(self):
+        """Start timing imports (call before importing the game)."""
+        if self.enabled and self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+    
+    def uninstall(self):
+        if self._timer is not None:
+            sys.meta_path.remove(self._timer)
+            self._timer = None
+    
+    def mark(self, phase: str):
+        """Close a startup phase: it took the time since the previous mark."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last_mark) * 1000))
+        self._last_mark = now
+    
+    def first_frame(self):
+        """Call once the first frame is on screen: stops profiling and prints the report."""
+        if not self.enabled or self.first_frame_ms is not None:
+            return
+        self.mark('first frame')
+        self.first_frame_ms = (time.perf_counter() - self.start) * 1000
+        self.uninstall()
+        sys.stdout.write(self.report() + '\n')
+    
+    def package_totals(self) -> Dict[str, float]:
+        """Get self import time (ms) summed per top-level package."""
+        totals: Dict[str, float] = {}
+        for name, _, self_ms in self.imports:
+            package = name.split('.')[0]
+            totals[package] = totals.get(package, 0.0) + self_ms
+        return totals
+    
+    def report(self, top: int = 20) -> str:
+        """Format the phase breakdown, the slowest imports and per-package import totals."""
+        lines = ["Startup profile"]
+        if self.first_frame_ms is not None:
+            lines.append(f"  time to first frame: {self.first_frame_ms:8.1f} ms")
+        lines.append("  phases:")
+        for phase, ms in self.phases:
+            lines.append(f"    {phase:<28} {ms:8.1f} ms")
+        
+        lines.append(f"  slowest imports ({len(self.imports)} modules, self / inclusive):")
+        for name, inclusive, self_ms in sorted(self.imports, key=lambda item: -item[2])[:top]:
+            lines.append(f"    {name:<40} {self_ms:8.1f} {inclusive:8.1f} ms")
+        
+        lines.append("  imports per package:")
+        for package, ms in sorted(self.package_totals().items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"    {package:<28} {ms:8.1f} ms")
+        return '\n'.join(lines)
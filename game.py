@@ -3,46 +3,187 @@ Rock Paper Scissors - Local Multiplayer Arena
 Main game class managing scenes and game state.
 """
 
+import random
+import time
 import pygame
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
-from core.enums import SceneType
+from config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, DISPLAY_SIZE, FULLSCREEN, SMOOTH_SCALING, SEAT_COUNT,
+    SIMULATION_HZ, DIRTY_RECT_RENDERING, TARGET_FPS, PROFILER_ENABLED, PROFILER_EXPORT_PATH,
+    LATENCY_TRACKING, ASSET_PACK_ENABLED, RULE_VARIANT,
+)
+from core.clock import SimulationClock, RealClock, FrameClock
+from core.enums import Choice, SceneType
+from core.input_dispatch import INPUT_EVENTS, input_index
 from core.player import create_players
-from core.rules import resolve_round, get_round_choices, get_choosers, get_non_choosers
+from core.rules import judge_round, apply_round, get_winner
+from core.variants import RuleVariant, set_variant
 from graphics.fonts import init_fonts
 from graphics.background import create_background_surface
-from scenes import MenuScene, GameScene, ResolutionScene, VictoryScene
+from graphics.asset_pack import get_fingerprint, load_asset_pack, save_asset_pack
+from graphics.player_slot import prerender_slot_icons
+from scenes.base import Scene
+from scenes.registry import SceneRegistry, load_scene_class
+from diagnostics.profiler import FrameProfiler
+from diagnostics.latency import LatencyTracker
+from diagnostics.startup import StartupProfiler
+
+# Optional features are imported only when they are used
+if TYPE_CHECKING:
+    from recording.input_log import InputRecorder
+    from recording.frame_recorder import FrameRecorder
+    from recording.frame_publisher import FramePublisher
+    from recording.match_history import MatchHistory
+    from network.server import RemoteServer
 
 
 class Game:
     """Main game class managing scenes and game state."""
     
-    def __init__(self):
+    def __init__(self, profiler: Optional[FrameProfiler] = None, seat_count: int = SEAT_COUNT,
+                 seed: Optional[int] = None, record_path: Optional[str] = None,
+                 frame_clock: Optional[FrameClock] = None,
+                 latency: Optional[LatencyTracker] = None,
+                 server: Optional['RemoteServer'] = None,
+                 capture: Optional['FrameRecorder'] = None,
+                 publisher: Optional['FramePublisher'] = None,
+                 startup: Optional[StartupProfiler] = None,
+                 history: Optional['MatchHistory'] = None,
+                 variant: Optional[RuleVariant] = None,
+                 asset_pack: bool = ASSET_PACK_ENABLED):
+        self.startup = startup or StartupProfiler()
+        self.startup.mark('imports')
+        # Before anything reads the variant's choices (slot icons, input index)
+        self.variant = set_variant(variant or RULE_VARIANT)
+        
         # Initialize Pygame
         pygame.init()
         pygame.font.init()
         init_fonts()
+        self.startup.mark('pygame and fonts')
         
-        # Screen setup
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Screen setup: scenes draw to self.screen at the logical resolution,
+        # which is scaled to the physical display once per frame when they differ.
+        # Only the menu is built up front; other scenes are built while the
+        # menu is idle, or on first use.
+        self.scenes = SceneRegistry(self._build_scene)
+        self.fullscreen = FULLSCREEN
+        self.smooth_scaling = SMOOTH_SCALING
+        self._offscreen: Optional[pygame.Surface] = None
+        self.set_display_mode(DISPLAY_SIZE)
         pygame.display.set_caption("Rock Paper Scissors Arena")
+        self.startup.mark('display')
         
         # Game state
-        self.players = create_players()
-        self.clock = pygame.time.Clock()
+        self.players = create_players(seat_count)
+        self.clock = frame_clock or RealClock(TARGET_FPS)
+        self.sim_clock = SimulationClock()
+        self.frame_time = 0.0  # Seconds the last frame took, as reported by the frame clock
+        self.frames = 0
+        self.render_enabled = True  # False skips drawing entirely (headless runs)
         self.running = True
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.profiler = profiler or FrameProfiler(PROFILER_ENABLED, PROFILER_EXPORT_PATH)
+        self.latency = latency or LatencyTracker(LATENCY_TRACKING)
+        self.startup.mark('players and clocks')
         
-        # Pre-render background
-        self.bg_surface = create_background_surface()
+        # Pre-render background, or take it (and the sprite caches) from the asset pack.
+        # Measurement and headless tools pass asset_pack=False, so their numbers
+        # don't depend on whatever pack this machine has cached.
+        self.asset_fingerprint = get_fingerprint(seat_count) if asset_pack else None
+        self.assets = load_asset_pack(self.asset_fingerprint) if asset_pack else None
+        if self.assets and self.assets.background is not None:
+            self.assets.install()
+            self.bg_surface = self.assets.background.convert()
+        else:
+            self.assets = None
+            self.bg_surface = create_background_surface()
+        # Without a valid pack, write one once the first frame has filled the caches
+        self._save_assets_after_frame = asset_pack and self.assets is None
+        self.assets_built = self._save_assets_after_frame
+        self.startup.mark('background and asset pack')
+        
+        # Effects RNG seed, so recorded games replay with identical particles
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
         
-        # Initialize scenes
-        self.scenes = {
-            SceneType.MENU: MenuScene(self.screen, self.bg_surface),
-            SceneType.GAME: GameScene(self.screen, self.bg_surface),
-            SceneType.RESOLUTION: ResolutionScene(self.screen, self.bg_surface),
-            SceneType.VICTORY: VictoryScene(self.screen, self.bg_surface),
-        }
         self.current_scene_type = SceneType.MENU
+        self.scene_start_step = 0  # Simulation step the current scene started on
+        self.scenes[SceneType.MENU] = self._build_scene(SceneType.MENU)
+        self.startup.mark('menu scene')
+        
+        # Optional input recording for bug reports and replay benchmarks
+        self.recorder: Optional['InputRecorder'] = None
+        if record_path:
+            from recording.input_log import InputRecorder
+            self.recorder = InputRecorder(record_path, SIMULATION_HZ, seat_count, self.seed)
+        
+        # Optional match history (games, rounds, choices and reaction times)
+        self.history = history
+        self.history_stats: Optional[dict] = None
+        
+        # Optional remote players; their presses are drained with the pygame events
+        self.server = server
+        
+        # Optional video capture of every presented frame (at the logical resolution)
+        self.capture = capture
+        self.capture_stats: Optional[dict] = None  # Filled in when the capture is closed
+        
+        # Optional shared-memory frame output for spectator processes
+        self.publisher = publisher
+    
+    def _build_scene(self, scene_type: SceneType) -> Scene:
+        """Create a scene (called by the scene registry on first use)."""
+        scene = load_scene_class(scene_type)(self.screen, self.bg_surface, self.sim_clock)
+        if scene_type == SceneType.RESOLUTION:
+            scene.particles.seed(self.seed)
+        elif scene_type == SceneType.VICTORY:
+            scene.confetti.seed(self.seed + 1)
+        return scene
+    
+    def set_display_mode(self, size: Optional[Tuple[int, int]] = None,
+                         fullscreen: Optional[bool] = None):
+        """
+        (Re)create the window. Scenes and their caches stay at the logical
+        resolution, so a mode change only swaps the render target and
+        recomputes the letterbox viewport.
+        """
+        if fullscreen is not None:
+            self.fullscreen = fullscreen
+        if self.fullscreen:
+            self.display = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.display = pygame.display.set_mode(size or (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                   pygame.RESIZABLE)
+        self._configure_viewport()
+    
+    def _configure_viewport(self):
+        """Pick the render target and scaled viewport for the current display size."""
+        logical = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        width, height = self.display.get_size()
+        if (width, height) == logical:
+            # Native size: draw straight into the display, no scale pass
+            self.viewport = None
+            target = self.display
+        else:
+            scale = min(width / SCREEN_WIDTH, height / SCREEN_HEIGHT)
+            viewport = pygame.Rect(0, 0, round(SCREEN_WIDTH * scale), round(SCREEN_HEIGHT * scale))
+            viewport.center = (width // 2, height // 2)
+            self.viewport = viewport
+            if self._offscreen is None:
+                self._offscreen = pygame.Surface(logical).convert()
+            target = self._offscreen
+            self.display.fill((0, 0, 0))
+        
+        self.screen = target
+        for scene in self.scenes.values():
+            scene.screen = target
+            scene.invalidate()
+        self._display_stale = True  # Push the whole window (letterbox bars included) once
+    
+    def toggle_fullscreen(self):
+        """Switch between windowed and fullscreen without restarting."""
+        self.set_display_mode(fullscreen=not self.fullscreen)
     
     @property
     def current_scene(self):
@@ -53,80 +194,291 @@ class Game:
         """Handle scene transitions with appropriate setup."""
         old_scene = self.current_scene_type
         self.current_scene_type = new_scene
+        self.scene_start_step = self.sim_clock.steps
+        self.current_scene.invalidate()
+        if self.recorder:
+            self.recorder.record_scene(self.sim_clock.steps, new_scene)
         
         if new_scene == SceneType.MENU:
             # Reset all players for a new game
-            for player in self.players:
-                player.reset_for_new_game()
+            self.players.reset_for_new_game()
             self.scenes[SceneType.GAME].reset_game()
         
         elif new_scene == SceneType.GAME:
             # Reset choices and start countdown
-            for player in self.players:
-                player.reset_choice()
+            self.players.reset_choices()
             
             if old_scene == SceneType.MENU:
                 self.scenes[SceneType.GAME].reset_game()
+                if self.history:
+                    self.history.start_game(self.players, self.seed)
             else:
                 self.scenes[SceneType.GAME].reset_round()
             
             self.scenes[SceneType.GAME].start_countdown()
+            if self.history:
+                self.history.start_round()
         
         elif new_scene == SceneType.RESOLUTION:
-            # Get the winning/losing choices before resolving (for animation)
-            winning_choice, losing_choice, is_majority, is_no_choice = get_round_choices(self.players)
-            
-            # Set up battle animation BEFORE resolving (need player states)
-            if is_no_choice:
-                # Special case: players who didn't choose get eliminated
-                choosers = get_choosers(self.players)
-                non_choosers = get_non_choosers(self.players)
-                self.scenes[SceneType.RESOLUTION].set_no_choice_battle(choosers, non_choosers)
-            else:
-                self.scenes[SceneType.RESOLUTION].set_battle_choices(winning_choice, losing_choice, is_majority)
-                self.scenes[SceneType.RESOLUTION].set_battle_players(self.players)
-            
-            # Resolve the round and set eliminated players
-            eliminated = resolve_round(self.players)
-            self.scenes[SceneType.RESOLUTION].set_eliminated(eliminated)
+            # Judge the round once; the animation, eliminations and history all use the result
+            result = judge_round(self.players)
+            apply_round(result)
+            self.scenes[SceneType.RESOLUTION].set_result(result)
+            if self.history:
+                self.history.record_round(result)
         
         elif new_scene == SceneType.VICTORY:
             # Set the winner
             self.scenes[SceneType.VICTORY].set_winner(self.players)
+            if self.history:
+                self.history.finish_game(get_winner(self.players))
     
     def handle_events(self):
         """Handle all pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                return
-            
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                self.running = False
+        events = pygame.event.get()
+        if self.latency.enabled:
+            self.latency.begin_poll()
+        if self.server:
+            events.extend(self.server.poll())
+        for event in events:
+            self.handle_event(event)
+            if not self.running:
                 return
-            
-            # Let current scene handle the event
+        if self.latency.enabled:
+            self.latency.events_done()
+    
+    def handle_event(self, event: pygame.event.Event):
+        """Handle one event: window and debug keys here, the rest in the current scene."""
+        if event.type == pygame.QUIT:
+            self.running = False
+            return
+        
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.running = False
+            return
+        
+        if event.type == pygame.VIDEORESIZE:
+            # The display surface already has the new size
+            self.display = pygame.display.get_surface()
+            self._configure_viewport()
+            return
+        
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            self.toggle_fullscreen()
+            return
+        
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+            self.current_scene.invalidate()
+            return
+        
+        if event.type == pygame.JOYDEVICEADDED:
+            input_index.add_device(event.device_index)
+            return
+        
+        if event.type == pygame.JOYDEVICEREMOVED:
+            input_index.remove_device(event.instance_id)
+            return
+        
+        if self.recorder and event.type in INPUT_EVENTS:
+            self.recorder.record_input(self.sim_clock.steps - self.scene_start_step,
+                                       input_index.input_code(event), getattr(event, 'mod', 0))
+        
+        # Let current scene handle the event
+        if self.latency.enabled and event.type in INPUT_EVENTS:
+            before = self.latency.snapshot(self.players)
+            new_scene = self.current_scene.handle_event(event, self.players)
+            self.latency.key_handled(self.players, before, self.current_scene_type.name)
+        else:
             new_scene = self.current_scene.handle_event(event, self.players)
-            if new_scene:
-                self.change_scene(new_scene)
+        if self.history and self.current_scene_type == SceneType.GAME and event.type in INPUT_EVENTS:
+            # Reaction times: steps since the countdown started
+            self.history.note_choices(self.players, self.sim_clock.steps - self.scene_start_step)
+        if new_scene:
+            self.change_scene(new_scene)
+    
+    def update(self, frame_time: float):
+        """
+        Advance game state by the real time the last frame took.
+        The scene is updated in fixed simulation steps, so gameplay timing
+        is the same at any render rate.
+        """
+        self.sim_clock.accumulate(frame_time)
+        while self.sim_clock.step():
+            self.update_step()
+        if self.latency.enabled:
+            self.latency.update_done()
+            if not self.render_enabled:
+                # Nothing will be presented, so no pending change can be shown
+                self.latency.discard_pending()
     
-    def update(self):
-        """Update game state."""
-        new_scene = self.current_scene.update(self.players)
+    def update_step(self):
+        """Run one fixed simulation step of the current scene."""
+        new_scene = self.current_scene.update(self.players, self.sim_clock.dt)
         if new_scene:
             self.change_scene(new_scene)
     
+    def publish_state(self):
+        """Offer the table state to remote players (only changes are sent)."""
+        if self.server:
+            self.server.publish(self.remote_state())
+    
+    def remote_state(self) -> dict:
+        """Get the table state broadcast to remote players (choices stay secret)."""
+        state = self.players.state
+        game_scene = self.scenes.get(SceneType.GAME)  # Not built until the first game
+        countdown = None
+        if self.current_scene_type == SceneType.GAME:
+            countdown = int(game_scene.get_remaining_time()) + 1
+        return {
+            'scene': self.current_scene_type.name,
+            'round': game_scene.round_number if game_scene else 1,
+            'countdown': countdown,
+            'joined': state.joined.tolist(),
+            'alive': state.alive.tolist(),
+            'chosen': (state.choice != Choice.NONE.value).tolist(),
+        }
+    
+    def set_dirty_rendering(self, enabled: bool):
+        """Switch between retained-mode dirty-rect rendering and full redraws."""
+        self.dirty_rendering = enabled
+        self.current_scene.invalidate()
+    
+    def render(self) -> Optional[List[pygame.Rect]]:
+        """
+        Render the current scene to the screen surface.
+        Returns the changed rects in retained mode, or None for a full frame.
+        """
+        scene = self.current_scene
+        # The overlay is drawn straight onto the frame, so it needs full redraws
+        if self.dirty_rendering and scene.supports_retained and not self.profiler.overlay_visible:
+            dirty_rects = scene.draw_retained(self.players)
+        else:
+            scene.draw(self.players)
+            if self.profiler.overlay_visible:
+                from diagnostics.overlay import draw_profiler_overlay
+                draw_profiler_overlay(self.screen, self.profiler)
+            dirty_rects = None
+        if self.latency.enabled:
+            self.latency.draw_done()
+        return dirty_rects
+    
+    def present(self, dirty_rects: Optional[List[pygame.Rect]]):
+        """Push the rendered frame to the display, scaling it if needed."""
+        if self.viewport is not None and (dirty_rects is None or dirty_rects or self._display_stale):
+            # Scaling sub-rects separately would shift filtered edges against
+            # their neighbours, so any change rescales the whole frame once
+            self.scale_to_display()
+            dirty_rects = None
+        if dirty_rects is None or self._display_stale:
+            self._display_stale = False
+            pygame.display.flip()
+        elif dirty_rects:
+            # Retained mode: only push the rectangles that changed
+            pygame.display.update(dirty_rects)
+        if self.latency.enabled:
+            self.latency.presented()
+        if self.capture:
+            self.capture.capture(self.screen)
+        if self.publisher:
+            self.publisher.publish(self.screen)
+        if self._save_assets_after_frame:
+            self._save_assets_after_frame = False
+            self.save_assets()
+        self.startup.first_frame()
+    
+    def save_assets(self):
+        """Write the asset pack from the current background and sprite caches."""
+        prerender_slot_icons(self.players)
+        try:
+            save_asset_pack(self.asset_fingerprint, self.bg_surface)
+        except OSError:
+            pass  # e.g. a read-only cabinet image: every start just redraws
+    
+    def scale_to_display(self):
+        """Scale the logical frame into the letterboxed display viewport in one pass."""
+        scale = pygame.transform.smoothscale if self.smooth_scaling else pygame.transform.scale
+        scale(self.screen, self.viewport.size, self.display.subsurface(self.viewport))
+    
     def draw(self):
         """Draw current scene."""
-        self.current_scene.draw(self.players)
-        pygame.display.flip()
-    
-    def run(self):
-        """Main game loop."""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+        self.present(self.render())
+    
+    def build_idle_scene(self):
+        """Build one not-yet-built scene while the menu waits for players."""
+        if self.current_scene_type == SceneType.MENU and self.scenes.pending:
+            self.scenes.build_next()
+    
+    def run_profiled_frame(self):
+        """Run one frame of the main loop, timing each phase."""
+        clock = time.perf_counter
+        scene_name = self.current_scene_type.name
+        t0 = clock()
+        self.handle_events()
+        t1 = clock()
+        self.update(self.frame_time)
+        self.publish_state()
+        t2 = clock()
+        if self.render_enabled:
+            dirty_rects = self.render()
+            t3 = clock()
+            self.present(dirty_rects)
+        else:
+            t3 = clock()
+        t4 = clock()
+        self.build_idle_scene()
+        t5 = clock()
+        self.frame_time = self.clock.tick()
+        t6 = clock()
+        self.profiler.record_frame(scene_name, {
+            'events': (t1 - t0) * 1000,
+            'update': (t2 - t1) * 1000,
+            'draw': (t3 - t2) * 1000,
+            'flip': (t4 - t3) * 1000,
+            'idle': (t5 - t4) * 1000,
+            'tick': (t6 - t5) * 1000,
+        })
+    
+    def run(self, max_frames: Optional[int] = None):
+        """
+        Main game loop.
+        Stops when the window closes or, if given, after max_frames frames
+        (useful with a FastClock for headless runs).
+        """
+        while self.running and (max_frames is None or self.frames < max_frames):
+            self.run_frame()
+        self.shutdown()
+    
+    def run_frame(self):
+        """Run one frame of the main loop."""
+        self.frames += 1
+        if self.profiler.enabled:
+            self.run_profiled_frame()
+            return
         
+        self.handle_events()
+        self.update(self.frame_time)
+        self.publish_state()
+        if self.render_enabled:
+            self.draw()
+        self.build_idle_scene()
+        self.frame_time = self.clock.tick()
+    
+    def shutdown(self):
+        """Flush exports and recordings, stop the optional services and quit pygame."""
+        self.profiler.export()
+        self.latency.export()
+        if self.assets_built:
+            # Refresh the pack with everything the session rendered
+            self.save_assets()
+        if self.recorder:
+            self.recorder.close(self.sim_clock.steps)
+        if self.server:
+            self.server.stop()
+        if self.capture:
+            self.capture_stats = self.capture.close()
+        if self.publisher:
+            self.publisher.close()
+        if self.history:
+            self.history_stats = self.history.close()
         pygame.quit()
@@ -2,15 +2,41 @@
 Graphics module for Rock Paper Scissors Arena.
 """
 
-from graphics.fonts import init_fonts, get_font
+from graphics.fonts import (
+    init_fonts,
+    get_font,
+    render_text,
+    blit_text,
+    clear_text_cache,
+    get_text_cache_stats,
+)
 from graphics.background import draw_gradient_bg, create_background_surface
-from graphics.icons import draw_rock, draw_paper, draw_scissors, draw_choice_icon
-from graphics.player_slot import draw_player_slot
+from graphics.icons import (
+    draw_rock,
+    draw_paper,
+    draw_scissors,
+    draw_choice_icon,
+    IconAtlas,
+    icon_atlas,
+)
+from graphics.player_slot import (
+    draw_player_slot,
+    get_player_slot_surface,
+    clear_slot_cache,
+    get_slot_cache_stats,
+)
+from graphics.sprites import ImageSprite, TextSprite, SlotSprite
+from graphics.asset_pack import AssetPack, load_asset_pack, save_asset_pack
 
 __all__ = [
-    'init_fonts', 'get_font',
+    'init_fonts', 'get_font', 'render_text', 'blit_text',
+    'clear_text_cache', 'get_text_cache_stats',
     'draw_gradient_bg', 'create_background_surface',
     'draw_rock', 'draw_paper', 'draw_scissors', 'draw_choice_icon',
-    'draw_player_slot',
+    'IconAtlas', 'icon_atlas',
+    'draw_player_slot', 'get_player_slot_surface',
+    'clear_slot_cache', 'get_slot_cache_stats',
+    'ImageSprite', 'TextSprite', 'SlotSprite',
+    'AssetPack', 'load_asset_pack', 'save_asset_pack',
 ]
 
@@ -0,0 +1,223 @@
+"""
+Persistent asset pack for Rock Paper Scissors Arena.
+
+The first run writes the pre-rendered background and the icon, text and
+player slot caches to a pack file. Later runs memory-map the pack and wrap
+its pixels in surfaces directly, so the first frame needs no drawing.
+
+The pack is tied to a fingerprint of the drawing code, colors, resolution,
+table size and pygame version; any change makes the pack stale and it is
+rebuilt on that run.
+
+File layout:
+
+    header  magic 'RPSA', version u16, fingerprint (32 bytes), index length u32
+    index   JSON list of entries: kind, key, size, offset, length
+    pixels  each entry's 32-bit BGRA pixels, 64-byte aligned
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+import config.colors
+import config.controls
+import core.variants
+import graphics.background
+import graphics.fonts
+import graphics.icons
+import graphics.player_slot
+from config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, ICON_SIZE_BUCKET, ICON_SUPERSAMPLE, ASSET_PACK_PATH,
+)
+from core.enums import Choice
+from graphics.fonts import export_text_cache, preload_text
+from graphics.icons import icon_atlas
+from graphics.player_slot import export_slot_cache, preload_slots
+
+MAGIC = b'RPSA'
+VERSION = 1
+HEADER = struct.Struct('<4sH32sI')
+ALIGN = 64
+
+# Pixel layout of every stored surface (matches 32-bit alpha surfaces, so
+# icon, text and slot surfaces are used straight from the mapping)
+PIXEL_FORMAT = 'BGRA'
+
+# Modules whose code decides what the stored pixels look like
+FINGERPRINT_MODULES = (
+    graphics.background, graphics.icons, graphics.fonts, graphics.player_slot,
+    config.colors, config.controls, core.variants,
+)
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'rps_arena', 'assets.pack')
+
+
+def get_pack_path() -> str:
+    """Get where the asset pack lives (ASSET_PACK_PATH, or the user cache directory)."""
+    return ASSET_PACK_PATH or DEFAULT_PATH
+
+
+def get_fingerprint(seat_count: int) -> bytes:
+    """Hash everything that affects the packed pixels."""
+    digest = hashlib.sha256()
+    digest.update(f"{VERSION}:{pygame.version.ver}:{pygame.version.SDL}".encode())
+    digest.update(f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}:{ICON_SIZE_BUCKET}:{ICON_SUPERSAMPLE}".encode())
+    digest.update(f"{seat_count}:{pygame.font.get_default_font()}".encode())
+    for module in FINGERPRINT_MODULES:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+# Cache keys <-> JSON
+
+def _encode_key(kind: str, key: tuple) -> list:
+    if kind == 'icon':
+        choice, size, color, angle = key
+        return [choice.value, size, list(color), angle]
+    if kind == 'text':
+        font, text, color, antialias, shadow, shadow_offset = key
+        return [font, text, list(color), antialias,
+                list(shadow) if shadow else None, list(shadow_offset) if shadow_offset else None]
+    if kind == 'slot':
+        player_id, angle, state, show_choice, show_controls = key
+        joined, alive, choice, color, scale, rock, paper, scissors = state
+        return [player_id, angle, [joined, alive, choice.value, list(color), scale, rock, paper, scissors],
+                show_choice, show_controls]
+    return []
+
+
+def _decode_key(kind: str, key: list) -> tuple:
+    if kind == 'icon':
+        choice, size, color, angle = key
+        return (Choice(choice), size, tuple(color), angle)
+    if kind == 'text':
+        font, text, color, antialias, shadow, shadow_offset = key
+        return (font, text, tuple(color), antialias,
+                tuple(shadow) if shadow else None, tuple(shadow_offset) if shadow_offset else None)
+    if kind == 'slot':
+        player_id, angle, state, show_choice, show_controls = key
+        joined, alive, choice, color, scale, rock, paper, scissors = state
+        return (player_id, angle, (joined, alive, Choice(choice), tuple(color), scale, rock, paper, scissors),
+                show_choice, show_controls)
+    return ()
+
+
+class AssetPack:
+    """Surfaces loaded from a memory-mapped pack file."""
+    
+    def __init__(self, path: str, mapping: mmap.mmap, background: Optional[pygame.Surface],
+                 entries: Dict[str, List[Tuple[tuple, pygame.Surface]]]):
+        self.path = path
+        self._mapping = mapping  # Keeps the pixels alive for the surfaces
+        self.background = background
+        self.entries = entries
+    
+    def install(self):
+        """Seed the icon atlas, text cache and slot cache with the packed surfaces."""
+        for key, surface in self.entries.get('icon', []):
+            icon_atlas.put(key, surface)
+        preload_text(self.entries.get('text', []))
+        preload_slots(self.entries.get('slot', []))
+    
+    def stats(self) -> dict:
+        counts = {kind: len(items) for kind, items in self.entries.items()}
+        counts['bytes'] = len(self._mapping)
+        return counts
+
+
+def load_asset_pack(fingerprint: bytes, path: Optional[str] = None) -> Optional[AssetPack]:
+    """Map a pack file; returns None if it is missing, corrupt or stale."""
+    path = path or get_pack_path()
+    try:
+        with open(path, 'rb') as f:
+            # Private copy-on-write mapping: a stray draw onto a packed surface
+            # can't write through to the file
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+    
+    try:
+        magic, version, stored, index_length = HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC or version != VERSION or stored != fingerprint:
+            mapping.close()
+            return None
+        index = json.loads(mapping[HEADER.size:HEADER.size + index_length])
+    except (struct.error, ValueError):
+        mapping.close()
+        return None
+    
+    # Check every entry before wrapping any pixels, so a corrupt pack can
+    # still be closed (the mapping can't close while surfaces use it)
+    try:
+        items = []
+        for entry in index:
+            offset, length, size = entry['offset'], entry['length'], tuple(entry['size'])
+            if (len(size) != 2 or offset < HEADER.size or offset + length > len(mapping)
+                    or length != size[0] * size[1] * len(PIXEL_FORMAT)):
+                raise ValueError("bad pack entry")  # Truncated or garbled file
+            key = None if entry['kind'] == 'background' else _decode_key(entry['kind'], entry['key'])
+            items.append((entry['kind'], key, offset, length, size))
+    except (ValueError, KeyError, TypeError):
+        mapping.close()
+        return None
+    
+    view = memoryview(mapping)
+    background = None
+    entries: Dict[str, List[Tuple[tuple, pygame.Surface]]] = {}
+    for kind, key, offset, length, size in items:
+        surface = pygame.image.frombuffer(view[offset:offset + length], size, PIXEL_FORMAT)
+        if kind == 'background':
+            background = surface
+        else:
+            entries.setdefault(kind, []).append((key, surface))
+    return AssetPack(path, mapping, background, entries)
+
+
+def save_asset_pack(fingerprint: bytes, background: pygame.Surface, path: Optional[str] = None):
+    """Write the background and the current icon, text and slot caches to a pack file."""
+    path = path or get_pack_path()
+    items = [('background', (), background)]
+    items += [('icon', key, surface) for key, surface in icon_atlas.entries()]
+    items += [('text', key, surface) for key, surface in export_text_cache()]
+    items += [('slot', key, surface) for key, surface in export_slot_cache()]
+    
+    blobs = []
+    index = []
+    offset = 0
+    for kind, key, surface in items:
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        index.append({'kind': kind, 'key': _encode_key(kind, key), 'size': list(surface.get_size()),
+                      'offset': offset, 'length': len(pixels)})
+        blobs.append(pixels)
+        offset += -(-len(pixels) // ALIGN) * ALIGN
+    
+    # Offsets are relative to the pixel section until the index size is known
+    def encode_index(base: int) -> bytes:
+        return json.dumps([dict(entry, offset=entry['offset'] + base) for entry in index],
+                          separators=(',', ':')).encode()
+    
+    base = 0
+    while True:
+        index_bytes = encode_index(base)
+        start = -(-(HEADER.size + len(index_bytes)) // ALIGN) * ALIGN
+        if start == base:
+            break
+        base = start
+    
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, fingerprint, len(index_bytes)))
+        f.write(index_bytes)
+        for entry, pixels in zip(index, blobs):
+            f.seek(base + entry['offset'])
+            f.write(pixels)
+        f.truncate(base + offset)
+    os.replace(temp_path, path)  # Readers never see a half-written pack
@@ -2,25 +2,31 @@
 Background rendering for Rock Paper Scissors Arena.
 """
 
+import numpy as np
 import pygame
+from typing import Optional, Tuple
 
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from config.colors import COLORS
 
 
+def gradient_column(height: int) -> np.ndarray:
+    """Get the vertical gradient colors as a (height, 3) uint8 array."""
+    ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+    top = np.array(COLORS['bg_dark'], dtype=np.float64)
+    bottom = np.array(COLORS['bg_gradient'], dtype=np.float64)
+    return (top * (1 - ratio) + bottom * ratio).astype(np.uint8)
+
+
 def draw_gradient_bg(surface: pygame.Surface):
-    """Draw a gradient background."""
-    for y in range(SCREEN_HEIGHT):
-        ratio = y / SCREEN_HEIGHT
-        r = int(COLORS['bg_dark'][0] * (1 - ratio) + COLORS['bg_gradient'][0] * ratio)
-        g = int(COLORS['bg_dark'][1] * (1 - ratio) + COLORS['bg_gradient'][1] * ratio)
-        b = int(COLORS['bg_dark'][2] * (1 - ratio) + COLORS['bg_gradient'][2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-
-def create_background_surface() -> pygame.Surface:
-    """Create and return a pre-rendered background surface."""
-    bg_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    """Draw a vertical gradient over the whole surface in one vectorized pass."""
+    width, height = surface.get_size()
+    column = gradient_column(height)
+    pygame.surfarray.blit_array(surface, np.broadcast_to(column[None, :, :], (width, height, 3)))
+
+
+def create_background_surface(size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """Create and return a pre-rendered background surface (logical screen size by default)."""
+    bg_surface = pygame.Surface(size or (SCREEN_WIDTH, SCREEN_HEIGHT))
     draw_gradient_bg(bg_surface)
     return bg_surface
-
@@ -3,29 +3,39 @@ Font management for Rock Paper Scissors Arena.
 """
 
 import pygame
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple, Union
+
+from config.settings import TEXT_CACHE_SIZE
+
+# Font ladder: (name, default font size, SysFont fallback size), largest first
+FONT_LADDER = [
+    ('huge', 200, 170),
+    ('xlarge', 160, 135),
+    ('large', 120, 100),
+    ('medium', 60, 48),
+    ('small', 36, 30),
+    ('tiny', 28, 22),
+]
 
 # Font storage
-_fonts = {
-    'large': None,
-    'medium': None,
-    'small': None,
-    'tiny': None,
-}
+_fonts = {name: None for name, _, _ in FONT_LADDER}
+
+# Rendered text surfaces keyed by (font, text, color, antialias, shadow, shadow_offset)
+_text_cache: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+_text_cache_stats = {'hits': 0, 'misses': 0}
 
 
 def init_fonts():
     """Initialize fonts after pygame is initialized."""
     global _fonts
     try:
-        _fonts['large'] = pygame.font.Font(None, 120)
-        _fonts['medium'] = pygame.font.Font(None, 60)
-        _fonts['small'] = pygame.font.Font(None, 36)
-        _fonts['tiny'] = pygame.font.Font(None, 28)
+        for name, size, _ in FONT_LADDER:
+            _fonts[name] = pygame.font.Font(None, size)
     except:
-        _fonts['large'] = pygame.font.SysFont('arial', 100)
-        _fonts['medium'] = pygame.font.SysFont('arial', 48)
-        _fonts['small'] = pygame.font.SysFont('arial', 30)
-        _fonts['tiny'] = pygame.font.SysFont('arial', 22)
+        for name, _, fallback_size in FONT_LADDER:
+            _fonts[name] = pygame.font.SysFont('arial', fallback_size)
+    clear_text_cache()
 
 
 def get_font(size: str) -> pygame.font.Font:
@@ -33,7 +43,7 @@ def get_font(size: str) -> pygame.font.Font:
     Get a font by size name.
     
     Args:
-        size: One of 'large', 'medium', 'small', 'tiny'
+        size: One of 'huge', 'xlarge', 'large', 'medium', 'small', 'tiny'
     
     Returns:
         The pygame Font object
@@ -41,7 +51,144 @@ def get_font(size: str) -> pygame.font.Font:
     return _fonts.get(size)
 
 
+def _shadow_layout(shadow_offset: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """Get (text position, shadow position) inside a composited text surface."""
+    ox, oy = shadow_offset
+    return (max(0, -ox), max(0, -oy)), (max(0, ox), max(0, oy))
+
+
+def render_text(size: Union[str, pygame.font.Font], text: str, color: Tuple[int, int, int],
+                antialias: bool = True, shadow: Optional[Tuple[int, int, int]] = None,
+                shadow_offset: Tuple[int, int] = (4, 4)) -> pygame.Surface:
+    """
+    Get a rendered text surface, rendering it only on a cache miss.
+    
+    Args:
+        size: Font size name from the ladder, or a Font object
+        text: The text to render
+        color: Text color
+        antialias: Whether to anti-alias the glyphs
+        shadow: Optional drop shadow color, composited behind the text
+        shadow_offset: Offset of the drop shadow from the text
+    
+    Returns:
+        The cached surface. Callers must not draw on it or leave alpha changed.
+    """
+    font = get_font(size) if isinstance(size, str) else size
+    color = tuple(color)
+    if shadow is not None:
+        shadow = tuple(shadow)
+    key = (font, text, color, antialias, shadow, tuple(shadow_offset) if shadow else None)
+    
+    text_surface = _text_cache.get(key)
+    if text_surface is not None:
+        _text_cache_stats['hits'] += 1
+        _text_cache.move_to_end(key)
+        return text_surface
+    
+    _text_cache_stats['misses'] += 1
+    text_surface = font.render(text, antialias, color)
+    if shadow is not None:
+        shadow_surface = font.render(text, antialias, shadow)
+        text_pos, shadow_pos = _shadow_layout(shadow_offset)
+        composite = pygame.Surface(
+            (text_surface.get_width() + abs(shadow_offset[0]),
+             text_surface.get_height() + abs(shadow_offset[1])), pygame.SRCALPHA)
+        composite.blit(shadow_surface, shadow_pos)
+        composite.blit(text_surface, text_pos)
+        text_surface = composite
+    
+    _text_cache[key] = text_surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return text_surface
+
+
+def layout_text(size: Union[str, pygame.font.Font], text: str, color: Tuple[int, int, int],
+                center: Tuple[int, int], shadow: Optional[Tuple[int, int, int]] = None,
+                shadow_offset: Tuple[int, int] = (4, 4)) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """
+    Get cached text and the top-left position that centers the text itself
+    (not its shadow) on center.
+    """
+    text_surface = render_text(size, text, color, True, shadow, shadow_offset)
+    if shadow is None:
+        return text_surface, text_surface.get_rect(center=center).topleft
+    
+    text_pos, _ = _shadow_layout(shadow_offset)
+    text_w = text_surface.get_width() - abs(shadow_offset[0])
+    text_h = text_surface.get_height() - abs(shadow_offset[1])
+    text_rect = pygame.Rect(0, 0, text_w, text_h)
+    text_rect.center = center
+    return text_surface, (text_rect.x - text_pos[0], text_rect.y - text_pos[1])
+
+
+def blit_text(surface: pygame.Surface, size: Union[str, pygame.font.Font], text: str,
+              color: Tuple[int, int, int], center: Tuple[int, int],
+              shadow: Optional[Tuple[int, int, int]] = None,
+              shadow_offset: Tuple[int, int] = (4, 4),
+              alpha: Optional[int] = None) -> pygame.Rect:
+    """
+    Blit cached text so that the text itself (not its shadow) is centered on center.
+    Returns the rect that was drawn to.
+    """
+    text_surface, topleft = layout_text(size, text, color, center, shadow, shadow_offset)
+    if alpha is not None and alpha < 255:
+        text_surface.set_alpha(alpha)
+        rect = surface.blit(text_surface, topleft)
+        text_surface.set_alpha(255)
+        return rect
+    return surface.blit(text_surface, topleft)
+
+
+def clear_text_cache():
+    """Drop all cached text surfaces."""
+    _text_cache.clear()
+    _text_cache_stats['hits'] = 0
+    _text_cache_stats['misses'] = 0
+
+
+def export_text_cache() -> List[Tuple[tuple, pygame.Surface]]:
+    """
+    Get cached text as (key, surface) pairs with the font given by its ladder
+    name, so entries stay valid after the fonts are re-initialized.
+    Text rendered with fonts outside the ladder is skipped.
+    """
+    names = {font: name for name, font in _fonts.items()}
+    return [((names[key[0]],) + key[1:], surface)
+            for key, surface in _text_cache.items() if key[0] in names]
+
+
+def preload_text(entries: Iterable[Tuple[tuple, pygame.Surface]]):
+    """Seed the text cache with (key, surface) pairs from export_text_cache."""
+    for key, surface in entries:
+        font = _fonts.get(key[0])
+        if font is not None:
+            _text_cache[(font,) + tuple(key[1:])] = surface
+    while len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+
+
+def get_text_cache_stats() -> dict:
+    """Get text cache statistics."""
+    hits = _text_cache_stats['hits']
+    misses = _text_cache_stats['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'size': len(_text_cache),
+        'hit_rate': hits / total if total else 0.0,
+    }
+
+
 # Convenience accessors
+def font_huge() -> pygame.font.Font:
+    return _fonts['huge']
+
+def font_xlarge() -> pygame.font.Font:
+    return _fonts['xlarge']
+
 def font_large() -> pygame.font.Font:
     return _fonts['large']
 
@@ -53,4 +200,3 @@ def font_small() -> pygame.font.Font:
 
 def font_tiny() -> pygame.font.Font:
     return _fonts['tiny']
-
@@ -4,15 +4,16 @@ Rock Paper Scissors icon rendering using vector graphics.
 
 import pygame
 import math
-from typing import Tuple
+from collections import OrderedDict
+from typing import List, Tuple
 
 from core.enums import Choice
+from config.settings import ICON_CACHE_BUDGET, ICON_SIZE_BUCKET, ICON_SUPERSAMPLE
 
 
-def draw_rock(surface: pygame.Surface, x: int, y: int, size: int, 
-              color: Tuple[int, int, int], angle: float = 0):
-    """Draw a rock (fist) icon using vector graphics."""
-    temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+def _draw_rock_shapes(temp_surface: pygame.Surface, size: int,
+                      color: Tuple[int, int, int], line_scale: int = 1):
+    """Draw the rock (fist) primitives centered on a size*2 square surface."""
     cx, cy = size, size
     
     fist_color = color
@@ -34,13 +35,13 @@ def draw_rock(surface: pygame.Surface, x: int, y: int, size: int,
     # Finger fold lines
     pygame.draw.arc(temp_surface, darker,
                    (cx - size * 0.35, cy - size * 0.25, size * 0.25, size * 0.2),
-                   0, math.pi, 2)
+                   0, math.pi, 2 * line_scale)
     pygame.draw.arc(temp_surface, darker,
                    (cx - size * 0.1, cy - size * 0.3, size * 0.25, size * 0.2),
-                   0, math.pi, 2)
+                   0, math.pi, 2 * line_scale)
     pygame.draw.arc(temp_surface, darker,
                    (cx + size * 0.12, cy - size * 0.25, size * 0.25, size * 0.2),
-                   0, math.pi, 2)
+                   0, math.pi, 2 * line_scale)
     
     # Thumb
     thumb_points = [
@@ -54,19 +55,12 @@ def draw_rock(surface: pygame.Surface, x: int, y: int, size: int,
     
     # Outline
     pygame.draw.ellipse(temp_surface, darker, 
-                       (cx - size * 0.4, cy - size * 0.3, size * 0.8, size * 0.7), 3)
-    
-    # Rotate and blit
-    if angle != 0:
-        temp_surface = pygame.transform.rotate(temp_surface, angle)
-    rect = temp_surface.get_rect(center=(x, y))
-    surface.blit(temp_surface, rect)
+                       (cx - size * 0.4, cy - size * 0.3, size * 0.8, size * 0.7), 3 * line_scale)
 
 
-def draw_paper(surface: pygame.Surface, x: int, y: int, size: int,
-               color: Tuple[int, int, int], angle: float = 0):
-    """Draw a paper (open hand) icon using vector graphics."""
-    temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+def _draw_paper_shapes(temp_surface: pygame.Surface, size: int,
+                       color: Tuple[int, int, int], line_scale: int = 1):
+    """Draw the paper (open hand) primitives centered on a size*2 square surface."""
     cx, cy = size, size
     
     paper_color = color
@@ -87,7 +81,7 @@ def draw_paper(surface: pygame.Surface, x: int, y: int, size: int,
     for fx, fy_offset, width in finger_data:
         finger_rect = pygame.Rect(fx - width, cy + fy_offset, width * 2, size * 0.5)
         pygame.draw.ellipse(temp_surface, paper_color, finger_rect)
-        pygame.draw.ellipse(temp_surface, darker, finger_rect, 2)
+        pygame.draw.ellipse(temp_surface, darker, finger_rect, 2 * line_scale)
     
     # Thumb
     thumb_points = [
@@ -99,22 +93,15 @@ def draw_paper(surface: pygame.Surface, x: int, y: int, size: int,
         (cx - size * 0.35, cy + size * 0.1),
     ]
     pygame.draw.polygon(temp_surface, paper_color, thumb_points)
-    pygame.draw.polygon(temp_surface, darker, thumb_points, 2)
+    pygame.draw.polygon(temp_surface, darker, thumb_points, 2 * line_scale)
     
     # Palm outline
-    pygame.draw.ellipse(temp_surface, darker, palm_rect, 2)
-    
-    # Rotate and blit
-    if angle != 0:
-        temp_surface = pygame.transform.rotate(temp_surface, angle)
-    rect = temp_surface.get_rect(center=(x, y))
-    surface.blit(temp_surface, rect)
+    pygame.draw.ellipse(temp_surface, darker, palm_rect, 2 * line_scale)
 
 
-def draw_scissors(surface: pygame.Surface, x: int, y: int, size: int,
-                  color: Tuple[int, int, int], angle: float = 0):
-    """Draw scissors icon using vector graphics."""
-    temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+def _draw_scissors_shapes(temp_surface: pygame.Surface, size: int,
+                          color: Tuple[int, int, int], line_scale: int = 1):
+    """Draw the scissors primitives centered on a size*2 square surface."""
     cx, cy = size, size
     
     scissors_color = color
@@ -130,7 +117,7 @@ def draw_scissors(surface: pygame.Surface, x: int, y: int, size: int,
         (cx - size * 0.05, cy + size * 0.15),
     ]
     pygame.draw.polygon(temp_surface, metal, blade1_points)
-    pygame.draw.polygon(temp_surface, metal_dark, blade1_points, 2)
+    pygame.draw.polygon(temp_surface, metal_dark, blade1_points, 2 * line_scale)
     
     # Blade 2
     blade2_points = [
@@ -140,7 +127,7 @@ def draw_scissors(surface: pygame.Surface, x: int, y: int, size: int,
         (cx + size * 0.05, cy + size * 0.15),
     ]
     pygame.draw.polygon(temp_surface, metal, blade2_points)
-    pygame.draw.polygon(temp_surface, metal_dark, blade2_points, 2)
+    pygame.draw.polygon(temp_surface, metal_dark, blade2_points, 2 * line_scale)
     
     # Handle rings
     pygame.draw.ellipse(temp_surface, scissors_color,
@@ -156,6 +143,103 @@ def draw_scissors(surface: pygame.Surface, x: int, y: int, size: int,
     # Center pivot
     pygame.draw.circle(temp_surface, metal_dark, (int(cx), int(cy + size * 0.1)), int(size * 0.08))
     pygame.draw.circle(temp_surface, metal, (int(cx), int(cy + size * 0.1)), int(size * 0.05))
+
+
+def _draw_lizard_shapes(temp_surface: pygame.Surface, size: int,
+                        color: Tuple[int, int, int], line_scale: int = 1):
+    """Draw the lizard (hand puppet, side view) primitives centered on a size*2 square surface."""
+    cx, cy = size, size
+    
+    lizard_color = color
+    darker = tuple(max(0, c - 60) for c in color)
+    
+    # Fingers pressed together as the head and snout
+    head_points = [
+        (cx - size * 0.45, cy - size * 0.1),
+        (cx - size * 0.2, cy - size * 0.35),
+        (cx + size * 0.25, cy - size * 0.3),
+        (cx + size * 0.5, cy - size * 0.12),
+        (cx + size * 0.5, cy - size * 0.02),
+        (cx - size * 0.45, cy + size * 0.1),
+    ]
+    pygame.draw.polygon(temp_surface, lizard_color, head_points)
+    pygame.draw.polygon(temp_surface, darker, head_points, 2 * line_scale)
+    
+    # Thumb as the lower jaw
+    jaw_points = [
+        (cx - size * 0.45, cy + size * 0.15),
+        (cx + size * 0.4, cy + size * 0.08),
+        (cx + size * 0.42, cy + size * 0.18),
+        (cx - size * 0.4, cy + size * 0.4),
+    ]
+    pygame.draw.polygon(temp_surface, lizard_color, jaw_points)
+    pygame.draw.polygon(temp_surface, darker, jaw_points, 2 * line_scale)
+    
+    # Wrist
+    pygame.draw.ellipse(temp_surface, lizard_color,
+                       (cx - size * 0.6, cy - size * 0.15, size * 0.3, size * 0.5))
+    
+    # Eye
+    pygame.draw.circle(temp_surface, darker, (int(cx + size * 0.05), int(cy - size * 0.2)), int(size * 0.06))
+
+
+def _draw_spock_shapes(temp_surface: pygame.Surface, size: int,
+                       color: Tuple[int, int, int], line_scale: int = 1):
+    """Draw the Spock (Vulcan salute) primitives centered on a size*2 square surface."""
+    cx, cy = size, size
+    
+    spock_color = color
+    darker = tuple(max(0, c - 60) for c in color)
+    
+    # Palm
+    palm_rect = (cx - size * 0.3, cy - size * 0.1, size * 0.6, size * 0.5)
+    pygame.draw.ellipse(temp_surface, spock_color, palm_rect)
+    
+    # Fingers in pairs, split in a V between middle and ring
+    finger_data = [
+        (cx - size * 0.3, -size * 0.5, size * 0.1, -12),   # Index
+        (cx - size * 0.12, -size * 0.55, size * 0.1, -12),  # Middle
+        (cx + size * 0.14, -size * 0.55, size * 0.1, 12),   # Ring
+        (cx + size * 0.32, -size * 0.45, size * 0.09, 12),  # Pinky
+    ]
+    
+    for fx, fy_offset, width, tilt in finger_data:
+        finger = pygame.Surface((int(width * 2), int(size * 0.55)), pygame.SRCALPHA)
+        pygame.draw.ellipse(finger, spock_color, finger.get_rect())
+        pygame.draw.ellipse(finger, darker, finger.get_rect(), 2 * line_scale)
+        finger = pygame.transform.rotate(finger, tilt)
+        temp_surface.blit(finger, finger.get_rect(center=(int(fx), int(cy + fy_offset + size * 0.27))))
+    
+    # Thumb
+    thumb_points = [
+        (cx - size * 0.3, cy + size * 0.15),
+        (cx - size * 0.5, cy),
+        (cx - size * 0.55, cy - size * 0.15),
+        (cx - size * 0.45, cy - size * 0.25),
+        (cx - size * 0.35, cy - size * 0.15),
+        (cx - size * 0.35, cy + size * 0.1),
+    ]
+    pygame.draw.polygon(temp_surface, spock_color, thumb_points)
+    pygame.draw.polygon(temp_surface, darker, thumb_points, 2 * line_scale)
+    
+    # Palm outline
+    pygame.draw.ellipse(temp_surface, darker, palm_rect, 2 * line_scale)
+
+
+_SHAPE_DRAWERS = {
+    Choice.ROCK: _draw_rock_shapes,
+    Choice.PAPER: _draw_paper_shapes,
+    Choice.SCISSORS: _draw_scissors_shapes,
+    Choice.LIZARD: _draw_lizard_shapes,
+    Choice.SPOCK: _draw_spock_shapes,
+}
+
+
+def _draw_icon(surface: pygame.Surface, choice: Choice, x: int, y: int, size: int,
+               color: Tuple[int, int, int], angle: float = 0):
+    """Draw an icon directly with primitives (no caching)."""
+    temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    _SHAPE_DRAWERS[choice](temp_surface, size, color)
     
     # Rotate and blit
     if angle != 0:
@@ -164,13 +248,128 @@ def draw_scissors(surface: pygame.Surface, x: int, y: int, size: int,
     surface.blit(temp_surface, rect)
 
 
+def draw_rock(surface: pygame.Surface, x: int, y: int, size: int, 
+              color: Tuple[int, int, int], angle: float = 0):
+    """Draw a rock (fist) icon using vector graphics."""
+    _draw_icon(surface, Choice.ROCK, x, y, size, color, angle)
+
+
+def draw_paper(surface: pygame.Surface, x: int, y: int, size: int,
+               color: Tuple[int, int, int], angle: float = 0):
+    """Draw a paper (open hand) icon using vector graphics."""
+    _draw_icon(surface, Choice.PAPER, x, y, size, color, angle)
+
+
+def draw_scissors(surface: pygame.Surface, x: int, y: int, size: int,
+                  color: Tuple[int, int, int], angle: float = 0):
+    """Draw scissors icon using vector graphics."""
+    _draw_icon(surface, Choice.SCISSORS, x, y, size, color, angle)
+
+
+class IconAtlas:
+    """
+    LRU cache of pre-rasterized icons keyed by (choice, size bucket, color, angle).
+    Icons are drawn supersampled and smoothscaled down once, so serving an icon
+    is a single blit regardless of how many primitives it is made of.
+    """
+    
+    def __init__(self, budget_bytes: int = ICON_CACHE_BUDGET,
+                 size_bucket: int = ICON_SIZE_BUCKET,
+                 supersample: int = ICON_SUPERSAMPLE):
+        self.budget_bytes = budget_bytes
+        self.size_bucket = max(1, size_bucket)
+        self.supersample = max(1, supersample)
+        self._entries: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def make_key(self, choice: Choice, size: int, color: Tuple[int, int, int],
+                 angle: float = 0) -> tuple:
+        """Build the cache key, snapping size to its bucket and angle to whole degrees."""
+        bucket = max(self.size_bucket, int(round(size / self.size_bucket)) * self.size_bucket)
+        return (choice, bucket, tuple(color[:3]), int(round(angle)) % 360)
+    
+    def render(self, choice: Choice, size: int, color: Tuple[int, int, int],
+               angle: int = 0) -> pygame.Surface:
+        """Rasterize an icon supersampled and anti-aliased, then rotate it."""
+        ss = self.supersample
+        big = pygame.Surface((size * 2 * ss, size * 2 * ss), pygame.SRCALPHA)
+        _SHAPE_DRAWERS[choice](big, size * ss, color, ss)
+        if ss > 1:
+            icon = pygame.transform.smoothscale(big, (size * 2, size * 2))
+        else:
+            icon = big
+        if angle != 0:
+            icon = pygame.transform.rotate(icon, angle)
+        return icon
+    
+    def get(self, choice: Choice, size: int, color: Tuple[int, int, int],
+            angle: float = 0) -> pygame.Surface:
+        """Get an icon surface, rasterizing and caching it on a miss."""
+        key = self.make_key(choice, size, color, angle)
+        icon = self._entries.get(key)
+        if icon is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return icon
+        
+        self.misses += 1
+        icon = self.render(key[0], key[1], key[2], key[3])
+        self.put(key, icon)
+        return icon
+    
+    def put(self, key: tuple, icon: pygame.Surface):
+        """Store an icon under a key, evicting least recently used icons over budget."""
+        if key in self._entries:
+            self.used_bytes -= _surface_bytes(self._entries.pop(key))
+        self._entries[key] = icon
+        self.used_bytes += _surface_bytes(icon)
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.used_bytes -= _surface_bytes(evicted)
+            self.evictions += 1
+    
+    def entries(self) -> List[Tuple[tuple, pygame.Surface]]:
+        """Get every cached (key, icon) pair, least recently used first."""
+        return list(self._entries.items())
+    
+    def clear(self):
+        """Drop all cached icons and reset statistics."""
+        self._entries.clear()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'used_bytes': self.used_bytes,
+            'budget_bytes': self.budget_bytes,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Approximate memory used by a surface's pixels."""
+    return surface.get_pitch() * surface.get_height()
+
+
+# Shared atlas used by draw_choice_icon
+icon_atlas = IconAtlas()
+
+
 def draw_choice_icon(surface: pygame.Surface, choice: Choice, x: int, y: int,
                      size: int, color: Tuple[int, int, int], angle: float = 0):
-    """Draw the appropriate icon for a choice."""
-    if choice == Choice.ROCK:
-        draw_rock(surface, x, y, size, color, angle)
-    elif choice == Choice.PAPER:
-        draw_paper(surface, x, y, size, color, angle)
-    elif choice == Choice.SCISSORS:
-        draw_scissors(surface, x, y, size, color, angle)
-
+    """Draw the appropriate icon for a choice using the shared icon atlas."""
+    if choice not in _SHAPE_DRAWERS:
+        return
+    icon = icon_atlas.get(choice, size, color, angle)
+    surface.blit(icon, icon.get_rect(center=(x, y)))
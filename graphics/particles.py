@@ -0,0 +1,182 @@
+"""
+Array-backed particle system for Rock Paper Scissors Arena.
+
+Particles are stored as a struct of NumPy arrays and integrated in one
+vectorized pass per update. Drawing blits pre-rendered circle sprites
+(bucketed by color, radius and alpha) in a single Surface.blits call.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from config.settings import PARTICLE_CAPACITY, PARTICLE_ALPHA_BUCKETS
+
+# Pre-rendered circle sprites keyed by (color, radius, alpha bucket)
+_circle_sprites: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+
+def get_circle_sprite(color: Tuple[int, int, int], radius: int, alpha_bucket: int) -> pygame.Surface:
+    """Get a pre-rendered translucent circle sprite."""
+    key = (color, radius, alpha_bucket)
+    sprite = _circle_sprites.get(key)
+    if sprite is None:
+        alpha = int(255 * alpha_bucket / PARTICLE_ALPHA_BUCKETS)
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        _circle_sprites[key] = sprite
+    return sprite
+
+
+class ParticleSystem:
+    """
+    Struct-of-arrays particle system.
+    
+    Each particle has a position, velocity, remaining life (1.0 -> 0.0),
+    base size and color. Size and alpha shrink with life.
+    """
+    
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, gravity: float = 500.0,
+                 decay: float = 1.2, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.gravity = gravity
+        self.decay = decay
+        self.rng = np.random.default_rng(seed)
+        
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.count = 0
+        self.dropped = 0  # Particles not spawned because the system was full
+        
+        # Colors are stored once and referenced by index
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def seed(self, seed: Optional[int]):
+        """Reseed the particle random generator (for reproducible effects)."""
+        self.rng = np.random.default_rng(seed)
+    
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
+    
+    def _color_index(self, color: Tuple[int, int, int]) -> int:
+        """Get the palette index for a color, adding it if needed."""
+        color = tuple(color[:3])
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+    
+    def spawn(self, x, y, vx, vy, size, color: Tuple[int, int, int], life=1.0):
+        """
+        Spawn particles from scalars or equal-length arrays.
+        Particles that do not fit in the remaining capacity are dropped.
+        """
+        x, y, vx, vy, size, life = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float32), np.asarray(y, dtype=np.float32),
+            np.asarray(vx, dtype=np.float32), np.asarray(vy, dtype=np.float32),
+            np.asarray(size, dtype=np.float32), np.asarray(life, dtype=np.float32))
+        n = x.size
+        room = self.capacity - self.count
+        if n > room:
+            self.dropped += n - room
+            n = room
+        if n <= 0:
+            return
+        
+        start, end = self.count, self.count + n
+        self.x[start:end] = x.ravel()[:n]
+        self.y[start:end] = y.ravel()[:n]
+        self.vx[start:end] = vx.ravel()[:n]
+        self.vy[start:end] = vy.ravel()[:n]
+        self.size[start:end] = size.ravel()[:n]
+        self.life[start:end] = life.ravel()[:n]
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+    
+    def spawn_burst(self, x: float, y: float, color: Tuple[int, int, int], count: int = 20,
+                    speed: Tuple[float, float] = (150, 400), size: Tuple[int, int] = (5, 15)):
+        """Spawn particles flying outward in all directions from a point."""
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        velocity = self.rng.uniform(speed[0], speed[1], count)
+        sizes = self.rng.integers(size[0], size[1] + 1, count)
+        self.spawn(x, y, np.cos(angle) * velocity, np.sin(angle) * velocity, sizes, color)
+    
+    def update(self, dt: float):
+        """Integrate positions, velocities and lifetimes, then drop dead particles."""
+        n = self.count
+        if n == 0:
+            return
+        
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        life = self.life[:n]
+        
+        x += vx * dt
+        y += vy * dt
+        vy += self.gravity * dt
+        life -= dt * self.decay
+        
+        alive = life > 0
+        if not alive.all():
+            keep = int(np.count_nonzero(alive))
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.size, self.color):
+                arr[:keep] = arr[:n][alive]
+            self.count = keep
+    
+    def draw(self, surface: pygame.Surface, extrapolate: float = 0.0):
+        """
+        Draw all particles with one batched blit.
+        
+        Args:
+            surface: Surface to draw on
+            extrapolate: Seconds to advance positions along their velocity
+                when drawing (for render interpolation between updates)
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        life = np.clip(self.life[:n], 0.0, 1.0)
+        radius = (self.size[:n] * life).astype(np.int32)
+        alpha_bucket = np.ceil(life * PARTICLE_ALPHA_BUCKETS).astype(np.int32)
+        visible = radius > 0
+        if not visible.any():
+            return
+        
+        radius = radius[visible]
+        alpha_bucket = alpha_bucket[visible]
+        color = self.color[:n][visible]
+        x = self.x[:n][visible]
+        y = self.y[:n][visible]
+        if extrapolate:
+            x = x + self.vx[:n][visible] * extrapolate
+            y = y + self.vy[:n][visible] * extrapolate
+        left = (x - radius).astype(np.int32)
+        top = (y - radius).astype(np.int32)
+        
+        palette = self.palette
+        sprites = {}
+        blit_list = []
+        for c, r, a, px, py in zip(color.tolist(), radius.tolist(), alpha_bucket.tolist(),
+                                   left.tolist(), top.tolist()):
+            key = (c, r, a)
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = get_circle_sprite(palette[c], r, a)
+                sprites[key] = sprite
+            blit_list.append((sprite, (px, py)))
+        surface.blits(blit_list, doreturn=False)
@@ -3,20 +3,47 @@ Player slot UI rendering for Rock Paper Scissors Arena.
 """
 
 import pygame
+from typing import Dict, Iterable, List, Tuple
 
 from config.colors import COLORS
 from core.enums import Choice
+from core.variants import get_variant
 from graphics.fonts import font_medium, font_small, font_tiny
-from graphics.icons import draw_rock, draw_paper, draw_scissors, draw_choice_icon
+from graphics.icons import draw_choice_icon, icon_atlas
 
+# Icons drawn inside slots: the locked-in choice, and the control hints
+CHOICE_ICON_SIZE = 40
+HINT_ICON_SIZE = 18
+HINT_ICON_COLOR = (120, 120, 120)
 
-def draw_player_slot(surface: pygame.Surface, player, show_choice: bool = False,
-                     show_controls: bool = True):
+
+# Rotated slot sprites keyed by (player id, angle, visual state, show_choice, show_controls)
+_slot_cache: Dict[tuple, pygame.Surface] = {}
+_slot_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def get_slot_state(player) -> Tuple:
+    """
+    Get the part of a player's state that affects how their slot looks.
+    Any change here produces a new cache key, so stale sprites are never served.
+    """
+    return (player.joined, player.alive, player.choice, player.color, player.scale,
+            player.rock_key, player.paper_key, player.scissors_key)
+
+
+def get_key_label(key) -> str:
+    """Get the display name of a bound key ("-" for seats without a keyboard key)."""
+    if key is None:
+        return "-"
+    return pygame.key.name(key).upper()
+
+
+def render_player_slot(player, show_choice: bool = False,
+                       show_controls: bool = True) -> pygame.Surface:
     """
-    Draw a player's slot on screen, rotated to face the player.
+    Render a player's slot, rotated to face the player.
     The entire slot is rendered to a temp surface then rotated.
     """
-    x, y = player.position
     angle = player.angle
     
     # Slot dimensions
@@ -72,7 +99,7 @@ def draw_player_slot(surface: pygame.Surface, player, show_choice: bool = False,
     
     if not player.joined:
         # Show join prompt with ready key (rock/left key)
-        ready_key_name = pygame.key.name(player.rock_key).upper()
+        ready_key_name = get_key_label(player.rock_key)
         join_text = font_small().render(f"Tryck {ready_key_name}", True, (150, 150, 150))
         join_rect = join_text.get_rect(center=(cx, 80))
         temp_surface.blit(join_text, join_rect)
@@ -119,12 +146,12 @@ def draw_player_slot(surface: pygame.Surface, player, show_choice: bool = False,
         
     elif show_choice and player.choice != Choice.NONE:
         # Show their choice icon
-        draw_choice_icon(temp_surface, player.choice, cx, 100, 40, player.color, 0)
+        draw_choice_icon(temp_surface, player.choice, cx, 100, CHOICE_ICON_SIZE, player.color, 0)
     elif show_controls:
         # Show control hints
-        r_key = pygame.key.name(player.rock_key).upper()
-        p_key = pygame.key.name(player.paper_key).upper()
-        s_key = pygame.key.name(player.scissors_key).upper()
+        r_key = get_key_label(player.rock_key)
+        p_key = get_key_label(player.paper_key)
+        s_key = get_key_label(player.scissors_key)
         
         if player.choice == Choice.NONE:
             hint_text = font_tiny().render(f"{r_key}  {p_key}  {s_key}", True, (180, 180, 180))
@@ -136,12 +163,84 @@ def draw_player_slot(surface: pygame.Surface, player, show_choice: bool = False,
         
         # Show mini icons for controls
         spacing = 50
-        draw_rock(temp_surface, cx - spacing, 115, 18, (120, 120, 120), 0)
-        draw_paper(temp_surface, cx, 115, 18, (120, 120, 120), 0)
-        draw_scissors(temp_surface, cx + spacing, 115, 18, (120, 120, 120), 0)
+        draw_choice_icon(temp_surface, Choice.ROCK, cx - spacing, 115, HINT_ICON_SIZE, HINT_ICON_COLOR, 0)
+        draw_choice_icon(temp_surface, Choice.PAPER, cx, 115, HINT_ICON_SIZE, HINT_ICON_COLOR, 0)
+        draw_choice_icon(temp_surface, Choice.SCISSORS, cx + spacing, 115, HINT_ICON_SIZE, HINT_ICON_COLOR, 0)
+    
+    # Shrink slots for crowded tables before rotating
+    if player.scale != 1.0:
+        temp_surface = pygame.transform.smoothscale(
+            temp_surface, (round(slot_width * player.scale), round(slot_height * player.scale)))
     
     # Rotate the entire slot surface
-    rotated_surface = pygame.transform.rotate(temp_surface, angle)
-    rotated_rect = rotated_surface.get_rect(center=(x, y))
-    surface.blit(rotated_surface, rotated_rect)
+    return pygame.transform.rotate(temp_surface, angle)
+
+
+def get_player_slot_surface(player, show_choice: bool = False,
+                            show_controls: bool = True) -> pygame.Surface:
+    """Get the rotated slot sprite for a player, rendering it only on a cache miss."""
+    key = (player.id, player.angle, get_slot_state(player), show_choice, show_controls)
+    slot_surface = _slot_cache.get(key)
+    if slot_surface is None:
+        _slot_cache_stats['misses'] += 1
+        # Drop sprites for this player's old states so the cache stays bounded
+        stale = [k for k in _slot_cache
+                 if k[0] == player.id and k[1] == player.angle and k[3:] == key[3:]]
+        for k in stale:
+            del _slot_cache[k]
+        slot_surface = render_player_slot(player, show_choice, show_controls)
+        _slot_cache[key] = slot_surface
+    else:
+        _slot_cache_stats['hits'] += 1
+    return slot_surface
+
+
+def draw_player_slot(surface: pygame.Surface, player, show_choice: bool = False,
+                     show_controls: bool = True):
+    """Draw a player's slot on screen, rotated to face the player."""
+    slot_surface = get_player_slot_surface(player, show_choice, show_controls)
+    surface.blit(slot_surface, slot_surface.get_rect(center=player.position))
+
+
+def clear_slot_cache():
+    """Drop all cached slot sprites (e.g. after fonts are re-initialized)."""
+    _slot_cache.clear()
+    _slot_cache_stats['hits'] = 0
+    _slot_cache_stats['misses'] = 0
+
+
+def prerender_slot_icons(players):
+    """Rasterize every icon the players' slots can show into the icon atlas."""
+    for choice in get_variant().choices:
+        icon_atlas.get(choice, HINT_ICON_SIZE, HINT_ICON_COLOR)
+        for player in players:
+            icon_atlas.get(choice, CHOICE_ICON_SIZE, player.color)
+
+
+def export_slot_cache() -> List[Tuple[tuple, pygame.Surface]]:
+    """Get every cached (key, slot sprite) pair, e.g. to store in the asset pack."""
+    return list(_slot_cache.items())
+
+
+def preload_slots(entries: Iterable[Tuple[tuple, pygame.Surface]]):
+    """Seed the slot cache with previously rendered sprites."""
+    _slot_cache.update(entries)
+
+
+def get_slot_cache_stats() -> dict:
+    """
+    Get slot cache statistics.
+    
+    Returns:
+        Dict with 'hits', 'misses', 'size' and 'hit_rate' (0.0 - 1.0)
+    """
+    hits = _slot_cache_stats['hits']
+    misses = _slot_cache_stats['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'size': len(_slot_cache),
+        'hit_rate': hits / total if total else 0.0,
+    }
 
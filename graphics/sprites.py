@@ -0,0 +1,76 @@
+"""
+Retained-mode sprites for dirty-rect rendering in Rock Paper Scissors Arena.
+
+Scenes that support retained mode keep these sprites in a
+pygame.sprite.LayeredDirty group. A sprite is only marked dirty when the
+surface it shows or its position changes, so static content is never repainted.
+"""
+
+import pygame
+from typing import Optional, Tuple
+
+from graphics.fonts import layout_text
+from graphics.player_slot import get_player_slot_surface
+
+# Draw order, back to front
+LAYER_SLOTS = 0
+LAYER_EFFECTS = 1
+LAYER_TEXT = 2
+LAYER_OVERLAY = 3
+
+
+class ImageSprite(pygame.sprite.DirtySprite):
+    """A sprite showing a surface, repainted only when the surface or position changes."""
+    
+    def __init__(self, layer: int = LAYER_EFFECTS):
+        super().__init__()
+        self._layer = layer
+        self.image = pygame.Surface((0, 0))
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.visible = 0
+        self.dirty = 0
+    
+    def show(self, image: pygame.Surface, topleft: Tuple[int, int]):
+        """Show a surface at a position, marking the sprite dirty if anything changed."""
+        rect = image.get_rect(topleft=topleft)
+        if image is not self.image or rect != self.rect or not self.visible:
+            self.image = image
+            self.rect = rect
+            self.visible = 1
+            self.dirty = 1
+    
+    def show_centered(self, image: pygame.Surface, center: Tuple[int, int]):
+        """Show a surface centered on a point."""
+        self.show(image, image.get_rect(center=center).topleft)
+    
+    def hide(self):
+        """Hide the sprite, repainting the area it covered."""
+        if self.visible:
+            self.visible = 0
+            self.dirty = 1
+
+
+class TextSprite(ImageSprite):
+    """A sprite showing cached text centered on a point."""
+    
+    def __init__(self, layer: int = LAYER_TEXT):
+        super().__init__(layer)
+    
+    def set_text(self, size: str, text: str, color: Tuple[int, int, int],
+                 center: Tuple[int, int], shadow: Optional[Tuple[int, int, int]] = None,
+                 shadow_offset: Tuple[int, int] = (4, 4)):
+        """Show text; unchanged text maps to the same cached surface and stays clean."""
+        text_surface, topleft = layout_text(size, text, color, center, shadow, shadow_offset)
+        self.show(text_surface, topleft)
+
+
+class SlotSprite(ImageSprite):
+    """A sprite showing a player's cached slot."""
+    
+    def __init__(self, layer: int = LAYER_SLOTS):
+        super().__init__(layer)
+    
+    def sync(self, player, show_choice: bool = False, show_controls: bool = True):
+        """Show the player's current slot sprite at their seat."""
+        self.show_centered(get_player_slot_surface(player, show_choice, show_controls),
+                           player.position)
@@ -2,18 +2,135 @@
 """
 Rock Paper Scissors Arena - Entry Point
 
-A local multiplayer game for up to 8 players standing around the screen.
+A local multiplayer game for players standing around the screen
+(8 seats by default, more with --seats).
 """
 
-from game import Game
+import argparse
+import json
+import sys
+
+from config.settings import (
+    PROFILER_EXPORT_PATH, SEAT_COUNT, REMOTE_HOST, REMOTE_PORT, SCREEN_WIDTH, SCREEN_HEIGHT,
+    TARGET_FPS, FRAME_SHM_NAME, CAPTURE_FORMATS, HISTORY_PATH, RULE_VARIANT,
+)
+from diagnostics.startup import StartupProfiler
+
+# pygame, the game and the optional features are imported inside the
+# functions below, after --startup-profile has started timing imports
+
+
+def parse_args():
+    """Parse command line options."""
+    from core.clock import FRAME_CLOCKS
+    from core.variants import VARIANTS
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors Arena")
+    parser.add_argument('--profile', action='store_true',
+                        help="time every frame phase from startup (F3 toggles the overlay)")
+    parser.add_argument('--profile-export', metavar='PATH', default=PROFILER_EXPORT_PATH,
+                        help="periodically write profiler aggregates to a .json or .csv file")
+    parser.add_argument('--latency', metavar='PATH',
+                        help="measure input-to-display latency and write a JSON report on exit")
+    parser.add_argument('--seats', type=int, default=SEAT_COUNT,
+                        help="number of player seats around the table")
+    parser.add_argument('--clock', choices=sorted(FRAME_CLOCKS), default='real',
+                        help="frame timing: real wall time, fixed steps paced to real time, "
+                             "or fast (no waiting)")
+    parser.add_argument('--no-render', action='store_true',
+                        help="skip drawing (headless runs, e.g. with --clock fast)")
+    parser.add_argument('--seed', type=int, help="effects RNG seed (random by default)")
+    parser.add_argument('--record', metavar='PATH',
+                        help="record every key press and scene change to an input log")
+    parser.add_argument('--replay', metavar='PATH',
+                        help="replay an input log as fast as possible and print a report")
+    parser.add_argument('--serve', metavar='PORT', type=int, nargs='?', const=REMOTE_PORT,
+                        help=f"accept remote players over TCP (default port {REMOTE_PORT})")
+    parser.add_argument('--serve-host', default=REMOTE_HOST,
+                        help="interface the remote-player server listens on")
+    parser.add_argument('--capture', metavar='PATH',
+                        help="record every presented frame to PATH (a directory for png)")
+    parser.add_argument('--capture-format', choices=CAPTURE_FORMATS, default='raw',
+                        help="raw RGB24 frames, zlib-compressed frames, or a png sequence")
+    parser.add_argument('--publish-frames', metavar='NAME', nargs='?', const=FRAME_SHM_NAME,
+                        help="publish every presented frame to shared memory for spectator "
+                             f"processes (default name {FRAME_SHM_NAME})")
+    parser.add_argument('--history', metavar='PATH', default=HISTORY_PATH,
+                        help="record games, rounds, choices and reaction times to an SQLite database")
+    parser.add_argument('--replay-render', action='store_true',
+                        help="render every step while replaying")
+    parser.add_argument('--variant', choices=sorted(VARIANTS), default=RULE_VARIANT,
+                        help="rule variant (replays must use the variant they were recorded with)")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="print import and startup phase times once the first frame is shown")
+    return parser.parse_args()
+
+
+def run_replay(path: str, render: bool, variant: str):
+    """Replay an input log with the seed and table size it was recorded with."""
+    from core.variants import VARIANTS
+    from game import Game
+    from recording.input_log import read_input_log, replay
+    log = read_input_log(path)
+    game = Game(seat_count=log.seat_count, seed=log.seed, variant=VARIANTS[variant], asset_pack=False)
+    report = replay(game, log, render=render)
+    sys.stdout.write(json.dumps(report, indent=2) + '\n')
 
 
 def main():
     """Start the game."""
-    game = Game()
+    startup = StartupProfiler('--startup-profile' in sys.argv[1:])
+    startup.install()
+    args = parse_args()
+    if args.replay:
+        run_replay(args.replay, args.replay_render, args.variant)
+        return
+    
+    from core.clock import FRAME_CLOCKS
+    from core.variants import VARIANTS
+    from diagnostics.latency import LatencyTracker
+    from diagnostics.profiler import FrameProfiler
+    from game import Game
+    
+    server = None
+    if args.serve is not None:
+        from network.server import RemoteServer
+        server = RemoteServer(args.serve_host, args.serve, seat_count=args.seats)
+        server.start()
+        sys.stdout.write(f"Remote players: {args.serve_host}:{server.port}\n")
+    
+    capture = None
+    if args.capture:
+        from recording.frame_recorder import FrameRecorder
+        capture = FrameRecorder(args.capture, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                args.capture_format, fps=TARGET_FPS)
+    
+    publisher = None
+    if args.publish_frames:
+        from recording.frame_publisher import FramePublisher
+        publisher = FramePublisher((SCREEN_WIDTH, SCREEN_HEIGHT), args.publish_frames)
+    
+    history = None
+    if args.history:
+        from recording.match_history import MatchHistory
+        history = MatchHistory(args.history)
+    
+    profiler = FrameProfiler(enabled=args.profile or bool(args.profile_export),
+                             export_path=args.profile_export)
+    game = Game(profiler, seat_count=args.seats, seed=args.seed, record_path=args.record,
+                frame_clock=FRAME_CLOCKS[args.clock](),
+                latency=LatencyTracker(enabled=bool(args.latency), export_path=args.latency),
+                server=server, capture=capture, publisher=publisher, startup=startup,
+                history=history, variant=VARIANTS[args.variant])
+    game.render_enabled = not args.no_render
     game.run()
+    if capture:
+        stats = game.capture_stats
+        sys.stdout.write(f"Captured {stats['captured']}/{stats['offered']} frames "
+                         f"({stats['capture_fps']:.1f} fps, {stats['dropped']} dropped)\n")
+    if history and game.history_stats['error']:
+        sys.stderr.write(f"Match history stopped after {game.history_stats['written']} rows: "
+                         f"{game.history_stats['error']}\n")
 
 
 if __name__ == "__main__":
     main()
-
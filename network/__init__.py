@@ -0,0 +1,8 @@
+"""
+Networking module for Rock Paper Scissors Arena.
+"""
+
+from network.server import RemoteServer
+from network.client import RemoteClient
+
+__all__ = ['RemoteServer', 'RemoteClient']
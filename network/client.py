@@ -0,0 +1,125 @@
+"""
+Remote-player client for Rock Paper Scissors Arena.
+
+A small blocking client for the network.server line protocol. It is the
+stand-in for a phone client when testing on loopback, and doubles as a
+terminal controller:
+
+    python -m network.client HOST PORT SEAT
+
+then type r, p or s (rock, paper, scissors), j to join or l to leave.
+"""
+
+import json
+import socket
+import sys
+import threading
+from typing import Callable, Optional
+
+from config.settings import REMOTE_PORT
+
+# Terminal keys -> messages
+TERMINAL_COMMANDS = {
+    'r': {'type': 'choose', 'choice': 'rock'},
+    'p': {'type': 'choose', 'choice': 'paper'},
+    's': {'type': 'choose', 'choice': 'scissors'},
+    'j': {'type': 'join'},
+    'l': {'type': 'leave'},
+}
+
+
+class RemoteClient:
+    """Connects to a RemoteServer and sends one seat's button presses."""
+    
+    def __init__(self, host: str = 'localhost', port: int = REMOTE_PORT, timeout: float = 5.0):
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._socket.makefile('rb')
+        self.seat: Optional[int] = None
+        self.state: Optional[dict] = None  # Latest state broadcast received
+    
+    def close(self):
+        self._file.close()
+        self._socket.close()
+    
+    def __enter__(self) -> 'RemoteClient':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def send(self, message: dict):
+        self._socket.sendall(json.dumps(message).encode() + b'\n')
+    
+    def receive(self) -> Optional[dict]:
+        """Read the next message (None once the server closed the connection)."""
+        line = self._file.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        if message.get('type') == 'state':
+            self.state = message
+        return message
+    
+    def wait_for(self, predicate: Callable[[dict], bool]) -> dict:
+        """Read messages until one matches (raises ConnectionError if the server hangs up)."""
+        while True:
+            message = self.receive()
+            if message is None:
+                raise ConnectionError("server closed the connection")
+            if predicate(message):
+                return message
+    
+    def hello(self, seat: int) -> dict:
+        """Claim a seat; returns the welcome or error reply."""
+        self.send({'type': 'hello', 'seat': seat})
+        reply = self.wait_for(lambda m: m['type'] in ('welcome', 'error'))
+        if reply['type'] == 'welcome':
+            self.seat = seat
+        return reply
+    
+    def join(self):
+        self.send({'type': 'join'})
+    
+    def leave(self):
+        self.send({'type': 'leave'})
+    
+    def choose(self, choice: str):
+        """Choose 'rock', 'paper' or 'scissors'."""
+        self.send({'type': 'choose', 'choice': choice})
+
+
+def main():
+    """Play one seat from the terminal."""
+    if len(sys.argv) != 4:
+        sys.stderr.write(__doc__)
+        sys.exit(2)
+    host, port, seat = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+    
+    with RemoteClient(host, port, timeout=None) as client:
+        reply = client.hello(seat)
+        if reply['type'] == 'error':
+            sys.exit(reply['error'])
+        
+        def show_states():
+            while True:
+                message = client.receive()
+                if message is None:
+                    return
+                if message['type'] == 'state':
+                    index = seat - 1
+                    sys.stdout.write(f"{message['scene']:<10} round {message['round']} "
+                                     f"countdown {message['countdown']} "
+                                     f"joined {message['joined'][index]} "
+                                     f"alive {message['alive'][index]}\n")
+                elif message['type'] == 'error':
+                    sys.stdout.write(f"error: {message['error']}\n")
+        
+        threading.Thread(target=show_states, daemon=True).start()
+        for line in sys.stdin:
+            command = TERMINAL_COMMANDS.get(line.strip().lower())
+            if command:
+                client.send(command)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Remote-player server for Rock Paper Scissors Arena.
+
+Players on phones or remote terminals connect over TCP and speak a line
+protocol: one JSON object per line, in both directions.
+
+Client to server:
+    {"type": "hello", "seat": 3}                claim a seat (player id)
+    {"type": "join"}                            the seat's rock button
+    {"type": "leave"}                           the seat's scissors button
+    {"type": "choose", "choice": "paper"}       a choice of the rule variant (core.variants)
+
+Server to client:
+    {"type": "welcome", "seat": 3, "seats": 8}
+    {"type": "state", "scene": "GAME", "round": 2, "countdown": 7,
+     "joined": [...], "alive": [...], "chosen": [...]}
+    {"type": "error", "error": "..."}
+
+As on the cabinet, join and leave are the rock and scissors buttons, so in
+the menu they join and unjoin the seat and in a round they pick a choice.
+
+The server runs an asyncio loop in a background thread. Actions become
+REMOTE_INPUT events on a bounded queue that Game drains once per frame,
+so they go through the same input index and scene handlers as key presses
+and never block the render loop. Each connection may only have a few
+actions waiting; beyond that it is not read until the game catches up,
+which pushes back on the client through TCP flow control. Game publishes
+its state every frame, but only changes are broadcast, serialized once
+and coalesced per connection, so a slow client only ever gets the latest
+state.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+from typing import Dict, List, Optional, Set
+
+import pygame
+
+from config.settings import (
+    REMOTE_HOST, REMOTE_PORT, REMOTE_QUEUE_SIZE, REMOTE_MAX_PENDING, REMOTE_MAX_LINE, SEAT_COUNT,
+)
+from core.enums import Choice
+from core.input_dispatch import REMOTE_INPUT
+from core.variants import get_variant
+
+# Message type -> choice sent for it ('choose' carries its own)
+BUTTON_MESSAGES = {'join': Choice.ROCK, 'leave': Choice.SCISSORS}
+CHOICE_NAMES = {choice.name.lower(): choice for choice in Choice if choice != Choice.NONE}
+
+
+class _Connection:
+    """One connected client."""
+    
+    def __init__(self, writer: asyncio.StreamWriter, max_pending: int):
+        self.writer = writer
+        self.seat: Optional[int] = None
+        self.pending = asyncio.Semaphore(max_pending)  # Free slots for unapplied actions
+        self.state_changed = asyncio.Event()
+        self.write_lock = asyncio.Lock()  # One writer at a time, so every write is drained
+        self.closed = False
+
+
+class RemoteServer:
+    """Accepts remote players and hands their actions to the game loop."""
+    
+    def __init__(self, host: str = REMOTE_HOST, port: int = REMOTE_PORT,
+                 seat_count: int = SEAT_COUNT, queue_size: int = REMOTE_QUEUE_SIZE,
+                 max_pending: int = REMOTE_MAX_PENDING):
+        self.host = host
+        self.port = port
+        self.seat_count = seat_count
+        self.max_pending = max_pending
+        self.actions: queue.Queue = queue.Queue(queue_size)
+        self.dropped = 0  # Actions rejected because the queue was full
+        self._connections: Set[_Connection] = set()
+        self._seats: Dict[int, _Connection] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._stop: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+        self._last_state: Optional[dict] = None
+        self._state_line = b''
+    
+    @property
+    def connections(self) -> int:
+        return len(self._connections)
+    
+    def start(self):
+        """Start listening in a background thread (returns once the port is open)."""
+        self._thread = threading.Thread(target=self._run, name='remote-server', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error:
+            raise self._error
+    
+    def stop(self):
+        """Close every connection and stop the server thread."""
+        if self._thread is None:
+            return
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join()
+        self._thread = None
+    
+    def poll(self) -> List[pygame.event.Event]:
+        """
+        Take every waiting action as a REMOTE_INPUT event (game thread).
+        Never blocks; frees the senders' pending slots.
+        """
+        events = []
+        released: Dict[_Connection, int] = {}
+        while True:
+            try:
+                connection, seat, choice = self.actions.get_nowait()
+            except queue.Empty:
+                break
+            events.append(pygame.event.Event(REMOTE_INPUT, seat=seat, choice=choice))
+            released[connection] = released.get(connection, 0) + 1
+        if released and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._release, released)
+        return events
+    
+    def publish(self, state: dict):
+        """Offer the current game state (game thread); only changes are broadcast."""
+        if state == self._last_state or self._loop is None:
+            return
+        self._last_state = state
+        self._loop.call_soon_threadsafe(self._broadcast, state)
+    
+    # Server thread
+    
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except BaseException as error:  # Surface bind errors to start()
+            self._error = error
+            self._ready.set()
+    
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        server = await asyncio.start_server(self._handle_client, self.host, self.port,
+                                            limit=REMOTE_MAX_LINE)
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with server:
+            await self._stop.wait()
+            for connection in list(self._connections):
+                connection.writer.close()
+    
+    def _release(self, released: Dict[_Connection, int]):
+        for connection, count in released.items():
+            for _ in range(count):
+                connection.pending.release()
+    
+    def _broadcast(self, state: dict):
+        # Serialized once, then each connection's sender picks up the latest line
+        self._state_line = json.dumps(dict(state, type='state'), separators=(',', ':')).encode() + b'\n'
+        for connection in self._connections:
+            connection.state_changed.set()
+    
+    async def _send(self, connection: _Connection, message: dict):
+        await self._write(connection, json.dumps(message, separators=(',', ':')).encode() + b'\n')
+    
+    async def _write(self, connection: _Connection, line: bytes):
+        # Replies and states all go through here; waiting for the drain means a
+        # client that doesn't read stops being read too
+        if connection.closed:
+            return
+        async with connection.write_lock:
+            connection.writer.write(line)
+            await connection.writer.drain()
+    
+    async def _send_states(self, connection: _Connection):
+        try:
+            while not connection.closed:
+                await connection.state_changed.wait()
+                connection.state_changed.clear()
+                await self._write(connection, self._state_line)
+        except ConnectionError:
+            # Client hung up; the reader side notices and cleans up
+            connection.closed = True
+            connection.writer.close()
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = _Connection(writer, self.max_pending)
+        self._connections.add(connection)
+        if self._state_line:
+            connection.state_changed.set()
+        sender = asyncio.create_task(self._send_states(connection))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self._send(connection, {'type': 'error', 'error': 'message too long'})
+                    break
+                if not line:
+                    break
+                await self._handle_message(connection, line)
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Client hung up, or the server is shutting down
+        finally:
+            connection.closed = True
+            sender.cancel()
+            self._connections.discard(connection)
+            if connection.seat is not None and self._seats.get(connection.seat) is connection:
+                del self._seats[connection.seat]
+            writer.close()
+    
+    async def _handle_message(self, connection: _Connection, line: bytes):
+        try:
+            message = json.loads(line)
+            kind = message['type']
+        except (ValueError, TypeError, KeyError):
+            kind = None
+        if not isinstance(kind, str):
+            await self._send(connection, {'type': 'error', 'error': 'malformed message'})
+            return
+        
+        if kind == 'hello':
+            await self._claim_seat(connection, message.get('seat'))
+            return
+        
+        if kind in BUTTON_MESSAGES:
+            choice = BUTTON_MESSAGES[kind]
+        elif kind == 'choose':
+            name = message.get('choice')
+            if not isinstance(name, str) or name not in CHOICE_NAMES:
+                await self._send(connection, {'type': 'error', 'error': 'unknown choice'})
+                return
+            choice = CHOICE_NAMES[name]
+            variant = get_variant()
+            if choice not in variant.choices:
+                await self._send(connection, {'type': 'error', 'error': f"not playable in {variant.name}: {name}"})
+                return
+        else:
+            await self._send(connection, {'type': 'error', 'error': f'unknown message: {kind}'})
+            return
+        if connection.seat is None:
+            await self._send(connection, {'type': 'error', 'error': 'no seat claimed'})
+            return
+        
+        # Backpressure: stop reading this client until the game applied its earlier actions
+        await connection.pending.acquire()
+        try:
+            self.actions.put_nowait((connection, connection.seat, choice))
+        except queue.Full:
+            connection.pending.release()
+            self.dropped += 1
+            await self._send(connection, {'type': 'error', 'error': 'busy'})
+    
+    async def _claim_seat(self, connection: _Connection, seat):
+        # bool is an int subclass, but {"seat": true} is not a seat number
+        if not isinstance(seat, int) or isinstance(seat, bool) or not 1 <= seat <= self.seat_count:
+            await self._send(connection, {'type': 'error', 'error': 'no such seat'})
+            return
+        owner = self._seats.get(seat)
+        if owner is not None and owner is not connection:
+            await self._send(connection, {'type': 'error', 'error': 'seat taken'})
+            return
+        if connection.seat is not None:
+            self._seats.pop(connection.seat, None)
+        connection.seat = seat
+        self._seats[seat] = connection
+        await self._send(connection, {'type': 'welcome', 'seat': seat, 'seats': self.seat_count})
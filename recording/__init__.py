@@ -0,0 +1,12 @@
+"""
+Recording and replay module for Rock Paper Scissors Arena.
+"""
+
+from recording.input_log import InputRecorder, InputLog, read_input_log, replay
+from recording.frame_recorder import FrameRecorder, CAPTURE_FORMATS
+from recording.frame_publisher import FramePublisher, FrameReader
+from recording.match_history import MatchHistory
+
+__all__ = ['InputRecorder', 'InputLog', 'read_input_log', 'replay',
+           'FrameRecorder', 'CAPTURE_FORMATS', 'FramePublisher', 'FrameReader',
+           'MatchHistory']
@@ -0,0 +1,256 @@
+"""
+Shared-memory frame publishing for Rock Paper Scissors Arena.
+
+Game can publish every presented frame into a multiprocessing.shared_memory
+block, so spectator processes (projector output, stream encoder, thumbnailer)
+can read frames without the game encoding anything or talking to sockets.
+Publishing a frame is one copy of the frame's pixels.
+
+Block layout (little endian):
+
+    0   magic 'RPSF', version u16, slot count u16
+    8   width u32, height u32
+    16  red, green, blue byte offsets within a pixel (u8 each), pad u8
+    24  latest published frame sequence u64 (0 = none yet)
+    32  per-slot sequence u64 (odd while the slot is being written)
+    48  publisher process id u32
+    64  slot 0 pixels, then slot 1: height rows of width 32-bit pixels
+
+Frames alternate between the two slots, so the newest finished frame stays
+intact while the next one is written. Every slot's sequence works as a
+seqlock: readers check it before and after reading, and retry if it was odd
+or changed. Readers only read, so any number of them can attach.
+
+A block left behind by a publisher that crashed is replaced, but one whose
+publisher is still running is never touched: FramePublisher refuses the name.
+"""
+
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+from config.settings import FRAME_SHM_NAME
+
+MAGIC = b'RPSF'
+VERSION = 1
+SLOTS = 2
+
+HEADER = struct.Struct('<4sHHIIBBBx')
+LATEST_OFFSET = 24  # Followed by the per-slot sequences
+PID = struct.Struct('<I')
+PID_OFFSET = 48
+FRAMES_OFFSET = 64
+
+# How long to watch a leftover block without a live publisher pid for new frames
+STALE_CHECK_SECONDS = 0.25
+
+
+def _sequences(buffer: memoryview) -> np.ndarray:
+    """View the latest and per-slot sequence counters as one uint64 array."""
+    return np.ndarray(1 + SLOTS, dtype=np.uint64, buffer=buffer, offset=LATEST_OFFSET)
+
+
+def _slot(buffer: memoryview, size: Tuple[int, int], slot: int) -> np.ndarray:
+    """View one frame slot as (height, width) 32-bit pixels."""
+    width, height = size
+    return np.ndarray((height, width), dtype=np.uint32, buffer=buffer,
+                      offset=FRAMES_OFFSET + slot * width * height * 4)
+
+
+class FramePublisher:
+    """Writes presented frames into a shared-memory double buffer."""
+    
+    def __init__(self, size: Tuple[int, int], name: str = FRAME_SHM_NAME):
+        self.size = size
+        self.name = name
+        width, height = size
+        total = FRAMES_OFFSET + SLOTS * width * height * 4
+        try:
+            self._shm = shared_memory.SharedMemory(name, create=True, size=total)
+        except FileExistsError:
+            existing = _attach(name)
+            try:
+                active = _is_active(existing)
+            finally:
+                existing.close()
+            if active:
+                raise FileExistsError(f"Frames are already being published to {name}; "
+                                      f"use a different name") from None
+            # Left behind by a game that didn't shut down cleanly
+            existing = shared_memory.SharedMemory(name)
+            existing.close()
+            existing.unlink()
+            self._shm = shared_memory.SharedMemory(name, create=True, size=total)
+        PID.pack_into(self._shm.buf, PID_OFFSET, os.getpid())
+        self._sequences = _sequences(self._shm.buf)
+        self._sequences[:] = 0
+        # Written through a transposed view, so the copy from a surface's
+        # (x, y) pixel view walks both in memory order
+        self._slots = [_slot(self._shm.buf, size, slot).T for slot in range(SLOTS)]
+        # Frames that aren't 32-bit are converted through this surface first
+        self._frame: Optional[pygame.Surface] = None
+        self._header_written = False
+        self.published = 0
+    
+    def publish(self, surface: pygame.Surface):
+        """Copy a finished frame into the slot readers are not using."""
+        if surface.get_bytesize() != 4:
+            if self._frame is None:
+                self._frame = pygame.Surface(self.size, 0, 32)
+            self._frame.blit(surface, (0, 0))
+            surface = self._frame
+        if not self._header_written:
+            self._write_header(surface)
+        sequence = self.published + 1
+        slot = sequence % SLOTS
+        self._sequences[1 + slot] = sequence * 2 - 1  # Odd: being written
+        pixels = pygame.surfarray.pixels2d(surface)
+        np.copyto(self._slots[slot], pixels)
+        del pixels  # Unlock the surface
+        self._sequences[1 + slot] = sequence * 2
+        self._sequences[0] = sequence
+        self.published = sequence
+    
+    def _write_header(self, surface: pygame.Surface):
+        if surface.get_size() != self.size:
+            raise ValueError(f"Frame size {surface.get_size()} does not match publish size {self.size}")
+        shifts = surface.get_shifts()
+        HEADER.pack_into(self._shm.buf, 0, MAGIC, VERSION, SLOTS, self.size[0], self.size[1],
+                         shifts[0] // 8, shifts[1] // 8, shifts[2] // 8)
+        self._header_written = True
+    
+    def close(self):
+        """Remove the shared block (attached readers keep their mapping until they close)."""
+        self._sequences = None
+        self._slots = []
+        self._frame = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+class FrameReader:
+    """Reads the newest frame from a FramePublisher in another process."""
+    
+    def __init__(self, name: str = FRAME_SHM_NAME):
+        self._shm = _attach(name)
+        magic, version, slots, width, height, red, green, blue = HEADER.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{name} is not a frame block (no frame published yet?)")
+        if version != VERSION or slots != SLOTS:
+            raise ValueError(f"Unsupported frame block version {version}")
+        self.size = (width, height)
+        self.channels = (red, green, blue)
+        self._sequences = _sequences(self._shm.buf)
+        self._slots = [_slot(self._shm.buf, self.size, slot) for slot in range(SLOTS)]
+        self.last_sequence = 0
+    
+    @property
+    def latest(self) -> int:
+        """Sequence number of the newest published frame."""
+        return int(self._sequences[0])
+    
+    def read(self, copy: bool = True) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Get (sequence, pixels) for the newest frame, or None if there is none
+        newer than the last one read. Pixels are (height, width) 32-bit values
+        (see rgb()).
+        
+        With copy=False the pixels are a view straight into shared memory: it
+        stays valid until the publisher reuses the slot two frames later, which
+        is_intact() can check after the view has been used.
+        """
+        while True:
+            sequence = int(self._sequences[0])
+            if sequence == 0 or sequence == self.last_sequence:
+                return None
+            slot = sequence % SLOTS
+            before = int(self._sequences[1 + slot])
+            if before != sequence * 2:
+                continue  # Slot already being rewritten; take the newer frame
+            pixels = self._slots[slot].copy() if copy else self._slots[slot]
+            if copy and int(self._sequences[1 + slot]) != before:
+                continue
+            self.last_sequence = sequence
+            return sequence, pixels
+    
+    def is_intact(self, sequence: int) -> bool:
+        """Check that a frame read with copy=False has not been overwritten yet."""
+        return int(self._sequences[1 + sequence % SLOTS]) == sequence * 2
+    
+    def rgb(self, pixels: np.ndarray) -> np.ndarray:
+        """Convert 32-bit pixels to a (height, width, 3) RGB array."""
+        height, width = pixels.shape
+        return np.ascontiguousarray(pixels.view(np.uint8).reshape(height, width, 4)[:, :, self.channels])
+    
+    def close(self):
+        self._sequences = None
+        self._slots = []
+        self._shm.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without letting this process's exit remove it."""
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attach registers the block for removal at exit
+        shm = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def _is_active(shm: shared_memory.SharedMemory) -> bool:
+    """Check whether an existing frame block still has a running publisher."""
+    if shm.size < FRAMES_OFFSET:
+        return False
+    pid, = PID.unpack_from(shm.buf, PID_OFFSET)
+    if pid:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True  # Running, under another user
+        return True
+    # No pid recorded: treat the block as live if frames are still arriving
+    sequences = _sequences(shm.buf)
+    try:
+        before = int(sequences[0])
+        time.sleep(STALE_CHECK_SECONDS)
+        return int(sequences[0]) != before
+    finally:
+        del sequences
+
+
+def main():
+    """Attach to a running game's frames and report the rate they arrive at."""
+    name = sys.argv[1] if len(sys.argv) > 1 else FRAME_SHM_NAME
+    reader = FrameReader(name)
+    sys.stdout.write(f"Reading {reader.size[0]}x{reader.size[1]} frames from {name}\n")
+    frames = 0
+    start = time.perf_counter()
+    try:
+        while True:
+            if reader.read() is None:
+                time.sleep(0.001)
+                continue
+            frames += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= 1.0:
+                sys.stdout.write(f"frame {reader.last_sequence}: {frames / elapsed:.1f} fps\n")
+                frames = 0
+                start = time.perf_counter()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
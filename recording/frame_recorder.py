@@ -0,0 +1,171 @@
+"""
+Gameplay video capture for Rock Paper Scissors Arena.
+
+Game hands every presented frame to a FrameRecorder. The frame loop only
+copies the frame's pixels into a free buffer of a preallocated ring and
+queues it; a background writer thread converts and writes buffers to disk.
+When the writer falls behind and no buffer is free, the frame is dropped and
+counted instead of stalling the loop.
+
+Output formats:
+    raw   one file of packed RGB24 frames, ready for
+          ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r FPS -i PATH
+    zlib  one file of length-prefixed zlib-compressed RGB24 frames
+    png   a directory of numbered PNG images
+
+A JSON sidecar (PATH.json, or capture.json in the png directory) records
+the frame size, rate and capture statistics.
+"""
+
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from config.settings import CAPTURE_FORMATS, CAPTURE_RING_SIZE, CAPTURE_ZLIB_LEVEL, TARGET_FPS
+
+# zlib format: compressed length before each frame
+FRAME_LENGTH = struct.Struct('<I')
+
+
+class FrameRecorder:
+    """Copies presented frames into a ring of buffers that a writer thread saves."""
+    
+    def __init__(self, path: str, size: Tuple[int, int], fmt: str = 'raw',
+                 ring_size: int = CAPTURE_RING_SIZE, fps: int = TARGET_FPS):
+        if fmt not in CAPTURE_FORMATS:
+            raise ValueError(f"Unknown capture format: {fmt}")
+        self.path = path
+        self.size = size
+        self.format = fmt
+        self.fps = fps
+        
+        # Buffers match a 32-bit surface's (x, y) pixel view in memory order,
+        # so each capture is a straight copy of the frame's rows
+        width, height = size
+        self._ring = [np.empty((width, height), dtype=np.uint32, order='F')
+                      for _ in range(ring_size)]
+        self._free: queue.Queue = queue.Queue()
+        for index in range(ring_size):
+            self._free.put(index)
+        self._filled: queue.Queue = queue.Queue()
+        self._channels: Optional[Tuple[int, int, int]] = None  # Byte offsets of R, G, B
+        
+        self.offered = 0   # Frames handed to capture()
+        self.captured = 0  # Frames copied into the ring
+        self.dropped = 0   # Frames skipped because every buffer was in use
+        self.written = 0   # Frames written to disk
+        self.bytes_written = 0
+        self.capture_seconds = 0.0  # Frame-loop time spent copying
+        self.write_seconds = 0.0    # Writer time spent converting and writing
+        self._start = 0.0
+        self._stop_time = 0.0
+        
+        self._file: Optional[BinaryIO] = None
+        if fmt == 'png':
+            os.makedirs(path, exist_ok=True)
+        else:
+            self._file = open(path, 'wb')
+        self._writer = threading.Thread(target=self._write_frames, name='frame-writer', daemon=True)
+        self._writer.start()
+    
+    def capture(self, surface: pygame.Surface):
+        """Queue a copy of a presented frame, or drop it if no buffer is free (never blocks)."""
+        self.offered += 1
+        if not self._start:
+            self._start = time.perf_counter()
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+        
+        start = time.perf_counter()
+        if self._channels is None:
+            self._channels = self._get_channels(surface)
+        pixels = pygame.surfarray.pixels2d(surface)
+        np.copyto(self._ring[index], pixels)
+        del pixels  # Unlock the surface
+        self._filled.put((index, self.captured))
+        self.captured += 1
+        self.capture_seconds += time.perf_counter() - start
+    
+    def _get_channels(self, surface: pygame.Surface) -> Tuple[int, int, int]:
+        if surface.get_size() != self.size:
+            raise ValueError(f"Frame size {surface.get_size()} does not match capture size {self.size}")
+        if surface.get_bytesize() != 4:
+            raise ValueError("Frame capture needs a 32-bit surface")
+        shifts = surface.get_shifts()
+        return shifts[0] // 8, shifts[1] // 8, shifts[2] // 8
+    
+    def _write_frames(self):
+        while True:
+            item = self._filled.get()
+            if item is None:
+                return
+            index, number = item
+            start = time.perf_counter()
+            # (x, y) Fortran buffer -> (y, x) rows of 4-byte pixels -> packed RGB
+            pixels = self._ring[index].T.view(np.uint8).reshape(self.size[1], self.size[0], 4)
+            rgb = np.ascontiguousarray(pixels[:, :, self._channels])
+            self._free.put(index)
+            self._write_frame(rgb, number)
+            self.written += 1
+            self.write_seconds += time.perf_counter() - start
+    
+    def _write_frame(self, rgb: np.ndarray, number: int):
+        if self.format == 'png':
+            image = pygame.image.frombuffer(rgb.tobytes(), self.size, 'RGB')
+            filename = os.path.join(self.path, f"frame_{number:06d}.png")
+            pygame.image.save(image, filename)
+            self.bytes_written += os.path.getsize(filename)
+            return
+        data = rgb.tobytes()
+        if self.format == 'zlib':
+            data = zlib.compress(data, CAPTURE_ZLIB_LEVEL)
+            self._file.write(FRAME_LENGTH.pack(len(data)))
+        self._file.write(data)
+        self.bytes_written += len(data)
+    
+    def stats(self) -> dict:
+        """Get capture statistics; capture_fps is the rate frames actually reached the ring."""
+        elapsed = (self._stop_time or time.perf_counter()) - self._start if self._start else 0.0
+        return {
+            'format': self.format,
+            'size': list(self.size),
+            'fps': self.fps,
+            'offered': self.offered,
+            'captured': self.captured,
+            'dropped': self.dropped,
+            'written': self.written,
+            'drop_rate': self.dropped / self.offered if self.offered else 0.0,
+            'seconds': elapsed,
+            'offered_fps': self.offered / elapsed if elapsed else 0.0,
+            'capture_fps': self.captured / elapsed if elapsed else 0.0,
+            'copy_ms': self.capture_seconds / self.captured * 1000 if self.captured else 0.0,
+            'write_fps': self.written / self.write_seconds if self.write_seconds else 0.0,
+            'bytes_written': self.bytes_written,
+        }
+    
+    def close(self) -> dict:
+        """Write out every queued frame, close the output and the sidecar; returns the stats."""
+        if self._writer.is_alive():
+            self._stop_time = time.perf_counter()
+            self._filled.put(None)
+            self._writer.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        stats = self.stats()
+        sidecar = (os.path.join(self.path, 'capture.json') if self.format == 'png'
+                   else self.path + '.json')
+        with open(sidecar, 'w') as f:
+            json.dump(stats, f, indent=2)
+        return stats
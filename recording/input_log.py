@@ -0,0 +1,270 @@
+"""
+Input-event recording and replay for Rock Paper Scissors Arena.
+
+A log is a small header (format version, simulation rate, seat count and the
+effects RNG seed) followed by fixed-size binary records. Timestamps are
+simulation steps, so replaying a log through the same fixed-step simulation
+reproduces the recorded game exactly, at any speed.
+"""
+
+import struct
+import time
+from typing import TYPE_CHECKING, BinaryIO, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+from core.enums import Choice, SceneType
+from core.input_dispatch import REMOTE_INPUT
+
+if TYPE_CHECKING:
+    from game import Game
+
+MAGIC = b'RPSL'
+VERSION = 2
+READABLE_VERSIONS = (1, 2)  # Version 1 logs only hold keyboard input
+
+# Header: magic, version, simulation Hz, seat count, effects seed
+HEADER = struct.Struct('<4sHHHQ')
+
+# Record types
+RECORD_KEY = 1    # KEYDOWN delivered to a scene: steps since scene start, key, mod
+RECORD_SCENE = 2  # Scene transition: absolute step, new scene
+RECORD_END = 3    # End of recording: absolute step
+RECORD_BUTTON = 4  # JOYBUTTONDOWN: steps since scene start, device, button
+RECORD_HAT = 5     # JOYHATMOTION: steps since scene start, device, hat, x, y
+RECORD_REMOTE = 6  # Remote player press: steps since scene start, seat, choice
+
+# Records are packed with no padding: type byte, uint32 step, then the payload
+# (a key record is 11 bytes: 1 + 4 + 4 for the key code + 2 for mod)
+KEY_RECORD = struct.Struct('<BIiH')
+SCENE_RECORD = struct.Struct('<BIB')
+END_RECORD = struct.Struct('<BI')
+BUTTON_RECORD = struct.Struct('<BIBB')
+HAT_RECORD = struct.Struct('<BIBBbb')
+REMOTE_RECORD = struct.Struct('<BIHB')
+
+# Records delivered to scenes as input events
+INPUT_RECORDS = (RECORD_KEY, RECORD_BUTTON, RECORD_HAT, RECORD_REMOTE)
+
+
+class LogRecord(NamedTuple):
+    """
+    One decoded record. step is scene-relative for input, absolute otherwise.
+    Joystick records keep the device in key and the button or hat in mod;
+    remote records keep the seat in key and the choice value in mod.
+    """
+    kind: int
+    step: int
+    key: int = 0
+    mod: int = 0
+    scene: Optional[SceneType] = None
+    value: Tuple[int, int] = (0, 0)
+    
+    def to_event(self) -> pygame.event.Event:
+        """Rebuild the input event this record was made from."""
+        if self.kind == RECORD_BUTTON:
+            return pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=self.key, button=self.mod)
+        if self.kind == RECORD_HAT:
+            return pygame.event.Event(pygame.JOYHATMOTION, instance_id=self.key, hat=self.mod,
+                                      value=self.value)
+        if self.kind == RECORD_REMOTE:
+            return pygame.event.Event(REMOTE_INPUT, seat=self.key, choice=Choice(self.mod))
+        return pygame.event.Event(pygame.KEYDOWN, key=self.key, mod=self.mod)
+
+
+class InputLog:
+    """A decoded input log."""
+    
+    def __init__(self, hz: int, seat_count: int, seed: int, records: List[LogRecord]):
+        self.hz = hz
+        self.seat_count = seat_count
+        self.seed = seed
+        self.records = records
+    
+    @property
+    def end_step(self) -> Optional[int]:
+        """Absolute step the recording stopped at (None if it was cut off)."""
+        for record in reversed(self.records):
+            if record.kind == RECORD_END:
+                return record.step
+        return None
+
+
+class InputRecorder:
+    """Appends key presses and scene transitions to a binary log file."""
+    
+    def __init__(self, path: str, hz: int, seat_count: int, seed: int):
+        self.path = path
+        self._file: Optional[BinaryIO] = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, hz, seat_count, seed))
+        self.records = 0
+    
+    def record_input(self, scene_step: int, code: tuple, mod: int = 0):
+        """Record an input (by its core.input_dispatch input code) handed to the current scene."""
+        kind = code[0]
+        if kind == 'key':
+            self._file.write(KEY_RECORD.pack(RECORD_KEY, scene_step, code[1], mod & 0xFFFF))
+        elif kind == 'button':
+            self._file.write(BUTTON_RECORD.pack(RECORD_BUTTON, scene_step, code[1], code[2]))
+        elif kind == 'hat':
+            x, y = code[3]
+            self._file.write(HAT_RECORD.pack(RECORD_HAT, scene_step, code[1], code[2], x, y))
+        elif kind == 'remote':
+            self._file.write(REMOTE_RECORD.pack(RECORD_REMOTE, scene_step, code[1], code[2]))
+        else:
+            return
+        self.records += 1
+    
+    def record_scene(self, step: int, scene: SceneType):
+        """Record a scene transition."""
+        self._file.write(SCENE_RECORD.pack(RECORD_SCENE, step, scene.value))
+        self.records += 1
+    
+    def close(self, step: int):
+        """Write the end marker and close the file."""
+        if self._file is None:
+            return
+        self._file.write(END_RECORD.pack(RECORD_END, step))
+        self._file.close()
+        self._file = None
+
+
+def read_input_log(path: str) -> InputLog:
+    """Read and decode an input log file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    magic, version, hz, seat_count, seed = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an input log")
+    if version not in READABLE_VERSIONS:
+        raise ValueError(f"Unsupported input log version {version}")
+    
+    records = []
+    offset = HEADER.size
+    while offset < len(data):
+        kind = data[offset]
+        if kind == RECORD_KEY:
+            _, step, key, mod = KEY_RECORD.unpack_from(data, offset)
+            records.append(LogRecord(kind, step, key=key, mod=mod))
+            offset += KEY_RECORD.size
+        elif kind == RECORD_SCENE:
+            _, step, scene = SCENE_RECORD.unpack_from(data, offset)
+            records.append(LogRecord(kind, step, scene=SceneType(scene)))
+            offset += SCENE_RECORD.size
+        elif kind == RECORD_END:
+            _, step = END_RECORD.unpack_from(data, offset)
+            records.append(LogRecord(kind, step))
+            offset += END_RECORD.size
+        elif kind == RECORD_BUTTON:
+            _, step, device, button = BUTTON_RECORD.unpack_from(data, offset)
+            records.append(LogRecord(kind, step, key=device, mod=button))
+            offset += BUTTON_RECORD.size
+        elif kind == RECORD_HAT:
+            _, step, device, hat, x, y = HAT_RECORD.unpack_from(data, offset)
+            records.append(LogRecord(kind, step, key=device, mod=hat, value=(x, y)))
+            offset += HAT_RECORD.size
+        elif kind == RECORD_REMOTE:
+            _, step, seat, choice = REMOTE_RECORD.unpack_from(data, offset)
+            records.append(LogRecord(kind, step, key=seat, mod=choice))
+            offset += REMOTE_RECORD.size
+        else:
+            raise ValueError(f"Corrupt input log: record type {kind} at byte {offset}")
+    return InputLog(hz, seat_count, seed, records)
+
+
+class SceneMonitor:
+    """Stands in for the recorder during replay and checks scene transitions."""
+    
+    def __init__(self, expected: List[LogRecord]):
+        self.expected = expected
+        self.seen = 0
+        self.desyncs: List[dict] = []
+    
+    def record_input(self, scene_step: int, code: tuple, mod: int = 0):
+        pass
+    
+    def record_scene(self, step: int, scene: SceneType):
+        if self.seen < len(self.expected):
+            record = self.expected[self.seen]
+            if (record.step, record.scene) != (step, scene):
+                self.desyncs.append({'step': step, 'expected': record.scene.name,
+                                     'expected_step': record.step, 'got': scene.name})
+        self.seen += 1
+    
+    def close(self, step: int):
+        pass
+
+
+def replay(game: 'Game', log: InputLog, render: bool = False,
+           max_steps: Optional[int] = None) -> dict:
+    """
+    Feed a log back through the game as fast as possible.
+    
+    Key records are delivered to the scene they were recorded in once it has
+    run as many steps as when they were recorded, then the simulation advances one step
+    at a time without waiting. Recorded scene transitions are checked against
+    the replayed ones; a mismatch is reported as a desync.
+    
+    Args:
+        game: A Game created with the log's seed and seat count
+        log: The decoded log
+        render: Render (and present) a frame after every step
+        max_steps: Stop after this many steps (default: the recorded end)
+    
+    Returns:
+        Dict with steps, simulated and wall seconds, speedup and desyncs
+    """
+    clock = game.sim_clock
+    if round(1 / clock.dt) != log.hz:
+        raise ValueError(f"Log was recorded at {log.hz} Hz, simulation runs at {round(1 / clock.dt)} Hz")
+    end_step = max_steps if max_steps is not None else log.end_step
+    # Tag each input with how many scene transitions preceded it, since input
+    # steps restart at every scene
+    keys = []
+    transitions = 0
+    for record in log.records:
+        if record.kind == RECORD_SCENE:
+            transitions += 1
+        elif record.kind in INPUT_RECORDS:
+            keys.append((transitions, record))
+    monitor = SceneMonitor([r for r in log.records if r.kind == RECORD_SCENE])
+    game.recorder = monitor
+    
+    start = time.perf_counter()
+    start_step = clock.steps
+    next_key = 0
+    while game.running:
+        # Deliver every key recorded at the current point in the scene
+        while next_key < len(keys):
+            scene_index, record = keys[next_key]
+            if scene_index > monitor.seen or (scene_index == monitor.seen and
+                                              record.step > clock.steps - game.scene_start_step):
+                break
+            game.handle_event(record.to_event())
+            next_key += 1
+        
+        if end_step is not None and clock.steps >= end_step:
+            break
+        if end_step is None and next_key >= len(keys):
+            break
+        
+        clock.accumulate(clock.dt)
+        clock.step()
+        game.update_step()
+        if render:
+            game.draw()
+        elif game.latency.enabled:
+            game.latency.discard_pending()
+    
+    wall = time.perf_counter() - start
+    steps = clock.steps - start_step
+    return {
+        'steps': steps,
+        'simulated_seconds': steps * clock.dt,
+        'wall_seconds': wall,
+        'speedup': steps * clock.dt / wall if wall else 0.0,
+        'keys': next_key,
+        'desyncs': monitor.desyncs,
+        'final_scene': game.current_scene_type.name,
+    }
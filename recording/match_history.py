@@ -0,0 +1,342 @@
+"""
+Match history for Rock Paper Scissors Arena.
+
+Game reports every game, round and per-seat choice to a MatchHistory, which
+stores them in an SQLite database. The frame loop only puts rows on a queue;
+a background writer thread inserts them in batched transactions, so a slow
+disk never stalls a frame.
+
+Tables:
+    games    one row per game: start/end time, local day, seats, players, winner
+    rounds   one row per resolved round: outcome and winning/losing choice
+    choices  one row per seat per round: choice, reaction time, eliminated
+
+Game ids are assigned by SQLite when the writer inserts the game, so several
+tables can share one database file. The frame loop tags its rows with a
+per-process game key that the writer maps to the id.
+
+Reaction times are simulation time from the countdown starting to the seat
+locking in its choice, so replays record the same values.
+
+    python -m recording.match_history PATH [DAY]
+
+prints per-seat and per-day summaries.
+"""
+
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import HISTORY_BATCH_SIZE, HISTORY_FLUSH_INTERVAL, SIMULATION_HZ
+from core.enums import Choice
+from core.rules import RoundResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    day TEXT NOT NULL,
+    seat_count INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    rounds INTEGER NOT NULL DEFAULT 0,
+    winner_seat INTEGER,
+    seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    round INTEGER NOT NULL,
+    resolved_at REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    winning_choice TEXT,
+    losing_choice TEXT,
+    alive INTEGER NOT NULL,
+    eliminated INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round)
+);
+CREATE TABLE IF NOT EXISTS choices (
+    game_id INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    seat INTEGER NOT NULL,
+    choice TEXT,
+    reaction_ms REAL,
+    eliminated INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round, seat)
+);
+CREATE INDEX IF NOT EXISTS games_by_day ON games (day);
+CREATE INDEX IF NOT EXISTS choices_by_seat ON choices (seat, game_id);
+"""
+
+# Every statement but INSERT_GAME takes the game id as its first parameter
+INSERT_GAME = "INSERT INTO games (started_at, day, seat_count, players, seed) VALUES (?, ?, ?, ?, ?)"
+FINISH_GAME = "UPDATE games SET ended_at = ?2, rounds = ?3, winner_seat = ?4 WHERE id = ?1"
+INSERT_ROUND = ("INSERT OR REPLACE INTO rounds (game_id, round, resolved_at, outcome, winning_choice, "
+                "losing_choice, alive, eliminated) VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+INSERT_CHOICE = ("INSERT OR REPLACE INTO choices (game_id, round, seat, choice, reaction_ms, eliminated) "
+                 "VALUES (?, ?, ?, ?, ?, ?)")
+
+# Round outcomes
+OUTCOME_STANDARD = 'standard'    # unbeaten choices eliminate what they beat
+OUTCOME_MAJORITY = 'majority'    # every present choice beaten, the majority eliminates what it beats
+OUTCOME_NO_CHOICE = 'no_choice'  # seats that didn't choose are eliminated
+OUTCOME_DRAW = 'draw'            # nobody is eliminated
+
+
+def _choice_name(choice: Optional[Choice]) -> Optional[str]:
+    if choice is None or choice == Choice.NONE:
+        return None
+    return choice.name.lower()
+
+
+class MatchHistory:
+    """Queues game, round and choice rows for a background SQLite writer."""
+    
+    def __init__(self, path: str, batch_size: int = HISTORY_BATCH_SIZE,
+                 flush_interval: float = HISTORY_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None  # Set by the writer; no more rows are queued
+        self._next_game_key = 1
+        self._game_ids: Dict[int, int] = {}  # Writer side: game key -> games.id
+        
+        self.game_key: Optional[int] = None  # Current game, until the writer knows its id
+        self.round_count = 0
+        self._reaction_steps: Optional[np.ndarray] = None  # Per seat; -1 = not chosen yet
+        
+        self.queued = 0        # Rows handed to the writer
+        self.written = 0       # Rows committed
+        self.transactions = 0
+        self.write_seconds = 0.0
+        
+        # The writer owns the connection; wait for it to open the database so
+        # a bad path fails at startup rather than silently mid-event
+        self._writer = threading.Thread(target=self._write_rows, name='match-history', daemon=True)
+        self._writer.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+    
+    # Frame-loop side
+    
+    def start_game(self, players: Sequence, seed: Optional[int] = None):
+        """Open a game record for the seats that joined."""
+        state = players.state
+        now = time.time()
+        self.game_key = self._next_game_key
+        self._next_game_key += 1
+        self.round_count = 0
+        self._reaction_steps = np.full(len(players), -1, dtype=np.int64)
+        self._put(INSERT_GAME, (now, time.strftime('%Y-%m-%d', time.localtime(now)),
+                                len(players), int(np.count_nonzero(state.joined)), seed))
+    
+    def start_round(self):
+        """Forget the previous round's reaction times (call when the countdown starts)."""
+        if self._reaction_steps is not None:
+            self._reaction_steps[:] = -1
+    
+    def note_choices(self, players: Sequence, round_step: int):
+        """Stamp seats that locked in a choice since the last call with the round's current step."""
+        steps = self._reaction_steps
+        if steps is None:
+            return
+        new = (players.state.choice != Choice.NONE.value) & (steps < 0)
+        if new.any():
+            steps[new] = round_step
+    
+    def record_round(self, result: RoundResult):
+        """Record a judged round."""
+        if self.game_key is None:
+            return
+        self.round_count += 1
+        if result.is_no_choice:
+            outcome = OUTCOME_NO_CHOICE
+        elif result.is_draw:
+            outcome = OUTCOME_DRAW
+        else:
+            outcome = OUTCOME_MAJORITY if result.is_majority else OUTCOME_STANDARD
+        
+        self._put(INSERT_ROUND, (self.round_count, time.time(), outcome,
+                                 _choice_name(result.winning_choice), _choice_name(result.losing_choice),
+                                 len(result.contenders), len(result.eliminated)))
+        steps = self._reaction_steps
+        eliminated = {player.id for player in result.eliminated}
+        rows = []
+        for player in result.contenders:
+            step = int(steps[player.id - 1])
+            rows.append((self.round_count, player.id, _choice_name(player.choice),
+                         step * 1000 / SIMULATION_HZ if step >= 0 else None,
+                         int(player.id in eliminated)))
+        self._put_many(INSERT_CHOICE, rows)
+    
+    def finish_game(self, winner=None):
+        """Close the current game record with its winner (None if nobody won)."""
+        if self.game_key is None:
+            return
+        self._put(FINISH_GAME, (time.time(), self.round_count, winner.id if winner is not None else None))
+        self.game_key = None
+        self._reaction_steps = None
+    
+    def _put(self, sql: str, params: tuple):
+        self._put_many(sql, [params])
+    
+    def _put_many(self, sql: str, rows: List[tuple]):
+        # Once the writer has failed nothing would drain the queue
+        if rows and self._error is None:
+            self._queue.put((sql, self.game_key, rows))
+            self.queued += len(rows)
+    
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The database error that stopped the writer, if any."""
+        return self._error
+    
+    def close(self) -> dict:
+        """Write everything still queued and close the database; returns the stats (see 'error')."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        return self.stats()
+    
+    def stats(self) -> dict:
+        return {
+            'queued': self.queued,
+            'written': self.written,
+            'transactions': self.transactions,
+            'rows_per_transaction': self.written / self.transactions if self.transactions else 0.0,
+            'write_ms': self.write_seconds * 1000,
+            'error': repr(self._error) if self._error is not None else None,
+        }
+    
+    # Writer thread
+    
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        # WAL with NORMAL sync: commits append to the log and only checkpoints
+        # wait on the disk
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+    
+    def _write_rows(self):
+        try:
+            connection = self._open()
+        except (sqlite3.Error, OSError) as error:
+            self._error = error
+            self._ready.set()
+            return
+        self._ready.set()
+        
+        pending = 0
+        last_commit = time.perf_counter()
+        try:
+            while True:
+                try:
+                    timeout = max(0.0, self.flush_interval - (time.perf_counter() - last_commit))
+                    item = self._queue.get(timeout=timeout if pending else None)
+                except queue.Empty:
+                    item = ()
+                if item is None:
+                    break
+                if item:
+                    start = time.perf_counter()
+                    self._execute(connection, *item)
+                    pending += len(item[2])
+                    self.write_seconds += time.perf_counter() - start
+                if pending and (pending >= self.batch_size or not item
+                                or time.perf_counter() - last_commit >= self.flush_interval):
+                    pending = self._commit(connection, pending)
+                    last_commit = time.perf_counter()
+            if pending:
+                self._commit(connection, pending)
+        except sqlite3.Error as error:
+            # Drop the uncommitted batch and stop; the frame loop stops queueing
+            # and close()/stats() report the error
+            self._error = error
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                pass
+        finally:
+            connection.close()
+    
+    def _execute(self, connection: sqlite3.Connection, sql: str, game_key: int, rows: List[tuple]):
+        if sql == INSERT_GAME:
+            self._game_ids[game_key] = connection.execute(sql, rows[0]).lastrowid
+            return
+        game_id = self._game_ids[game_key]
+        connection.executemany(sql, [(game_id,) + row for row in rows])
+        if sql == FINISH_GAME:
+            del self._game_ids[game_key]
+    
+    def _commit(self, connection: sqlite3.Connection, pending: int) -> int:
+        start = time.perf_counter()
+        connection.commit()
+        self.write_seconds += time.perf_counter() - start
+        self.written += pending
+        self.transactions += 1
+        return 0
+
+
+# Queries (separate connections; safe while a game is writing)
+
+def seat_summary(path: str) -> List[Tuple]:
+    """Per seat: games played, games won, rounds, mean reaction ms, favourite choice."""
+    with sqlite3.connect(path) as connection:
+        return connection.execute("""
+            SELECT c.seat,
+                   COUNT(DISTINCT c.game_id),
+                   (SELECT COUNT(*) FROM games g WHERE g.winner_seat = c.seat),
+                   COUNT(*),
+                   AVG(c.reaction_ms),
+                   (SELECT f.choice FROM choices f WHERE f.seat = c.seat AND f.choice IS NOT NULL
+                    GROUP BY f.choice ORDER BY COUNT(*) DESC LIMIT 1)
+            FROM choices c
+            GROUP BY c.seat
+            ORDER BY c.seat
+        """).fetchall()
+
+
+def daily_summary(path: str, day: Optional[str] = None) -> List[Tuple]:
+    """Per day (or one YYYY-MM-DD day): games, finished games, rounds, mean players, mean minutes."""
+    where, params = ("WHERE day = ?", (day,)) if day else ("", ())
+    with sqlite3.connect(path) as connection:
+        return connection.execute(f"""
+            SELECT day, COUNT(*), COUNT(ended_at), SUM(rounds), AVG(players),
+                   AVG((ended_at - started_at) / 60.0)
+            FROM games
+            {where}
+            GROUP BY day
+            ORDER BY day
+        """, params).fetchall()
+
+
+def main():
+    """Print per-seat and per-day summaries of a match history database."""
+    if len(sys.argv) not in (2, 3):
+        sys.stderr.write(__doc__)
+        sys.exit(2)
+    path = sys.argv[1]
+    day = sys.argv[2] if len(sys.argv) == 3 else None
+    
+    sys.stdout.write(f"{'seat':>4} {'games':>6} {'wins':>5} {'rounds':>7} {'react ms':>9}  favourite\n")
+    for seat, games, wins, rounds, reaction, favourite in seat_summary(path):
+        reaction = f"{reaction:9.0f}" if reaction is not None else f"{'-':>9}"
+        sys.stdout.write(f"{seat:>4} {games:>6} {wins:>5} {rounds:>7} {reaction}  {favourite or '-'}\n")
+    
+    sys.stdout.write(f"\n{'day':<10} {'games':>6} {'done':>5} {'rounds':>7} {'players':>8} {'minutes':>8}\n")
+    for row_day, games, finished, rounds, players, minutes in daily_summary(path, day):
+        minutes = f"{minutes:8.1f}" if minutes is not None else f"{'-':>8}"
+        sys.stdout.write(f"{row_day:<10} {games:>6} {finished:>5} {rounds or 0:>7} {players:8.1f} {minutes}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,20 @@
 Scene management for Rock Paper Scissors Arena.
 """
 
-from scenes.base import Scene
-from scenes.menu import MenuScene
-from scenes.game_scene import GameScene
-from scenes.resolution import ResolutionScene
-from scenes.victory import VictoryScene
+from config.lazy import lazy_exports
 
-__all__ = ['Scene', 'MenuScene', 'GameScene', 'ResolutionScene', 'VictoryScene']
+# Public name -> submodule it lives in
+_EXPORTS = {
+    'Scene': 'scenes.base',
+    'MenuScene': 'scenes.menu',
+    'GameScene': 'scenes.game_scene',
+    'ResolutionScene': 'scenes.resolution',
+    'VictoryScene': 'scenes.victory',
+    'SceneRegistry': 'scenes.registry',
+}
+
+__all__ = ['Scene', 'MenuScene', 'GameScene', 'ResolutionScene', 'VictoryScene', 'SceneRegistry']
+
+# Scene modules are imported on first use, so importing one doesn't pull in
+# all the others (see main.py --startup-profile)
+__getattr__ = lazy_exports(globals(), _EXPORTS)
@@ -9,15 +9,23 @@ from typing import List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from core.player import Player
 
+from core.clock import SimulationClock
 from core.enums import SceneType
 
 
 class Scene(ABC):
     """Abstract base class for all game scenes."""
     
-    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface):
+    # Scenes that implement build_sprites/update_sprites can be drawn in retained mode
+    supports_retained = False
+    
+    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface,
+                 clock: SimulationClock):
         self.screen = screen
         self.bg_surface = bg_surface
+        self.clock = clock
+        self.sprites: Optional[pygame.sprite.LayeredDirty] = None
+        self._full_repaint = True
     
     @abstractmethod
     def handle_event(self, event: pygame.event.Event, players: List['Player']) -> Optional[SceneType]:
@@ -28,9 +36,9 @@ class Scene(ABC):
         pass
     
     @abstractmethod
-    def update(self, players: List['Player']) -> Optional[SceneType]:
+    def update(self, players: List['Player'], dt: float) -> Optional[SceneType]:
         """
-        Update scene state.
+        Advance scene state by one fixed simulation step of dt seconds.
         Returns a SceneType if scene should change, None otherwise.
         """
         pass
@@ -43,3 +51,32 @@ class Scene(ABC):
     def draw_background(self):
         """Draw the pre-rendered background."""
         self.screen.blit(self.bg_surface, (0, 0))
+    
+    def build_sprites(self, players: List['Player']):
+        """Create the scene's retained-mode sprites and add them to self.sprites."""
+        pass
+    
+    def update_sprites(self, players: List['Player']):
+        """Sync retained-mode sprites with the current state."""
+        pass
+    
+    def invalidate(self):
+        """Force a full repaint on the next retained-mode draw (e.g. after a scene change)."""
+        self._full_repaint = True
+    
+    def draw_retained(self, players: List['Player']) -> List[pygame.Rect]:
+        """
+        Draw the scene in retained mode.
+        Only areas covered by changed sprites are repainted.
+        Returns the list of screen rects that changed.
+        """
+        if self.sprites is None:
+            self.sprites = pygame.sprite.LayeredDirty()
+            self.sprites.clear(self.screen, self.bg_surface)
+            self.build_sprites(players)
+        
+        self.update_sprites(players)
+        if self._full_repaint:
+            self._full_repaint = False
+            self.sprites.repaint_rect(self.screen.get_rect())
+        return self.sprites.draw(self.screen)
@@ -7,31 +7,44 @@ import math
 from typing import List, Optional
 
 from scenes.base import Scene
+from core.clock import SimulationClock
 from core.enums import SceneType, Choice
+from core.input_dispatch import INPUT_EVENTS, input_index
 from core.player import Player
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COUNTDOWN_DURATION, SPEEDUP_THRESHOLD
 from config.colors import COLORS
-from graphics.fonts import font_large, font_medium, font_small
+from graphics.fonts import get_font, render_text, blit_text
 from graphics.player_slot import draw_player_slot
+from graphics.sprites import ImageSprite, TextSprite, SlotSprite, LAYER_OVERLAY
+
+# The countdown's color and scale animate continuously; they are snapped to
+# these steps so the rendered timer is reused for a few frames at a time
+TIMER_COLOR_STEP = 8
+TIMER_SCALE_STEP = 0.05
 
 
 class GameScene(Scene):
     """Game scene where players choose rock, paper, or scissors."""
     
-    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface):
-        super().__init__(screen, bg_surface)
+    supports_retained = True
+    
+    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface,
+                 clock: SimulationClock):
+        super().__init__(screen, bg_surface, clock)
         self.countdown_duration = COUNTDOWN_DURATION
-        self.countdown_start = 0
+        self.countdown_start = 0.0  # Simulation time (seconds) when the countdown started
         self.round_number = 1
         self.speedup_triggered = False
-        self.speedup_time = 0  # When speedup was triggered
+        self.speedup_time = 0.0  # Simulation time when speedup was triggered
         self.time_at_speedup = 0  # Remaining time when speedup happened
+        self._timer_key = None
+        self._timer_surface: Optional[pygame.Surface] = None
     
     def start_countdown(self):
         """Start the countdown timer."""
-        self.countdown_start = pygame.time.get_ticks()
+        self.countdown_start = self.clock.now
         self.speedup_triggered = False
-        self.speedup_time = 0
+        self.speedup_time = 0.0
         self.time_at_speedup = 0
     
     def reset_round(self):
@@ -44,15 +57,20 @@ class GameScene(Scene):
         self.round_number = 1
         self.start_countdown()
     
-    def get_remaining_time(self) -> float:
-        """Get remaining countdown time in seconds."""
+    def get_remaining_time(self, now: Optional[float] = None) -> float:
+        """
+        Get remaining countdown time in seconds.
+        Uses simulation time unless a time (e.g. the render time) is given.
+        """
+        if now is None:
+            now = self.clock.now
         if self.speedup_triggered:
             # Calculate time since speedup, starting from min(3, time_at_speedup)
-            elapsed_since_speedup = (pygame.time.get_ticks() - self.speedup_time) / 1000
+            elapsed_since_speedup = now - self.speedup_time
             speedup_start = min(float(SPEEDUP_THRESHOLD), self.time_at_speedup)
             return max(0, speedup_start - elapsed_since_speedup)
         else:
-            elapsed = (pygame.time.get_ticks() - self.countdown_start) / 1000
+            elapsed = now - self.countdown_start
             return max(0, self.countdown_duration - elapsed)
     
     def all_players_chosen(self, players: List[Player]) -> bool:
@@ -66,24 +84,25 @@ class GameScene(Scene):
         """Speed up the countdown to 3 seconds max."""
         if not self.speedup_triggered:
             self.speedup_triggered = True
-            self.speedup_time = pygame.time.get_ticks()
+            self.speedup_time = self.clock.now
             # Calculate current remaining time
-            elapsed = (pygame.time.get_ticks() - self.countdown_start) / 1000
+            elapsed = self.clock.now - self.countdown_start
             self.time_at_speedup = max(0, self.countdown_duration - elapsed)
     
     def handle_event(self, event: pygame.event.Event, players: List[Player]) -> Optional[SceneType]:
         """Handle game input events."""
-        if event.type != pygame.KEYDOWN:
+        if event.type not in INPUT_EVENTS:
             return None
         
-        # Let players make their choices
-        for player in players:
-            if player.joined and player.alive:
-                player.handle_input(event.key)
+        # Let the bound player make their choice
+        bound = input_index.lookup(event, players)
+        if bound:
+            player, choice = bound
+            player.handle_action(choice)
         
         return None
     
-    def update(self, players: List[Player]) -> Optional[SceneType]:
+    def update(self, players: List[Player], dt: float) -> Optional[SceneType]:
         """Update game state."""
         # Check if all players have chosen - trigger speedup
         if not self.speedup_triggered and self.all_players_chosen(players):
@@ -111,7 +130,7 @@ class GameScene(Scene):
         else:
             # Transition from orange to red, with pulsing
             t = (3 - remaining) / 3
-            pulse = (math.sin(pygame.time.get_ticks() / 100) + 1) / 2
+            pulse = (math.sin(self.clock.render_time * 10) + 1) / 2
             red_intensity = 200 + int(55 * pulse)
             return (
                 red_intensity,
@@ -131,7 +150,7 @@ class GameScene(Scene):
             # Grow from 1.3 to 2.0 with pulsing
             t = (3 - remaining) / 3
             base_scale = 1.3 + (0.7 * t)
-            pulse = (math.sin(pygame.time.get_ticks() / 80) + 1) / 2 * 0.15
+            pulse = (math.sin(self.clock.render_time * 12.5) + 1) / 2 * 0.15
             return base_scale + pulse
     
     def get_timer_shake(self, remaining: float) -> tuple:
@@ -141,15 +160,124 @@ class GameScene(Scene):
         
         # Shake intensity increases as time runs out
         intensity = (2 - remaining) / 2 * 8
-        shake_x = math.sin(pygame.time.get_ticks() / 30) * intensity
-        shake_y = math.cos(pygame.time.get_ticks() / 25) * intensity * 0.5
+        time_ms = self.clock.render_time * 1000
+        shake_x = math.sin(time_ms / 30) * intensity
+        shake_y = math.cos(time_ms / 25) * intensity * 0.5
         return (int(shake_x), int(shake_y))
     
+    def render_timer(self, remaining: float) -> pygame.Surface:
+        """
+        Render the countdown (glow, shadow and number) into one surface.
+        Returns the same surface object while its look is unchanged.
+        """
+        # Get timer styling
+        timer_color = tuple(min(255, round(c / TIMER_COLOR_STEP) * TIMER_COLOR_STEP)
+                            for c in self.get_timer_color(remaining))
+        timer_scale = round(self.get_timer_scale(remaining) / TIMER_SCALE_STEP) * TIMER_SCALE_STEP
+        
+        # Countdown number - render at base size then scale
+        countdown_num = int(remaining) + 1
+        
+        # Use different font sizes from the ladder based on scale for better quality
+        if timer_scale > 1.5:
+            font_name = 'huge'
+        elif timer_scale > 1.2:
+            font_name = 'xlarge'
+        else:
+            font_name = 'large'
+        
+        timer_key = (countdown_num, timer_color, timer_scale, font_name, remaining <= 3)
+        if timer_key == self._timer_key:
+            return self._timer_surface
+        
+        # The animated color stays out of the shared text cache, which would
+        # otherwise fill up with one-frame entries and evict the static labels
+        countdown_text = get_font(font_name).render(str(countdown_num), True, timer_color)
+        shadow_text = render_text(font_name, str(countdown_num), (0, 0, 0))
+        
+        # Scale if needed
+        if timer_scale != 1.0 and font_name == 'large':
+            new_size = (int(countdown_text.get_width() * timer_scale),
+                       int(countdown_text.get_height() * timer_scale))
+            countdown_text = pygame.transform.smoothscale(countdown_text, new_size)
+            shadow_text = pygame.transform.smoothscale(shadow_text, new_size)
+        
+        # Leave room for the glow around the number
+        pad = 20
+        timer_surface = pygame.Surface((countdown_text.get_width() + pad * 2,
+                                        countdown_text.get_height() + pad * 2), pygame.SRCALPHA)
+        
+        # Add glow effect for urgency
+        if remaining <= 3:
+            glow_color = (*timer_color[:3], 80)
+            pygame.draw.ellipse(timer_surface, glow_color, timer_surface.get_rect())
+        
+        # Draw shadow for better visibility, then the main timer
+        timer_surface.blit(shadow_text, (pad + 4, pad + 4))
+        timer_surface.blit(countdown_text, (pad, pad))
+        
+        self._timer_key = timer_key
+        self._timer_surface = timer_surface
+        return timer_surface
+    
+    def get_timer_center(self, remaining: float) -> tuple:
+        """Get the timer's center point, including urgency shake."""
+        shake_x, shake_y = self.get_timer_shake(remaining)
+        return (SCREEN_WIDTH // 2 + shake_x, SCREEN_HEIGHT // 2 - 50 + shake_y)
+    
+    def get_instructions(self, remaining: float) -> tuple:
+        """Get instruction text and color - reacts to urgency."""
+        if remaining > 3:
+            return "VÄLJ DITT VAPEN!", COLORS['white']
+        elif remaining > 1:
+            return "SKYNDA DIG!", COLORS['orange']
+        return "TIDEN ÄR NÄSTAN SLUT!", COLORS['red']
+    
+    def build_sprites(self, players: List[Player]):
+        """Create sprites for player slots, the countdown and status text."""
+        self.slot_sprites = {player.id: SlotSprite() for player in players}
+        self.timer_sprite = ImageSprite(LAYER_OVERLAY)
+        self.inst_sprite = TextSprite()
+        self.round_sprite = TextSprite()
+        self.ready_sprite = TextSprite()
+        self.sprites.add(*self.slot_sprites.values(), self.timer_sprite,
+                         self.inst_sprite, self.round_sprite, self.ready_sprite)
+    
+    def update_sprites(self, players: List[Player]):
+        """Sync sprites with the countdown and player choices."""
+        remaining = self.get_remaining_time(self.clock.render_time)
+        
+        for player in players:
+            slot_sprite = self.slot_sprites[player.id]
+            if player.joined and player.alive:
+                slot_sprite.sync(player, show_choice=False, show_controls=True)
+            else:
+                slot_sprite.hide()
+        
+        if remaining > 0:
+            self.timer_sprite.show_centered(self.render_timer(remaining),
+                                            self.get_timer_center(remaining))
+            inst_text, inst_color = self.get_instructions(remaining)
+            self.inst_sprite.set_text('medium', inst_text, inst_color,
+                                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+        else:
+            self.timer_sprite.hide()
+            self.inst_sprite.hide()
+        
+        self.round_sprite.set_text('small', f"Runda {self.round_number}", COLORS['silver'],
+                                   (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
+        
+        if self.all_players_chosen(players) and remaining > 0:
+            self.ready_sprite.set_text('small', "Alla spelare redo!", COLORS['green'],
+                                       (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
+        else:
+            self.ready_sprite.hide()
+    
     def draw(self, players: List[Player]):
         """Draw the game scene."""
         self.draw_background()
         
-        remaining = self.get_remaining_time()
+        remaining = self.get_remaining_time(self.clock.render_time)
         
         # Draw player slots first (behind timer) - only alive players
         for player in players:
@@ -157,76 +285,19 @@ class GameScene(Scene):
                 draw_player_slot(self.screen, player, show_choice=False, show_controls=True)
         
         if remaining > 0:
-            # Get timer styling
-            timer_color = self.get_timer_color(remaining)
-            timer_scale = self.get_timer_scale(remaining)
-            shake_x, shake_y = self.get_timer_shake(remaining)
-            
-            # Countdown number - render at base size then scale
-            countdown_num = int(remaining) + 1
+            timer_surface = self.render_timer(remaining)
+            timer_rect = timer_surface.get_rect(center=self.get_timer_center(remaining))
+            self.screen.blit(timer_surface, timer_rect)
             
-            # Use different font sizes based on scale for better quality
-            if timer_scale > 1.5:
-                base_font = pygame.font.Font(None, 200)
-            elif timer_scale > 1.2:
-                base_font = pygame.font.Font(None, 160)
-            else:
-                base_font = font_large()
-            
-            countdown_text = base_font.render(str(countdown_num), True, timer_color)
-            
-            # Scale if needed
-            if timer_scale != 1.0 and base_font == font_large():
-                new_size = (int(countdown_text.get_width() * timer_scale),
-                           int(countdown_text.get_height() * timer_scale))
-                countdown_text = pygame.transform.smoothscale(countdown_text, new_size)
-            
-            # Add glow effect for urgency
-            if remaining <= 3:
-                glow_surf = pygame.Surface((countdown_text.get_width() + 40, 
-                                           countdown_text.get_height() + 40), pygame.SRCALPHA)
-                glow_color = (*timer_color[:3], 80)
-                pygame.draw.ellipse(glow_surf, glow_color, glow_surf.get_rect())
-                glow_rect = glow_surf.get_rect(center=(SCREEN_WIDTH // 2 + shake_x, 
-                                                       SCREEN_HEIGHT // 2 - 50 + shake_y))
-                self.screen.blit(glow_surf, glow_rect)
-            
-            # Draw shadow for better visibility
-            shadow_text = base_font.render(str(countdown_num), True, (0, 0, 0))
-            if timer_scale != 1.0 and base_font == font_large():
-                shadow_text = pygame.transform.smoothscale(shadow_text, new_size)
-            shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 4 + shake_x, 
-                                                       SCREEN_HEIGHT // 2 - 46 + shake_y))
-            self.screen.blit(shadow_text, shadow_rect)
-            
-            # Draw main timer
-            countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH // 2 + shake_x, 
-                                                             SCREEN_HEIGHT // 2 - 50 + shake_y))
-            self.screen.blit(countdown_text, countdown_rect)
-            
-            # Instructions - also react to urgency
-            if remaining > 3:
-                inst_text = "VÄLJ DITT VAPEN!"
-                inst_color = COLORS['white']
-            elif remaining > 1:
-                inst_text = "SKYNDA DIG!"
-                inst_color = COLORS['orange']
-            else:
-                inst_text = "TIDEN ÄR NÄSTAN SLUT!"
-                inst_color = COLORS['red']
-            
-            choose_text = font_medium().render(inst_text, True, inst_color)
-            choose_rect = choose_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-            self.screen.blit(choose_text, choose_rect)
+            inst_text, inst_color = self.get_instructions(remaining)
+            blit_text(self.screen, 'medium', inst_text, inst_color,
+                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         
         # Round indicator
-        round_text = font_small().render(f"Runda {self.round_number}", True, COLORS['silver'])
-        round_rect = round_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
-        self.screen.blit(round_text, round_rect)
+        blit_text(self.screen, 'small', f"Runda {self.round_number}", COLORS['silver'],
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
         
         # Show "All players ready!" message when everyone has chosen
         if self.all_players_chosen(players) and remaining > 0:
-            ready_text = font_small().render("Alla spelare redo!", True, COLORS['green'])
-            ready_rect = ready_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
-            self.screen.blit(ready_text, ready_rect)
-
+            blit_text(self.screen, 'small', "Alla spelare redo!", COLORS['green'],
+                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
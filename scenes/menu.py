@@ -8,30 +8,36 @@ from typing import List, Optional
 from scenes.base import Scene
 from core.enums import SceneType, Choice
 from core.rules import get_joined_count
+from core.input_dispatch import INPUT_EVENTS, input_index
 from core.player import Player
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from config.colors import COLORS
-from graphics.fonts import font_large, font_medium, font_small
+from graphics.fonts import blit_text
 from graphics.player_slot import draw_player_slot
+from graphics.sprites import TextSprite, SlotSprite
 
 
 class MenuScene(Scene):
     """Main menu scene where players can join the game."""
     
+    supports_retained = True
+    
     def handle_event(self, event: pygame.event.Event, players: List[Player]) -> Optional[SceneType]:
         """Handle menu input events."""
-        if event.type != pygame.KEYDOWN:
+        if event.type not in INPUT_EVENTS:
             return None
         
-        # Check for player ready (left/rock key) or unready (right/scissors key)
-        for player in players:
-            if event.key == player.rock_key:
+        # Check for player ready (left/rock input) or unready (right/scissors input)
+        bound = input_index.lookup(event, players)
+        if bound:
+            player, choice = bound
+            if choice == Choice.ROCK:
                 player.joined = True
-            elif event.key == player.scissors_key:
+            elif choice == Choice.SCISSORS:
                 player.joined = False
         
         # Start game with space if enough players
-        if event.key == pygame.K_SPACE and get_joined_count(players) >= 2:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE and get_joined_count(players) >= 2:
             # Initialize players for game
             for player in players:
                 player.alive = player.joined
@@ -39,40 +45,67 @@ class MenuScene(Scene):
         
         return None
     
-    def update(self, players: List[Player]) -> Optional[SceneType]:
+    def update(self, players: List[Player], dt: float) -> Optional[SceneType]:
         """Update menu state (nothing to update)."""
         return None
     
+    def get_instructions(self, joined: int) -> tuple:
+        """Get the instruction text and color for the current join count."""
+        if joined < 2:
+            return f"Behöver {2 - joined} spelare till för att starta", COLORS['orange']
+        return "Tryck MELLANSLAG för att starta!", COLORS['green']
+    
+    def build_sprites(self, players: List[Player]):
+        """Create sprites for the title cards, instructions and player slots."""
+        self.title_sprite = TextSprite()
+        self.subtitle_sprite = TextSprite()
+        self.inst_sprite = TextSprite()
+        self.count_sprite = TextSprite()
+        self.slot_sprites = {player.id: SlotSprite() for player in players}
+        self.sprites.add(self.title_sprite, self.subtitle_sprite,
+                         self.inst_sprite, self.count_sprite,
+                         *self.slot_sprites.values())
+    
+    def update_sprites(self, players: List[Player]):
+        """Sync menu sprites with the join state."""
+        self.title_sprite.set_text('large', "STEN SAX PÅSE", COLORS['gold'],
+                                   (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
+        self.subtitle_sprite.set_text('medium', "ARENA", COLORS['cyan'],
+                                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
+        
+        joined = get_joined_count(players)
+        inst_text, inst_color = self.get_instructions(joined)
+        self.inst_sprite.set_text('small', inst_text, inst_color,
+                                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
+        self.count_sprite.set_text('small', f"Spelare: {joined}/{len(players)}", COLORS['white'],
+                                   (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
+        
+        for player in players:
+            slot_sprite = self.slot_sprites[player.id]
+            if not player.joined or player.alive:
+                slot_sprite.sync(player, show_choice=False, show_controls=False)
+            else:
+                slot_sprite.hide()
+    
     def draw(self, players: List[Player]):
         """Draw the menu scene."""
         self.draw_background()
         
         # Title
-        title = font_large().render("STEN SAX PÅSE", True, COLORS['gold'])
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
-        self.screen.blit(title, title_rect)
-        
-        subtitle = font_medium().render("ARENA", True, COLORS['cyan'])
-        sub_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
-        self.screen.blit(subtitle, sub_rect)
+        blit_text(self.screen, 'large', "STEN SAX PÅSE", COLORS['gold'],
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
+        blit_text(self.screen, 'medium', "ARENA", COLORS['cyan'],
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
         
         # Instructions
         joined = get_joined_count(players)
-        if joined < 2:
-            inst_text = f"Behöver {2 - joined} spelare till för att starta"
-            inst_color = COLORS['orange']
-        else:
-            inst_text = "Tryck MELLANSLAG för att starta!"
-            inst_color = COLORS['green']
-        
-        inst = font_small().render(inst_text, True, inst_color)
-        inst_rect = inst.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
-        self.screen.blit(inst, inst_rect)
+        inst_text, inst_color = self.get_instructions(joined)
+        blit_text(self.screen, 'small', inst_text, inst_color,
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
         
         # Player count
-        count_text = font_small().render(f"Spelare: {joined}/8", True, COLORS['white'])
-        count_rect = count_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
-        self.screen.blit(count_text, count_rect)
+        blit_text(self.screen, 'small', f"Spelare: {joined}/{len(players)}", COLORS['white'],
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
         
         # Draw player slots (only show players who haven't joined yet or are still alive)
         for player in players:
@@ -0,0 +1,53 @@
+"""
+Lazily built scenes for Rock Paper Scissors Arena.
+"""
+
+import importlib
+from typing import Callable, List, Optional, Type
+
+from core.enums import SceneType
+from scenes.base import Scene
+
+# Scene type -> (module, class), in the order idle time builds them
+SCENE_CLASSES = {
+    SceneType.MENU: ('scenes.menu', 'MenuScene'),
+    SceneType.GAME: ('scenes.game_scene', 'GameScene'),
+    SceneType.RESOLUTION: ('scenes.resolution', 'ResolutionScene'),
+    SceneType.VICTORY: ('scenes.victory', 'VictoryScene'),
+}
+
+
+def load_scene_class(scene_type: SceneType) -> Type[Scene]:
+    """Import the module of a scene type and get its class."""
+    module, name = SCENE_CLASSES[scene_type]
+    return getattr(importlib.import_module(module), name)
+
+
+class SceneRegistry(dict):
+    """
+    Scenes by SceneType, built on first use.
+    Iterating covers only the scenes built so far; indexing a missing scene
+    imports and builds it with the factory.
+    """
+    
+    def __init__(self, factory: Callable[[SceneType], Scene]):
+        super().__init__()
+        self._factory = factory
+    
+    def __missing__(self, scene_type: SceneType) -> Scene:
+        scene = self._factory(scene_type)
+        self[scene_type] = scene
+        return scene
+    
+    @property
+    def pending(self) -> List[SceneType]:
+        """Scene types not built yet."""
+        return [scene_type for scene_type in SCENE_CLASSES if scene_type not in self]
+    
+    def build_next(self) -> Optional[SceneType]:
+        """Build one pending scene (e.g. while the menu is idle); returns its type."""
+        for scene_type in SCENE_CLASSES:
+            if scene_type not in self:
+                self[scene_type] = self._factory(scene_type)
+                return scene_type
+        return None
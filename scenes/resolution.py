@@ -4,105 +4,70 @@ Resolution scene for Rock Paper Scissors Arena.
 
 import pygame
 import math
-import random
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Set, Tuple
 
 from scenes.base import Scene
+from core.clock import SimulationClock
 from core.enums import SceneType, Choice
 from core.player import Player
-from core.rules import get_alive_count
+from core.rules import RoundResult, get_alive_count
+from core.variants import RuleVariant, get_variant
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, ANIMATION_DURATION
 from config.colors import COLORS
-from graphics.fonts import font_large, font_medium, font_small
+from graphics.fonts import blit_text
 from graphics.icons import draw_choice_icon
+from graphics.particles import ParticleSystem
 from graphics.player_slot import draw_player_slot
 
 
 class ResolutionScene(Scene):
     """Resolution scene showing round results with battle animation."""
     
-    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface):
-        super().__init__(screen, bg_surface)
-        self.eliminated_this_round: List[Player] = []
-        self.winners: List[Player] = []
-        self.losers: List[Player] = []
-        self.neutrals: List[Player] = []  # Players who picked the third choice
-        self.non_choosers: List[Player] = []  # Players who didn't choose
+    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface,
+                 clock: SimulationClock):
+        super().__init__(screen, bg_surface, clock)
+        self.result: Optional[RoundResult] = None
+        self.eliminated_this_round: Sequence[Player] = ()
+        self.winners: Sequence[Player] = ()
+        self.losers: Sequence[Player] = ()
+        self.neutrals: Sequence[Player] = ()  # Players whose choice neither won nor lost
+        self.non_choosers: Sequence[Player] = ()  # Players who didn't choose
         self.battle_pairs: List[Tuple[Player, Player]] = []  # (winner, loser) pairs
-        self.animation_start = 0
+        self.animation_start = 0.0  # Simulation time (seconds) when the animation started
         self.animation_duration = ANIMATION_DURATION
         self.winning_choice: Optional[Choice] = None
         self.losing_choice: Optional[Choice] = None
         self.is_majority_rule: bool = False
         self.is_no_choice: bool = False  # True when eliminating non-choosers
-        self.particles: List[dict] = []
-        self.impact_triggered: List[int] = []  # Track which pairs have triggered impact
+        self.particles = ParticleSystem(gravity=500, decay=1.2)
+        self.impact_triggered: Set[int] = set()  # Battle pairs whose impact has fired
     
-    def set_eliminated(self, eliminated: List[Player]):
-        """Set the list of eliminated players for display."""
-        self.eliminated_this_round = eliminated
-        self.animation_start = pygame.time.get_ticks()
-        self.particles = []
-        self.impact_triggered = []
+    def set_result(self, result: RoundResult):
+        """Show a judged round: its groups, battle pairs and eliminations."""
+        self.result = result
+        self.winning_choice = result.winning_choice
+        self.losing_choice = result.losing_choice
+        self.is_majority_rule = result.is_majority
+        self.is_no_choice = result.is_no_choice
+        self.winners = result.winners
+        self.losers = result.losers
+        self.neutrals = result.neutrals if result.is_majority else ()
+        self.non_choosers = result.non_choosers if result.is_no_choice else ()
+        # Each winner attacks EVERY player it eliminates
+        self.battle_pairs = result.battle_pairs
+        self.eliminated_this_round = result.eliminated
+        self.animation_start = self.clock.now
+        self.particles.clear()
+        self.impact_triggered.clear()
     
-    def set_battle_choices(self, winning: Choice, losing: Choice, is_majority: bool = False):
-        """Set the winning and losing choices for the animation."""
-        self.winning_choice = winning
-        self.losing_choice = losing
-        self.is_majority_rule = is_majority
-        self.is_no_choice = False
-        self.non_choosers = []
-    
-    def set_no_choice_battle(self, choosers: List[Player], non_choosers: List[Player]):
-        """Set up battle where choosers defeat non-choosers."""
-        self.is_no_choice = True
-        self.is_majority_rule = False
-        self.winning_choice = None
-        self.losing_choice = None
-        self.winners = choosers
-        self.losers = []
-        self.non_choosers = non_choosers
-        self.neutrals = []
-        self.battle_pairs = []
-        
-        # Each chooser attacks EVERY non-chooser
-        if choosers and non_choosers:
-            for chooser in choosers:
-                for non_chooser in non_choosers:
-                    self.battle_pairs.append((chooser, non_chooser))
-    
-    def set_battle_players(self, players: List[Player]):
-        """Determine winners, losers, and neutrals, and pair them up for animation."""
-        self.winners = []
-        self.losers = []
-        self.neutrals = []
-        self.non_choosers = []
-        self.battle_pairs = []
-        self.is_no_choice = False
-        
-        if not self.winning_choice or not self.losing_choice:
-            return
-        
-        # Find all winners, losers, and neutrals
-        for p in players:
-            if p.joined and p.choice != Choice.NONE:
-                if p.choice == self.winning_choice:
-                    self.winners.append(p)
-                elif p.choice == self.losing_choice:
-                    self.losers.append(p)
-                else:
-                    # Third choice (neutral in majority rule)
-                    self.neutrals.append(p)
-        
-        # Pair up winners with losers (each winner attacks ALL losers)
-        if self.winners and self.losers:
-            for winner in self.winners:
-                for loser in self.losers:
-                    self.battle_pairs.append((winner, loser))
-    
-    def get_animation_progress(self) -> float:
-        """Get animation progress from 0.0 to 1.0."""
-        elapsed = (pygame.time.get_ticks() - self.animation_start) / 1000
+    def get_animation_progress(self, now: Optional[float] = None) -> float:
+        """
+        Get animation progress from 0.0 to 1.0.
+        Uses simulation time unless a time (e.g. the render time) is given.
+        """
+        if now is None:
+            now = self.clock.now
+        elapsed = now - self.animation_start
         return min(1.0, elapsed / self.animation_duration)
     
     def is_animation_complete(self) -> bool:
@@ -111,58 +76,36 @@ class ResolutionScene(Scene):
     
     def spawn_impact_particles(self, x: int, y: int, color: Tuple[int, int, int]):
         """Spawn particles at impact point."""
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(150, 400)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 1.0,
-                'color': color,
-                'size': random.randint(5, 15)
-            })
+        self.particles.spawn_burst(x, y, color, count=20, speed=(150, 400), size=(5, 15))
     
     def update_particles(self, dt: float):
         """Update particle positions and lifetimes."""
-        for p in self.particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += 500 * dt  # gravity
-            p['life'] -= dt * 1.2
-        self.particles = [p for p in self.particles if p['life'] > 0]
+        self.particles.update(dt)
     
     def draw_particles(self):
-        """Draw all active particles."""
-        for p in self.particles:
-            alpha = int(255 * p['life'])
-            color = (*p['color'][:3], alpha)
-            size = int(p['size'] * p['life'])
-            if size > 0:
-                surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, color, (size, size), size)
-                self.screen.blit(surf, (int(p['x'] - size), int(p['y'] - size)))
+        """Draw all active particles, extrapolated to the render time."""
+        self.particles.draw(self.screen, self.clock.render_time - self.clock.now)
+    
+    def get_variant(self) -> RuleVariant:
+        """Get the variant the shown round was judged with."""
+        return self.result.variant if self.result is not None else get_variant()
     
     def get_battle_verb(self) -> str:
-        """Get the action verb for the winning choice."""
-        if self.winning_choice == Choice.ROCK:
-            return "KROSSAR"
-        elif self.winning_choice == Choice.SCISSORS:
-            return "KLIPPER"
-        elif self.winning_choice == Choice.PAPER:
-            return "TÄCKER"
-        return "SLÅR"
+        """Get the action verb for the winning choice (the variant's fallback if the pairs disagree)."""
+        variant = self.get_variant()
+        if self.result is None:
+            return variant.verb(self.winning_choice, self.losing_choice)
+        verbs = {variant.verb(winner, loser) for winner in self.result.winning_choices
+                 for loser in self.result.losing_choices if loser in variant.beats[winner]}
+        return verbs.pop() if len(verbs) == 1 else variant.default_verb
     
     def get_choice_name_swedish(self, choice: Choice) -> str:
         """Get Swedish name for a choice."""
-        if choice == Choice.ROCK:
-            return "STEN"
-        elif choice == Choice.PAPER:
-            return "PÅSE"
-        elif choice == Choice.SCISSORS:
-            return "SAX"
-        return ""
+        return self.get_variant().label(choice)
+    
+    def get_choices_name_swedish(self, choices: Sequence[Choice]) -> str:
+        """Get Swedish names for choices, e.g. "SAX OCH ÖDLA"."""
+        return " OCH ".join(self.get_choice_name_swedish(choice) for choice in choices)
     
     def handle_event(self, event: pygame.event.Event, players: List[Player]) -> Optional[SceneType]:
         """Handle resolution input events."""
@@ -179,19 +122,18 @@ class ResolutionScene(Scene):
         
         return None
     
-    def update(self, players: List[Player]) -> Optional[SceneType]:
+    def update(self, players: List[Player], dt: float) -> Optional[SceneType]:
         """Update resolution state."""
-        dt = 1 / 60  # Assume 60 FPS
         self.update_particles(dt)
         
         # Check for impact moments and spawn particles
         progress = self.get_animation_progress()
         impact_time = 0.5  # When impact happens
         
-        if progress >= impact_time:
+        if progress >= impact_time and len(self.impact_triggered) < len(self.battle_pairs):
             for i, (winner, loser) in enumerate(self.battle_pairs):
                 if i not in self.impact_triggered:
-                    self.impact_triggered.append(i)
+                    self.impact_triggered.add(i)
                     # Spawn particles at loser's position
                     self.spawn_impact_particles(
                         loser.position[0],
@@ -203,7 +145,7 @@ class ResolutionScene(Scene):
     
     def draw_battle_animation(self, players: List[Player]):
         """Draw the battle animation with icons traveling between players."""
-        progress = self.get_animation_progress()
+        progress = self.get_animation_progress(self.clock.render_time)
         
         # Animation phases:
         # 0.0-0.5: Winner icons travel from their position to loser positions
@@ -269,43 +211,25 @@ class ResolutionScene(Scene):
             
             if self.is_no_choice:
                 # "TOO SLOW!" text for non-choosers
-                header_text = font_large().render("FÖR LÅNGSAM!", True, COLORS['red'])
-                header_shadow = font_large().render("FÖR LÅNGSAM!", True, (0, 0, 0))
-                
-                header_rect = header_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-                shadow_rect = header_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 4, SCREEN_HEIGHT // 2 - 36))
-                
-                header_shadow.set_alpha(text_alpha)
-                header_text.set_alpha(text_alpha)
-                
-                self.screen.blit(header_shadow, shadow_rect)
-                self.screen.blit(header_text, header_rect)
+                blit_text(self.screen, 'large', "FÖR LÅNGSAM!", COLORS['red'],
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40),
+                          shadow=(0, 0, 0), shadow_offset=(4, 4), alpha=text_alpha)
                 
                 # Explanation
-                explain_text = font_medium().render("Valde inte = Eliminerad!", True, COLORS['orange'])
-                explain_rect = explain_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-                explain_text.set_alpha(text_alpha)
-                self.screen.blit(explain_text, explain_rect)
+                blit_text(self.screen, 'medium', "Valde inte = Eliminerad!", COLORS['orange'],
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20), alpha=text_alpha)
                 
             elif self.winning_choice and self.losing_choice:
                 verb = self.get_battle_verb()
-                winner_name = self.get_choice_name_swedish(self.winning_choice)
-                loser_name = self.get_choice_name_swedish(self.losing_choice)
+                winner_name = self.get_choices_name_swedish(self.result.winning_choices)
+                loser_name = self.get_choices_name_swedish(self.result.losing_choices)
                 
                 # Different text for majority rule
                 if self.is_majority_rule:
                     # "MAJORITY RULES!" header
-                    majority_text = font_large().render("MAJORITET VINNER!", True, COLORS['purple'])
-                    majority_shadow = font_large().render("MAJORITET VINNER!", True, (0, 0, 0))
-                    
-                    majority_rect = majority_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
-                    shadow_rect = majority_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 4, SCREEN_HEIGHT // 2 - 56))
-                    
-                    majority_shadow.set_alpha(text_alpha)
-                    majority_text.set_alpha(text_alpha)
-                    
-                    self.screen.blit(majority_shadow, shadow_rect)
-                    self.screen.blit(majority_text, majority_rect)
+                    blit_text(self.screen, 'large', "MAJORITET VINNER!", COLORS['purple'],
+                              (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60),
+                              shadow=(0, 0, 0), shadow_offset=(4, 4), alpha=text_alpha)
                     
                     # Count text
                     winner_count = len(self.winners)
@@ -313,42 +237,24 @@ class ResolutionScene(Scene):
                     loser_count = len(self.losers)
                     
                     count_str = f"{winner_name}: {winner_count}  vs  Andra: {neutral_count + loser_count}"
-                    count_text = font_small().render(count_str, True, COLORS['silver'])
-                    count_rect = count_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 10))
-                    count_text.set_alpha(text_alpha)
-                    self.screen.blit(count_text, count_rect)
+                    blit_text(self.screen, 'small', count_str, COLORS['silver'],
+                              (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 10), alpha=text_alpha)
                     
                     # Result text (smaller, below)
-                    result_text = font_medium().render(f"{winner_name} {verb} {loser_name}!", True, COLORS['gold'])
-                    result_shadow = font_medium().render(f"{winner_name} {verb} {loser_name}!", True, (0, 0, 0))
-                    
-                    result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 35))
-                    result_shadow_rect = result_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 3, SCREEN_HEIGHT // 2 + 38))
-                    
-                    result_shadow.set_alpha(text_alpha)
-                    result_text.set_alpha(text_alpha)
-                    
-                    self.screen.blit(result_shadow, result_shadow_rect)
-                    self.screen.blit(result_text, result_rect)
+                    blit_text(self.screen, 'medium', f"{winner_name} {verb} {loser_name}!", COLORS['gold'],
+                              (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 35),
+                              shadow=(0, 0, 0), shadow_offset=(3, 3), alpha=text_alpha)
                 else:
                     # Standard text
-                    result_text = font_medium().render(f"{winner_name} {verb} {loser_name}!", True, COLORS['gold'])
-                    shadow_text = font_medium().render(f"{winner_name} {verb} {loser_name}!", True, (0, 0, 0))
-                    
-                    result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                    shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 3, SCREEN_HEIGHT // 2 + 3))
-                    
-                    shadow_text.set_alpha(text_alpha)
-                    result_text.set_alpha(text_alpha)
-                    
-                    self.screen.blit(shadow_text, shadow_rect)
-                    self.screen.blit(result_text, result_rect)
+                    blit_text(self.screen, 'medium', f"{winner_name} {verb} {loser_name}!", COLORS['gold'],
+                              (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
+                              shadow=(0, 0, 0), shadow_offset=(3, 3), alpha=text_alpha)
     
     def draw(self, players: List[Player]):
         """Draw the resolution scene."""
         self.draw_background()
         
-        progress = self.get_animation_progress()
+        progress = self.get_animation_progress(self.clock.render_time)
         
         # Draw player slots - only show players who are:
         # - Still alive (survived this round), OR
@@ -385,23 +291,17 @@ class ResolutionScene(Scene):
         elif not self.winning_choice and not self.is_no_choice:
             # Draw "DRAW" text for ties (but not for no-choice situations)
             if progress > 0.3:
-                # Shadow
-                shadow = font_large().render("OAVGJORT!", True, (0, 0, 0))
-                shadow_rect = shadow.get_rect(center=(SCREEN_WIDTH // 2 + 4, SCREEN_HEIGHT // 2 - 46))
-                self.screen.blit(shadow, shadow_rect)
-                
-                draw_text = font_large().render("OAVGJORT!", True, COLORS['cyan'])
-                draw_rect = draw_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-                self.screen.blit(draw_text, draw_rect)
+                # Title with drop shadow
+                blit_text(self.screen, 'large', "OAVGJORT!", COLORS['cyan'],
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50),
+                          shadow=(0, 0, 0), shadow_offset=(4, 4))
                 
-                no_elim = font_medium().render("Inga elimineringar", True, COLORS['silver'])
-                no_elim_rect = no_elim.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-                self.screen.blit(no_elim, no_elim_rect)
+                blit_text(self.screen, 'medium', "Inga elimineringar", COLORS['silver'],
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
                 
                 # Explain why it's a draw
-                explain = font_small().render("(Ingen majoritet - alla val lika)", True, COLORS['silver'])
-                explain_rect = explain.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-                self.screen.blit(explain, explain_rect)
+                blit_text(self.screen, 'small', "(Ingen majoritet - alla val lika)", COLORS['silver'],
+                          (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         
         # Show elimination status after animation
         if self.is_animation_complete():
@@ -409,9 +309,8 @@ class ResolutionScene(Scene):
             
             if self.eliminated_this_round:
                 elim_names = ", ".join([f"S{p.id}" for p in self.eliminated_this_round])
-                elim_text = font_small().render(f"Eliminerade: {elim_names}", True, COLORS['red'])
-                elim_rect = elim_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                self.screen.blit(elim_text, elim_rect)
+                blit_text(self.screen, 'small', f"Eliminerade: {elim_names}", COLORS['red'],
+                          (SCREEN_WIDTH // 2, y_offset))
             
             # Continue prompt
             alive = get_alive_count(players)
@@ -419,6 +318,5 @@ class ResolutionScene(Scene):
                 cont_text = "Tryck MELLANSLAG för att se vinnaren!"
             else:
                 cont_text = f"Tryck MELLANSLAG för att fortsätta ({alive} spelare kvar)"
-            cont = font_small().render(cont_text, True, COLORS['green'])
-            cont_rect = cont.get_rect(center=(SCREEN_WIDTH // 2, y_offset + 40))
-            self.screen.blit(cont, cont_rect)
+            blit_text(self.screen, 'small', cont_text, COLORS['green'],
+                      (SCREEN_WIDTH // 2, y_offset + 40))
@@ -3,28 +3,55 @@ Victory scene for Rock Paper Scissors Arena.
 """
 
 import pygame
-import math
 from typing import List, Optional
 
 from scenes.base import Scene
+from core.clock import SimulationClock
 from core.enums import SceneType
 from core.player import Player
 from core.rules import get_winner
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from config.colors import COLORS, PLAYER_COLORS
-from graphics.fonts import font_large, font_medium
+from graphics.fonts import blit_text
+from graphics.particles import ParticleSystem
 
 
 class VictoryScene(Scene):
     """Victory scene celebrating the winner."""
     
-    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface):
-        super().__init__(screen, bg_surface)
+    def __init__(self, screen: pygame.Surface, bg_surface: pygame.Surface,
+                 clock: SimulationClock):
+        super().__init__(screen, bg_surface, clock)
         self.winner: Optional[Player] = None
+        self.confetti = ParticleSystem(gravity=120, decay=0.25)
+        self.confetti_rate = 90  # particles per second
+        self._confetti_debt = 0.0
     
     def set_winner(self, players: List[Player]):
         """Find and set the winner from the player list."""
         self.winner = get_winner(players)
+        self.confetti.clear()
+        self._confetti_debt = 0.0
+        if self.winner:
+            # Opening burst in the winner's color
+            self.confetti.spawn_burst(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20, self.winner.color,
+                                      count=120, speed=(200, 600), size=(4, 10))
+    
+    def spawn_confetti(self, dt: float):
+        """Rain confetti in player colors from the top edge."""
+        self._confetti_debt += self.confetti_rate * dt
+        count = int(self._confetti_debt)
+        if count <= 0:
+            return
+        self._confetti_debt -= count
+        
+        rng = self.confetti.rng
+        colors = rng.integers(0, len(PLAYER_COLORS), count)
+        for color_index in set(colors.tolist()):
+            n = int((colors == color_index).sum())
+            self.confetti.spawn(rng.uniform(0, SCREEN_WIDTH, n), rng.uniform(-20, 0, n),
+                                rng.uniform(-60, 60, n), rng.uniform(40, 160, n),
+                                rng.integers(4, 9, n), PLAYER_COLORS[color_index])
     
     def handle_event(self, event: pygame.event.Event, players: List[Player]) -> Optional[SceneType]:
         """Handle victory input events."""
@@ -36,43 +63,36 @@ class VictoryScene(Scene):
         
         return None
     
-    def update(self, players: List[Player]) -> Optional[SceneType]:
-        """Update victory state (nothing to update)."""
+    def update(self, players: List[Player], dt: float) -> Optional[SceneType]:
+        """Update victory confetti."""
+        self.spawn_confetti(dt)
+        self.confetti.update(dt)
         return None
     
     def draw(self, players: List[Player]):
         """Draw the victory scene."""
         self.draw_background()
         
-        # Animated background particles
-        time = pygame.time.get_ticks() / 1000
-        for i in range(20):
-            px = (SCREEN_WIDTH // 2 + math.sin(time * 2 + i) * (200 + i * 20)) % SCREEN_WIDTH
-            py = (SCREEN_HEIGHT // 2 + math.cos(time * 2 + i * 0.5) * (150 + i * 15)) % SCREEN_HEIGHT
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            pygame.draw.circle(self.screen, color, (int(px), int(py)), 5 + i % 5)
+        # Animated background confetti
+        self.confetti.draw(self.screen, self.clock.render_time - self.clock.now)
         
         if self.winner:
             # Winner announcement
-            winner_text = font_large().render(f"SPELARE {self.winner.id} VINNER!", True, self.winner.color)
-            winner_rect = winner_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-            self.screen.blit(winner_text, winner_rect)
+            blit_text(self.screen, 'large', f"SPELARE {self.winner.id} VINNER!", self.winner.color,
+                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
             
             # Trophy/celebration
-            trophy_text = font_large().render("🏆", True, COLORS['gold'])
-            trophy_rect = trophy_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            self.screen.blit(trophy_text, trophy_rect)
+            blit_text(self.screen, 'large', "🏆", COLORS['gold'],
+                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
             
             # Draw large player icon
             pygame.draw.circle(self.screen, self.winner.color, 
                              (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20), 80, 8)
         else:
             # No winner (everyone eliminated somehow)
-            draw_text = font_large().render("INGEN VINNER!", True, COLORS['red'])
-            draw_rect = draw_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            self.screen.blit(draw_text, draw_rect)
+            blit_text(self.screen, 'large', "INGEN VINNER!", COLORS['red'],
+                      (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         
         # Restart prompt
-        restart = font_medium().render("Tryck MELLANSLAG för nytt spel", True, COLORS['white'])
-        restart_rect = restart.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
-        self.screen.blit(restart, restart_rect)
+        blit_text(self.screen, 'medium', "Tryck MELLANSLAG för nytt spel", COLORS['white'],
+                  (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Rock Paper Scissors Arena - Tournament Simulator
+
+Plays complete games headlessly with scripted strategies across a process
+pool and reports expected rounds, draw probability, survival curves and
+games per hour for each table size.
+
+Usage:
+    python simulate.py [--seats 2 4 8] [--games N] [--strategy NAME] [--variant NAME] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from config.settings import COUNTDOWN_DURATION, RULE_VARIANT
+from core.simulation import STRATEGIES, run_tournament
+from core.variants import VARIANTS
+
+
+def format_table(results: dict) -> str:
+    """Format the per-seat-count summaries as a text table."""
+    lines = [f"{'seats':>5} {'games':>8} {'rounds':>7} {'P(draw)':>8} "
+             f"{'game s':>7} {'games/h':>8}  survival after 1..5 rounds"]
+    for seats, summary in results.items():
+        survival = ' '.join(f"{p:.2f}" for p in summary['survival'][1:6])
+        lines.append(f"{seats:>5} {summary['games']:>8} {summary['expected_rounds']:>7.2f} "
+                     f"{summary['draw_probability']:>8.3f} {summary['mean_game_seconds']:>7.1f} "
+                     f"{summary['games_per_hour']:>8.1f}  {survival}")
+    return '\n'.join(lines)
+
+
+def main():
+    """Run the simulation and print or write the report."""
+    parser = argparse.ArgumentParser(description="Multi-process full-tournament simulator")
+    parser.add_argument('--seats', type=int, nargs='+', default=list(range(2, 9)),
+                        help="table sizes to simulate")
+    parser.add_argument('--games', type=int, default=10000, help="games per table size")
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default='uniform',
+                        help="how simulated players choose")
+    parser.add_argument('--variant', choices=sorted(VARIANTS), default=RULE_VARIANT,
+                        help="rule variant")
+    parser.add_argument('--seed', type=int, default=0, help="base seed (runs reproduce exactly)")
+    parser.add_argument('--reaction', type=float, default=1.5,
+                        help="median seconds a player takes to choose")
+    parser.add_argument('--countdown', type=float, default=COUNTDOWN_DURATION,
+                        help="round countdown in seconds")
+    parser.add_argument('--continue-delay', type=float, default=2.0,
+                        help="seconds between the battle animation and the next round")
+    parser.add_argument('--game-overhead', type=float, default=20.0,
+                        help="seconds per game spent joining and on the victory screen")
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--json', metavar='PATH', help="also write the full report as JSON")
+    args = parser.parse_args()
+    
+    results = run_tournament(args.seats, args.games, seed=args.seed, strategy=args.strategy,
+                             variant=args.variant, reaction=args.reaction, countdown=args.countdown,
+                             continue_delay=args.continue_delay,
+                             game_overhead=args.game_overhead, workers=args.workers)
+    sys.stdout.write(format_table(results) + '\n')
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'config': vars(args), 'results': results}, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == "__main__":
+    main()
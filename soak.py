@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Rock Paper Scissors Arena - Soak Test
+
+Fills every seat with a scripted bot and plays thousands of games through
+the real Game loop (menu -> game -> resolution -> victory) on the SDL dummy
+video driver. Bots post KEYDOWN events after reaction times drawn from a
+configurable distribution, so input goes through the same event path as a
+keyboard.
+
+Every few games the run samples process RSS, Python object counts, live
+surfaces, cache and particle buffer sizes and frame times. The report shows
+how each of them changed between the first and the last sample. Growth is
+judged only after a warm-up share of the run, while caches and allocator
+pools fill, and a bounded cache that stays within its capacity is never
+flagged. Steady growth or frame-time drift is flagged, and the exit status is
+1 when anything was flagged.
+
+Usage:
+    python soak.py [--games N] [--reaction SECONDS] [--distribution NAME] [--output soak.json]
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from config.settings import ANIMATION_DURATION, ICON_CACHE_BUDGET, SEAT_COUNT, TEXT_CACHE_SIZE
+from core.clock import FastClock
+from core.enums import SceneType
+from core.player import Player
+from diagnostics.profiler import summarize
+from game import Game
+from graphics.fonts import get_text_cache_stats
+from graphics.icons import icon_atlas
+from graphics.player_slot import get_slot_cache_stats
+
+REACTION_DISTRIBUTIONS = ('lognormal', 'uniform', 'fixed')
+
+# Metrics compared between the first and last samples; 'loose_surfaces'
+# counts the live surfaces not held by one of the bounded caches below
+TRACKED_METRICS = ['rss_mb', 'objects', 'loose_surfaces', 'particles', 'particle_palette',
+                   'impact_triggered', 'confetti', 'text_cache', 'slot_cache', 'icon_bytes']
+
+# Bounded caches: growth up to the capacity is the cache filling, not a leak.
+# A slot sprite is kept per seat for each show_choice/show_controls pair.
+CACHE_CAPACITY = {
+    'text_cache': TEXT_CACHE_SIZE,
+    'slot_cache': SEAT_COUNT * 4,
+    'icon_bytes': ICON_CACHE_BUDGET,
+}
+
+# Share of the samples treated as warm-up and left out of the growth check
+WARMUP_SHARE = 0.5
+# A metric is flagged when it rose between this share of consecutive samples
+GROWTH_SHARE = 0.75
+# Frame time is flagged when the last sample's mean is this much above the first's
+DRIFT_LIMIT = 0.10
+
+
+def sample_reaction(rng: random.Random, distribution: str, median: float, spread: float) -> float:
+    """Draw a reaction time in seconds."""
+    if distribution == 'lognormal':
+        return rng.lognormvariate(math.log(median), spread)
+    if distribution == 'uniform':
+        return rng.uniform(median * (1 - spread), median * (1 + spread))
+    if distribution == 'fixed':
+        return median
+    raise ValueError(f"Unknown reaction distribution: {distribution}")
+
+
+def read_rss() -> int:
+    """Get the process's resident set size in bytes (peak size where /proc is missing)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def count_surfaces(objects: list) -> int:
+    """
+    Count live surfaces referenced from the given objects.
+    Surfaces aren't tracked by the garbage collector, so they are found
+    through the containers and objects that hold them.
+    """
+    seen = set()
+    for obj in objects:
+        for referent in gc.get_referents(obj):
+            if isinstance(referent, pygame.Surface):
+                seen.add(id(referent))
+    return len(seen)
+
+
+class Bot:
+    """Plays one seat by pressing its keys after sampled reaction times."""
+    
+    def __init__(self, player: Player, rng: random.Random, distribution: str,
+                 median: float, spread: float, miss_rate: float):
+        self.player = player
+        self.rng = rng
+        self.distribution = distribution
+        self.median = median
+        self.spread = spread
+        self.miss_rate = miss_rate
+        self.press_at: Optional[float] = None  # Scene time of the next press
+        self.key: Optional[int] = None
+    
+    @property
+    def has_keys(self) -> bool:
+        return self.player.rock_key is not None
+    
+    def plan_join(self):
+        """Join shortly after the menu appears."""
+        self.key = self.player.rock_key
+        self.press_at = sample_reaction(self.rng, self.distribution, self.median, self.spread) / 2
+    
+    def plan_round(self):
+        """Pick a key and a reaction time for the round that just started."""
+        self.press_at = None
+        if not self.player.alive or self.rng.random() < self.miss_rate:
+            return
+        player = self.player
+        self.key = self.rng.choice((player.rock_key, player.paper_key, player.scissors_key))
+        self.press_at = sample_reaction(self.rng, self.distribution, self.median, self.spread)
+    
+    def press(self, scene_time: float):
+        """Post the planned key press once its time has come."""
+        if self.press_at is not None and scene_time >= self.press_at:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=self.key, mod=0))
+            self.press_at = None
+
+
+class Soak:
+    """Runs bot games through a headless Game and samples resource use."""
+    
+    def __init__(self, seats: int = SEAT_COUNT, seed: int = 0, distribution: str = 'lognormal',
+                 reaction: float = 1.5, spread: float = 0.5, miss_rate: float = 0.02,
+                 continue_delay: float = 1.0, render: bool = True):
+        self.game = Game(seat_count=seats, seed=seed, frame_clock=FastClock(), asset_pack=False)
+        self.game.render_enabled = render
+        self.bots = [Bot(player, random.Random(seed * 1000 + i), distribution, reaction, spread, miss_rate)
+                     for i, player in enumerate(self.game.players)]
+        self.bots = [bot for bot in self.bots if bot.has_keys]
+        self.continue_delay = continue_delay
+        self.games = 0
+        self.scene: Optional[SceneType] = None
+        self.space_pressed = False
+        self.frame_ms: List[float] = []  # Frame times since the last sample
+        self.samples: List[dict] = []
+        self.first_types: Optional[Counter] = None
+        self.last_types: Optional[Counter] = None
+        self.start = time.perf_counter()
+    
+    def scene_time(self) -> float:
+        """Simulation seconds since the current scene started."""
+        clock = self.game.sim_clock
+        return (clock.steps - self.game.scene_start_step) * clock.dt
+    
+    def press_space(self):
+        if not self.space_pressed:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0))
+            self.space_pressed = True
+    
+    def drive(self):
+        """Post the bots' key presses for the coming frame."""
+        game = self.game
+        scene = game.current_scene_type
+        if scene != self.scene:
+            if scene == SceneType.MENU and self.scene == SceneType.VICTORY:
+                self.games += 1
+            self.scene = scene
+            self.space_pressed = False
+            for bot in self.bots:
+                if scene == SceneType.MENU:
+                    bot.plan_join()
+                elif scene == SceneType.GAME:
+                    bot.plan_round()
+        
+        now = self.scene_time()
+        if scene in (SceneType.MENU, SceneType.GAME):
+            for bot in self.bots:
+                bot.press(now)
+            if scene == SceneType.MENU and all(bot.press_at is None for bot in self.bots):
+                self.press_space()
+        elif scene == SceneType.RESOLUTION:
+            if now >= ANIMATION_DURATION + self.continue_delay:
+                self.press_space()
+        elif scene == SceneType.VICTORY:
+            if now >= self.continue_delay * 3:
+                self.press_space()
+    
+    def run(self, games: int, sample_every: int, progress: bool = True) -> List[dict]:
+        """Play games, sampling every sample_every finished games."""
+        game = self.game
+        clock = time.perf_counter
+        self.take_sample()
+        last_sampled = 0
+        while game.running and self.games < games:
+            self.drive()
+            start = clock()
+            game.run_frame()
+            self.frame_ms.append((clock() - start) * 1000)
+            if self.games - last_sampled >= sample_every:
+                last_sampled = self.games
+                sample = self.take_sample()
+                if progress:
+                    sys.stderr.write(format_sample(sample) + '\n')
+        game.shutdown()
+        return self.samples
+    
+    def take_sample(self) -> dict:
+        """Record resource use and frame times since the previous sample."""
+        game = self.game
+        gc.collect()
+        objects = gc.get_objects()
+        types = Counter(type(obj).__name__ for obj in objects)
+        if len(self.samples) == 1:
+            # Baseline after the first interval, like growth()
+            self.first_types = types
+        self.last_types = types
+        
+        resolution = game.scenes.get(SceneType.RESOLUTION)
+        victory = game.scenes.get(SceneType.VICTORY)
+        sample = {
+            'games': self.games,
+            'frames': game.frames,
+            'sim_hours': game.sim_clock.now / 3600,
+            'wall_seconds': time.perf_counter() - self.start,
+            'rss_mb': read_rss() / 2 ** 20,
+            'objects': len(objects),
+            'surfaces': count_surfaces(objects),
+            'particles': resolution.particles.count if resolution else 0,
+            'particle_palette': len(resolution.particles.palette) if resolution else 0,
+            'impact_triggered': len(resolution.impact_triggered) if resolution else 0,
+            'confetti': victory.confetti.count if victory else 0,
+            'text_cache': get_text_cache_stats()['size'],
+            'slot_cache': get_slot_cache_stats()['size'],
+            'icon_atlas': icon_atlas.stats()['size'],
+            'icon_bytes': icon_atlas.stats()['used_bytes'],
+            'frame_ms': summarize(self.frame_ms),
+        }
+        sample['loose_surfaces'] = (sample['surfaces'] - sample['text_cache']
+                                    - sample['slot_cache'] - sample['icon_atlas'])
+        del objects
+        self.frame_ms = []
+        self.samples.append(sample)
+        return sample
+    
+    def growth(self) -> Dict[str, dict]:
+        """Compare the samples after warm-up; flag steady growth and frame-time drift."""
+        # The opening sample is taken before anything was drawn, and caches
+        # keep filling for a while after it, so judge only the later samples
+        samples = self.samples[1:]
+        samples = samples[min(int(len(samples) * WARMUP_SHARE), len(samples) - 2):]
+        report = {}
+        if len(samples) < 2:
+            return report
+        for metric in TRACKED_METRICS:
+            values = [sample[metric] for sample in samples]
+            rises = sum(b > a for a, b in zip(values, values[1:]))
+            growing = values[-1] > values[0] and rises >= GROWTH_SHARE * (len(values) - 1)
+            capacity = CACHE_CAPACITY.get(metric)
+            if capacity is not None:
+                growing = max(values) > capacity
+            report[metric] = {
+                'first': values[0],
+                'last': values[-1],
+                'max': max(values),
+                'growing': growing,
+            }
+        first, last = samples[0]['frame_ms']['mean'], samples[-1]['frame_ms']['mean']
+        drift = (last - first) / first if first else 0.0
+        report['frame_ms'] = {'first': first, 'last': last, 'drift': drift, 'growing': drift > DRIFT_LIMIT}
+        return report
+    
+    def type_growth(self, top: int = 10) -> List[tuple]:
+        """Object types whose instance count grew the most over the run."""
+        if self.first_types is None:
+            return []
+        delta = self.last_types.copy()
+        delta.subtract(self.first_types)
+        return [(name, count) for name, count in delta.most_common(top) if count > 0]
+
+
+def format_sample(sample: dict) -> str:
+    frame = sample['frame_ms']
+    return (f"{sample['games']:>6} {sample['sim_hours']:>7.2f} {sample['wall_seconds']:>7.0f} "
+            f"{sample['rss_mb']:>7.1f} {sample['objects']:>8} {sample['surfaces']:>6} "
+            f"{frame['mean']:>6.2f} {frame['p99']:>6.2f} {sample['particles']:>6} "
+            f"{sample['confetti']:>6} {sample['text_cache']:>5} {sample['slot_cache']:>5} "
+            f"{sample['icon_atlas']:>5}")
+
+
+SAMPLE_HEADER = (f"{'games':>6} {'sim h':>7} {'wall s':>7} {'RSS MB':>7} {'objects':>8} "
+                 f"{'surfs':>6} {'ms':>6} {'p99':>6} {'parts':>6} {'confet':>6} "
+                 f"{'text':>5} {'slots':>5} {'icons':>5}")
+
+
+def main():
+    """Run the soak test and print or write the report."""
+    parser = argparse.ArgumentParser(description="Bot-driven soak test for long-running tables")
+    parser.add_argument('--games', type=int, default=2000, help="games to play")
+    parser.add_argument('--seats', type=int, default=SEAT_COUNT, help="player seats (all get a bot)")
+    parser.add_argument('--seed', type=int, default=0, help="bot and effects seed")
+    parser.add_argument('--distribution', choices=REACTION_DISTRIBUTIONS, default='lognormal',
+                        help="how bot reaction times are drawn")
+    parser.add_argument('--reaction', type=float, default=1.5, help="median reaction time in seconds")
+    parser.add_argument('--spread', type=float, default=0.5,
+                        help="lognormal sigma, or the +/- fraction of the median for uniform")
+    parser.add_argument('--miss-rate', type=float, default=0.02,
+                        help="chance a bot sits out a round without choosing")
+    parser.add_argument('--continue-delay', type=float, default=1.0,
+                        help="seconds bots wait before continuing after a resolution")
+    parser.add_argument('--sample-every', type=int, default=50, help="games between samples")
+    parser.add_argument('--no-render', action='store_true',
+                        help="skip drawing (faster, but surface caches are not exercised)")
+    parser.add_argument('--output', help="also write the samples and growth report as JSON")
+    args = parser.parse_args()
+    
+    soak = Soak(args.seats, args.seed, args.distribution, args.reaction, args.spread,
+                args.miss_rate, args.continue_delay, render=not args.no_render)
+    sys.stderr.write(SAMPLE_HEADER + '\n')
+    soak.run(args.games, args.sample_every)
+    growth = soak.growth()
+    
+    lines = ["", f"{'metric':<18} {'first':>10} {'last':>10} {'max':>10}  growing"]
+    for metric, result in growth.items():
+        peak = result.get('max', result['last'])
+        lines.append(f"{metric:<18} {result['first']:>10.2f} {result['last']:>10.2f} "
+                     f"{peak:>10.2f}  {'YES' if result['growing'] else 'no'}")
+    types = soak.type_growth()
+    if types:
+        lines.append("object types that grew: " + ', '.join(f"{name} +{count}" for name, count in types))
+    sys.stdout.write('\n'.join(lines) + '\n')
+    
+    if args.output:
+        report = {
+            'config': vars(args),
+            'samples': soak.samples,
+            'growth': growth,
+            'type_growth': types,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if any(result['growing'] for result in growth.values()) else 0)
+
+
+if __name__ == "__main__":
+    main()